@@ -3,6 +3,7 @@ from accelbrainbase.controllable_model import ControllableModel
 from accelbrainbase._mxnet._exception.init_deferred_error import InitDeferredError
 from accelbrainbase.observabledata._mxnet.function_approximator import FunctionApproximator
 from accelbrainbase.samplabledata.policy_sampler import PolicySampler
+from accelbrainbase.samplabledata.replay_buffer import ReplayBuffer
 from accelbrainbase.computable_loss import ComputableLoss
 
 from mxnet.gluon.block import HybridBlock
@@ -11,6 +12,7 @@ from mxnet import autograd
 import numpy as np
 import mxnet as mx
 import mxnet.ndarray as nd
+from concurrent.futures import ThreadPoolExecutor
 
 from mxnet import MXNetError
 from logging import getLogger
@@ -51,6 +53,12 @@ class DQLController(HybridBlock, ControllableModel):
         ctx=mx.gpu(),
         initializer=None,
         recursive_learning_flag=False,
+        replay_buffer=None,
+        replay_n=1,
+        target_function_approximator=None,
+        target_update_interval=1,
+        target_update_rate=1.0,
+        async_target_flag=False,
         **kwargs
     ):
         '''
@@ -69,6 +77,24 @@ class DQLController(HybridBlock, ControllableModel):
             scale:                          `float` of scaling factor for initial parameters.
             ctx:                            `mx.cpu()` or `mx.gpu()`.
             initializer:                    is-a `mxnet.initializer` for parameters of model. If `None`, it is drawing from the Xavier distribution.
+            recursive_learning_flag:        `bool` of whether to update the state by the selected action in each step.
+            replay_buffer:                  is-a `ReplayBuffer`. If not `None`, the selected transitions are stored in 
+                                            this memory, and the function approximator is trained by the mini-batches 
+                                            drawn from it instead of the transitions just selected.
+            replay_n:                       `int` of the number of gradient updates by the mini-batches 
+                                            drawn from `replay_buffer` in each step.
+            target_function_approximator:   is-a `FunctionApproximator` which has the same architecture as 
+                                            `function_approximator`. If not `None`, the maximum Q-Values in 
+                                            next action time are inferenced by this frozen target network.
+            target_update_interval:         `int` of the number of steps between the updates of target network.
+            target_update_rate:             `float` of the rate of Polyak averaging in the updates of target network.
+                                            If `1.0`, the parameters are hard copied.
+            async_target_flag:              `bool`. If `True`, the possible actions and the target Q-Values 
+                                            in next step are computed in a background thread while the 
+                                            gradient step runs. In this case, the state is updated before 
+                                            the backward pass of the gradient step, but only if the loss is 
+                                            valid as in the serial mode, and the target Q-Values can be 
+                                            computed by the target network which is one step stale.
 
         '''
         if isinstance(function_approximator, FunctionApproximator) is False:
@@ -77,6 +103,20 @@ class DQLController(HybridBlock, ControllableModel):
             raise TypeError("The type of `policy_sampler` must be `PolicySampler`.")
         if isinstance(computable_loss, ComputableLoss) is False and isinstance(computable_loss, gluon.loss.Loss) is False:
             raise TypeError("The type of `computable_loss` must be `ComputableLoss` or `gluon.loss.Loss`.")
+        if isinstance(replay_buffer, ReplayBuffer) is False and replay_buffer is not None:
+            raise TypeError("The type of `replay_buffer` must be `ReplayBuffer`.")
+        if isinstance(target_function_approximator, FunctionApproximator) is False and target_function_approximator is not None:
+            raise TypeError("The type of `target_function_approximator` must be `FunctionApproximator`.")
+        if isinstance(target_update_interval, int) is False:
+            raise TypeError("The type of `target_update_interval` must be `int`.")
+        if target_update_interval <= 0:
+            raise ValueError("The value of `target_update_interval` must be more than `0`.")
+        if isinstance(target_update_rate, float) is False:
+            raise TypeError("The type of `target_update_rate` must be `float`.")
+        if target_update_rate <= 0.0 or target_update_rate > 1.0:
+            raise ValueError("The value of `target_update_rate` must be more than `0.0` and less than or equal to `1.0`.")
+        if async_target_flag is True and target_function_approximator is None:
+            raise ValueError("`async_target_flag` requires `target_function_approximator`.")
 
         super(DQLController, self).__init__(**kwargs)
 
@@ -111,6 +151,17 @@ class DQLController(HybridBlock, ControllableModel):
                 if hybridize_flag is True:
                     self.function_approximator.hybridize()
 
+                if target_function_approximator is not None:
+                    target_function_approximator.collect_params().initialize(
+                        self.initializer, 
+                        force_reinit=True, 
+                        ctx=ctx
+                    )
+                    # The target network is never differentiated.
+                    target_function_approximator.collect_params().setattr("grad_req", "null")
+                    if hybridize_flag is True:
+                        target_function_approximator.hybridize()
+
             except InitDeferredError:
                 self.__logger.debug("The initialization should be deferred.")
 
@@ -118,6 +169,13 @@ class DQLController(HybridBlock, ControllableModel):
         self.__learning_attenuate_rate = learning_attenuate_rate
         self.__attenuate_epoch = attenuate_epoch
         self.__recursive_learning_flag = recursive_learning_flag
+        self.__replay_buffer = replay_buffer
+        self.__replay_n = replay_n
+        self.__target_function_approximator = target_function_approximator
+        self.__target_update_interval = target_update_interval
+        self.__target_update_rate = target_update_rate
+        self.__async_target_flag = async_target_flag
+        self.__target_synchronized_flag = False
         self.__q_logs_arr = np.array([])
 
         self.t = 0
@@ -147,6 +205,12 @@ class DQLController(HybridBlock, ControllableModel):
         state_arr = None
         state_meta_data_arr = None
 
+        if self.__async_target_flag is True:
+            executor = ThreadPoolExecutor(max_workers=1)
+        else:
+            executor = None
+        future = None
+
         try:
             for n in range(iter_n):
                 if (n + 1) % 100 == 0 or n < 100:
@@ -158,91 +222,22 @@ class DQLController(HybridBlock, ControllableModel):
                     self.trainer.set_learning_rate(learning_rate)
 
                 # Draw samples of next possible actions from any distribution.
-                # (batch, possible_n, dim1, dim2, ...)
-                possible_action_arr, action_meta_data_arr = self.policy_sampler.draw()
-
-                possible_reward_value_arr = None
-                next_q_arr = None
-                possible_predicted_q_arr = None
-
-                for possible_i in range(possible_action_arr.shape[1]):
-                    if action_meta_data_arr is not None:
-                        meta_data_arr = action_meta_data_arr[:, possible_i]
-                    else:
-                        meta_data_arr = None
-
-                    # Inference Q-Values.
-                    _predicted_q_arr = self.function_approximator.inference(
-                        possible_action_arr[:, possible_i]
-                    )
-                    if possible_predicted_q_arr is None:
-                        possible_predicted_q_arr = nd.expand_dims(_predicted_q_arr, axis=1)
-                    else:
-                        possible_predicted_q_arr = nd.concat(
-                            possible_predicted_q_arr,
-                            nd.expand_dims(_predicted_q_arr, axis=1),
-                            dim=1
-                        )
-
-                    # Observe reward values.
-                    _reward_value_arr = self.policy_sampler.observe_reward_value(
-                        state_arr, 
-                        possible_action_arr[:, possible_i],
-                        meta_data_arr=meta_data_arr,
-                    )
-                    if possible_reward_value_arr is None:
-                        possible_reward_value_arr = nd.expand_dims(_reward_value_arr, axis=1)
-                    else:
-                        possible_reward_value_arr = nd.concat(
-                            possible_reward_value_arr,
-                            nd.expand_dims(_reward_value_arr, axis=1),
-                            dim=1
-                        )
-
-                    # Inference the Max-Q-Value in next action time.
-                    self.policy_sampler.observe_state(
-                        state_arr=possible_action_arr[:, possible_i],
-                        meta_data_arr=meta_data_arr
-                    )
-                    next_possible_action_arr, _ = self.policy_sampler.draw()
-                    next_next_q_arr = None
-
-                    for possible_j in range(next_possible_action_arr.shape[1]):
-                        with autograd.predict_mode():
-                            _next_next_q_arr = self.function_approximator.inference(
-                                next_possible_action_arr[:, possible_j]
-                            )
-                        if next_next_q_arr is None:
-                            next_next_q_arr = nd.expand_dims(
-                                _next_next_q_arr,
-                                axis=1
-                            )
-                        else:
-                            next_next_q_arr = nd.concat(
-                                next_next_q_arr,
-                                nd.expand_dims(
-                                    _next_next_q_arr, 
-                                    axis=1
-                                ),
-                                dim=1
-                            )
-
-                    next_max_q_arr = next_next_q_arr.max(axis=1)
-
-                    if next_q_arr is None:
-                        next_q_arr = nd.expand_dims(
-                            next_max_q_arr,
-                            axis=1
-                        )
-                    else:
-                        next_q_arr = nd.concat(
-                            next_q_arr,
-                            nd.expand_dims(
-                                next_max_q_arr,
-                                axis=1
-                            ),
-                            dim=1
-                        )
+                if future is None:
+                    drawn_tuple = self.__draw_possible_actions(state_arr)
+                else:
+                    drawn_tuple = future.result()
+                    future = None
+                possible_action_arr, action_meta_data_arr, possible_reward_value_arr, next_possible_action_arr_list, next_q_arr = drawn_tuple
+
+                # The target network is not used in the background thread at this point.
+                if self.__target_synchronized_flag is True and self.t > 0 and self.t % self.__target_update_interval == 0:
+                    self.__update_target(self.__target_update_rate)
+
+                possible_predicted_q_arr, next_q_arr = self.__evaluate_possible_actions(
+                    possible_action_arr,
+                    next_possible_action_arr_list,
+                    next_q_arr
+                )
 
                 # Select action.
                 selected_tuple = self.select_action(
@@ -254,73 +249,460 @@ class DQLController(HybridBlock, ControllableModel):
                 )
                 action_arr, predicted_q_arr, reward_value_arr, next_q_arr, action_meta_data_arr = selected_tuple
 
-                with autograd.record():
-                    predicted_q_arr = self.function_approximator.inference(
-                        action_arr
-                    )
-                    # Update real Q-Values.
-                    real_q_arr = self.update_q(
+                end_flag = False
+                if executor is None:
+                    update_flag = self.__learn_transition(
+                        n,
+                        action_arr,
                         reward_value_arr,
                         next_q_arr
                     )
-
-                    if self.__q_logs_arr.shape[0] > 0:
-                        self.__q_logs_arr = np.r_[
-                            self.__q_logs_arr,
-                            np.array([
-                                predicted_q_arr.mean().asnumpy(), 
-                                real_q_arr.mean().asnumpy()
-                            ]).reshape(1, 2)
-                        ]
-                    else:
-                        self.__q_logs_arr = np.array([
-                            predicted_q_arr.mean().asnumpy(), 
-                            real_q_arr.mean().asnumpy()
-                        ]).reshape(1, 2)
-
-                    # Learn Q-Values.
-                    loss = self.computable_loss(
-                        predicted_q_arr, 
-                        real_q_arr
-                    )
-                if mx.nd.contrib.isnan(loss).astype(int).sum() == 0:
-                    loss.backward()
-                    self.trainer.step(predicted_q_arr.shape[0])
-                    self.function_approximator.model.regularize()
-
-                    if (n + 1) % 100 == 0 or n < 100:
-                        self.__logger.debug("Reward value(mean): " + str(reward_value_arr.mean().asnumpy()[0]))
-                        self.__logger.debug("Predicted Q-value(mean): " + str(predicted_q_arr.mean().asnumpy()[0]))
-                        self.__logger.debug("Real Q-value(mean): " + str(real_q_arr.mean().asnumpy()[0]))
-                        self.__logger.debug("Loss of Q-Value(mean): " + str(loss.mean().asnumpy()[0]))
-
-                    if self.__recursive_learning_flag is True:
-                        # Update State.
-                        state_arr, state_meta_data_arr = self.policy_sampler.update_state(
-                            action_arr, 
-                            meta_data_arr=action_meta_data_arr
+                    if update_flag is True and self.__recursive_learning_flag is True:
+                        state_arr, state_meta_data_arr = self.__transit(
+                            action_arr,
+                            action_meta_data_arr
                         )
-                        self.policy_sampler.observe_state(
-                            state_arr=state_arr,
+                    if self.__recursive_learning_flag is True:
+                        # Check.
+                        end_flag = self.policy_sampler.check_the_end_flag(
+                            state_arr, 
                             meta_data_arr=state_meta_data_arr
                         )
                 else:
-                    self.__logger.debug("The parameter update was skipped because the vanishing gradient problem or gradient explosion occurred.")
+                    # The next step is started only when the parameters are updated,
+                    # and its target Q-Values are computed while the gradient step runs.
+                    next_step_list = []
+                    update_flag = self.__learn_transition(
+                        n,
+                        action_arr,
+                        reward_value_arr,
+                        next_q_arr,
+                        commit_callback=lambda: next_step_list.append(
+                            self.__start_next_step(
+                                executor,
+                                action_arr,
+                                action_meta_data_arr,
+                                state_arr,
+                                state_meta_data_arr,
+                                n + 1 < iter_n
+                            )
+                        )
+                    )
+                    if update_flag is True:
+                        state_arr, state_meta_data_arr, end_flag, future = next_step_list[0]
+                    elif self.__recursive_learning_flag is True:
+                        # As in the serial mode, the state is not updated.
+                        end_flag = self.policy_sampler.check_the_end_flag(
+                            state_arr, 
+                            meta_data_arr=state_meta_data_arr
+                        )
 
                 # Epsode.
                 self.t += 1
 
-                if self.__recursive_learning_flag is True:
-                    # Check.
-                    end_flag = self.policy_sampler.check_the_end_flag(
-                        state_arr, 
-                        meta_data_arr=meta_data_arr
-                    )
-                    if end_flag is True:
-                        break
+                if end_flag is True:
+                    break
 
         except KeyboardInterrupt:
             print("Keyboard Interrupt.")
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+    def __learn_transition(
+        self,
+        n,
+        action_arr,
+        reward_value_arr,
+        next_q_arr,
+        commit_callback=None
+    ):
+        '''
+        Learn the selected transitions directly or via `replay_buffer`.
+
+        Args:
+            n:                  `int` of the number of now iteration.
+            action_arr:         Tensor of selected actions.
+            reward_value_arr:   Tensor of reward values.
+            next_q_arr:         Tensor of maximum Q-Values in next time step.
+            commit_callback:    Function called without arguments, only if the state can be updated,
+                                before the gradient steps.
+
+        Returns:
+            `bool` that means the state can be updated or not.
+        '''
+        if self.__replay_buffer is None:
+            return self.__update(
+                n,
+                action_arr,
+                reward_value_arr,
+                next_q_arr,
+                commit_callback=commit_callback
+            )
+
+        self.__replay_buffer.append(
+            action_arr,
+            reward_value_arr,
+            next_q_arr
+        )
+        if commit_callback is not None:
+            commit_callback()
+        if len(self.__replay_buffer) >= self.__replay_buffer.batch_size:
+            for _ in range(self.__replay_n):
+                replay_tuple = self.__replay_buffer.draw()
+                _action_arr, _reward_value_arr, _next_q_arr, index_arr, weight_arr = replay_tuple
+                self.__update(
+                    n,
+                    _action_arr,
+                    _reward_value_arr,
+                    _next_q_arr,
+                    index_arr=index_arr,
+                    weight_arr=weight_arr
+                )
+        return True
+
+    def __start_next_step(
+        self,
+        executor,
+        action_arr,
+        action_meta_data_arr,
+        state_arr,
+        state_meta_data_arr,
+        prefetch_flag
+    ):
+        '''
+        Update the state, and start to draw the possible actions in next step in background.
+
+        Args:
+            executor:               `ThreadPoolExecutor`.
+            action_arr:             Tensor of selected actions.
+            action_meta_data_arr:   Meta data of the selected actions or `None`.
+            state_arr:              Tensor of now state.
+            state_meta_data_arr:    Meta data of now state.
+            prefetch_flag:          `bool` that means the next step will be drawn or not.
+
+        Returns:
+            Tuple data.
+            - Tensor of new state.
+            - Meta data of new state.
+            - `bool` of end flag.
+            - `Future` of the result of `__draw_possible_actions` or `None`.
+        '''
+        end_flag = False
+        if self.__recursive_learning_flag is True:
+            state_arr, state_meta_data_arr = self.__transit(
+                action_arr,
+                action_meta_data_arr
+            )
+            # Check.
+            end_flag = self.policy_sampler.check_the_end_flag(
+                state_arr, 
+                meta_data_arr=state_meta_data_arr
+            )
+
+        future = None
+        if end_flag is False and prefetch_flag is True:
+            future = executor.submit(self.__draw_possible_actions, state_arr)
+        return state_arr, state_meta_data_arr, end_flag, future
+
+    def __transit(self, action_arr, action_meta_data_arr):
+        '''
+        Update the state by the selected actions.
+
+        Args:
+            action_arr:             Tensor of selected actions.
+            action_meta_data_arr:   Meta data of the selected actions or `None`.
+
+        Returns:
+            Tuple data.
+            - Tensor of new state.
+            - Meta data of new state.
+        '''
+        state_arr, state_meta_data_arr = self.policy_sampler.update_state(
+            action_arr, 
+            meta_data_arr=action_meta_data_arr
+        )
+        self.policy_sampler.observe_state(
+            state_arr=state_arr,
+            meta_data_arr=state_meta_data_arr
+        )
+        return state_arr, state_meta_data_arr
+
+    def __draw_possible_actions(self, state_arr):
+        '''
+        Draw the possible actions, and observe the reward values and the possible actions in next action time.
+        If `target_function_approximator` is not `None`, the maximum Q-Values in next action time
+        are inferenced by the target network.
+
+        Args:
+            state_arr:      Tensor of now state.
+
+        Returns:
+            Tuple data.
+            - Tensor of possible actions. The shape is: (batch, possible_n, dim1, dim2, ...)
+            - Meta data of the possible actions or `None`.
+            - Tensor of reward values of the possible actions.
+            - `list` of tensors of possible actions in next action time.
+            - Tensor of maximum Q-Values in next action time or `None`.
+        '''
+        # (batch, possible_n, dim1, dim2, ...)
+        possible_action_arr, action_meta_data_arr = self.policy_sampler.draw()
+
+        reward_value_arr_list = []
+        next_possible_action_arr_list = []
+        for possible_i in range(possible_action_arr.shape[1]):
+            if action_meta_data_arr is not None:
+                meta_data_arr = action_meta_data_arr[:, possible_i]
+            else:
+                meta_data_arr = None
+
+            # Observe reward values.
+            reward_value_arr_list.append(
+                self.policy_sampler.observe_reward_value(
+                    state_arr, 
+                    possible_action_arr[:, possible_i],
+                    meta_data_arr=meta_data_arr,
+                )
+            )
+
+            # Draw the possible actions in next action time.
+            self.policy_sampler.observe_state(
+                state_arr=possible_action_arr[:, possible_i],
+                meta_data_arr=meta_data_arr
+            )
+            next_possible_action_arr, _ = self.policy_sampler.draw()
+            next_possible_action_arr_list.append(next_possible_action_arr)
+
+        possible_reward_value_arr = nd.stack(*reward_value_arr_list, axis=1)
+
+        next_q_arr = None
+        if self.__target_function_approximator is not None:
+            next_observed_arr = nd.concat(
+                *[arr.reshape((-1, ) + tuple(arr.shape[2:])) for arr in next_possible_action_arr_list],
+                dim=0
+            )
+            if self.__target_synchronized_flag is False:
+                self.__synchronize_target(next_observed_arr)
+
+            with autograd.predict_mode():
+                next_next_q_arr = self.__target_function_approximator.inference(next_observed_arr)
+
+            next_q_arr = self.__extract_next_max_q(
+                next_next_q_arr,
+                possible_action_arr.shape[0],
+                [arr.shape[1] for arr in next_possible_action_arr_list]
+            )
+
+        return (
+            possible_action_arr, 
+            action_meta_data_arr, 
+            possible_reward_value_arr, 
+            next_possible_action_arr_list,
+            next_q_arr
+        )
+
+    def __evaluate_possible_actions(
+        self,
+        possible_action_arr,
+        next_possible_action_arr_list,
+        next_q_arr=None
+    ):
+        '''
+        Evaluate Q-Values of the possible actions and the maximum Q-Values in next action time.
+
+        The possible actions and all possible actions in next action time are stacked
+        into one tensor, and the Q-Values are inferenced by a single forward propagation.
+
+        Args:
+            possible_action_arr:            Tensor of possible actions.
+                                            The shape is: (batch, possible_n, dim1, dim2, ...)
+            next_possible_action_arr_list:  `list` of tensors of possible actions in next action time.
+            next_q_arr:                     Tensor of maximum Q-Values in next action time, 
+                                            which has been inferenced by the target network.
+                                            If `None`, this is inferenced by `function_approximator`.
+
+        Returns:
+            Tuple data.
+            - Tensor of Q-Values of the possible actions.
+            - Tensor of maximum Q-Values in next action time.
+        '''
+        batch_size = possible_action_arr.shape[0]
+        possible_n = possible_action_arr.shape[1]
+
+        arr_list = [possible_action_arr]
+        if next_q_arr is None:
+            arr_list.extend(next_possible_action_arr_list)
+
+        # (batch * possible_n + possible_n * batch * next_possible_n, dim1, dim2, ...)
+        observed_arr = nd.concat(
+            *[arr.reshape((-1, ) + tuple(arr.shape[2:])) for arr in arr_list],
+            dim=0
+        )
+        with autograd.predict_mode():
+            inferenced_arr = self.function_approximator.inference(observed_arr)
+
+        possible_predicted_q_arr = inferenced_arr[:batch_size * possible_n].reshape(
+            (batch_size, possible_n) + tuple(inferenced_arr.shape[1:])
+        )
+        if next_q_arr is None:
+            next_q_arr = self.__extract_next_max_q(
+                inferenced_arr[batch_size * possible_n:],
+                batch_size,
+                [arr.shape[1] for arr in next_possible_action_arr_list]
+            )
+
+        return possible_predicted_q_arr, next_q_arr
+
+    def __extract_next_max_q(self, next_next_q_arr, batch_size, next_possible_n_list):
+        '''
+        Extract the maximum Q-Values in next action time.
+
+        Args:
+            next_next_q_arr:        Tensor of Q-Values of all possible actions in next action time.
+                                    The shape is: (possible_n * batch * next_possible_n, ...)
+            batch_size:             `int` of batch size.
+            next_possible_n_list:   `list` of the number of possible actions in next action time.
+
+        Returns:
+            Tensor of maximum Q-Values. The shape is: (batch, possible_n, ...)
+        '''
+        q_shape = tuple(next_next_q_arr.shape[1:])
+        if len(set(next_possible_n_list)) == 1:
+            # (possible_n, batch, next_possible_n, ...) -> (batch, possible_n, ...)
+            return next_next_q_arr.reshape(
+                (len(next_possible_n_list), batch_size, next_possible_n_list[0]) + q_shape
+            ).max(axis=2).swapaxes(0, 1)
+
+        next_max_q_arr_list = []
+        start = 0
+        for next_possible_n in next_possible_n_list:
+            end = start + batch_size * next_possible_n
+            next_max_q_arr_list.append(
+                next_next_q_arr[start:end].reshape(
+                    (batch_size, next_possible_n) + q_shape
+                ).max(axis=1)
+            )
+            start = end
+        return nd.stack(*next_max_q_arr_list, axis=1)
+
+    def __synchronize_target(self, observed_arr):
+        '''
+        Copy the parameters of `function_approximator` to the target network for the first time.
+
+        Args:
+            observed_arr:   Tensor of observed data points to complete the deferred initialization.
+        '''
+        with autograd.predict_mode():
+            self.function_approximator.inference(observed_arr)
+            self.__target_function_approximator.inference(observed_arr)
+
+        self.__update_target(1.0)
+        self.__target_synchronized_flag = True
+
+    def __update_target(self, update_rate):
+        '''
+        Update the parameters of the target network.
+
+        Args:
+            update_rate:    `float` of the rate of Polyak averaging. If `1.0`, the parameters are hard copied.
+        '''
+        online_param_list = list(self.function_approximator.collect_params().values())
+        target_param_list = list(self.__target_function_approximator.collect_params().values())
+        if len(online_param_list) != len(target_param_list):
+            raise ValueError("The architecture of `target_function_approximator` must be equivalent to `function_approximator`.")
+
+        for online_param, target_param in zip(online_param_list, target_param_list):
+            if online_param.shape != target_param.shape:
+                raise ValueError("The architecture of `target_function_approximator` must be equivalent to `function_approximator`.")
+            if update_rate == 1.0:
+                target_param.set_data(online_param.data())
+            else:
+                target_param.set_data(
+                    update_rate * online_param.data() + (1.0 - update_rate) * target_param.data()
+                )
+
+    def __update(
+        self,
+        n,
+        action_arr,
+        reward_value_arr,
+        next_q_arr,
+        index_arr=None,
+        weight_arr=None,
+        commit_callback=None
+    ):
+        '''
+        Update the parameters of the function approximator by one mini-batch.
+
+        Args:
+            n:                  `int` of the number of now iteration.
+            action_arr:         Tensor of selected actions.
+            reward_value_arr:   Tensor of reward values.
+            next_q_arr:         Tensor of maximum Q-Values in next time step.
+            index_arr:          `np.ndarray` of indices of the transitions in `replay_buffer`.
+                                If not `None`, the priorities of the transitions are updated by TD-errors.
+            weight_arr:         Tensor of importance-sampling weights or `None`.
+            commit_callback:    Function called without arguments, only if the parameters 
+                                will be updated, before the gradient step.
+
+        Returns:
+            `bool` that means the parameters were updated or not.
+        '''
+        with autograd.record():
+            predicted_q_arr = self.function_approximator.inference(
+                action_arr
+            )
+            # Update real Q-Values.
+            real_q_arr = self.update_q(
+                reward_value_arr,
+                next_q_arr
+            )
+
+            if self.__q_logs_arr.shape[0] > 0:
+                self.__q_logs_arr = np.r_[
+                    self.__q_logs_arr,
+                    np.array([
+                        predicted_q_arr.mean().asnumpy(), 
+                        real_q_arr.mean().asnumpy()
+                    ]).reshape(1, 2)
+                ]
+            else:
+                self.__q_logs_arr = np.array([
+                    predicted_q_arr.mean().asnumpy(), 
+                    real_q_arr.mean().asnumpy()
+                ]).reshape(1, 2)
+
+            # Learn Q-Values.
+            loss = self.computable_loss(
+                predicted_q_arr, 
+                real_q_arr
+            )
+            if weight_arr is not None:
+                loss = loss * weight_arr
+
+        if mx.nd.contrib.isnan(loss).astype(int).sum() == 0:
+            if commit_callback is not None:
+                commit_callback()
+            loss.backward()
+            self.trainer.step(predicted_q_arr.shape[0])
+            self.function_approximator.model.regularize()
+
+            if index_arr is not None:
+                td_error_arr = (real_q_arr - predicted_q_arr).reshape((predicted_q_arr.shape[0], -1))
+                self.__replay_buffer.update_priority(
+                    index_arr,
+                    nd.abs(td_error_arr).mean(axis=1).asnumpy()
+                )
+
+            if (n + 1) % 100 == 0 or n < 100:
+                self.__logger.debug("Reward value(mean): " + str(reward_value_arr.mean().asnumpy()[0]))
+                self.__logger.debug("Predicted Q-value(mean): " + str(predicted_q_arr.mean().asnumpy()[0]))
+                self.__logger.debug("Real Q-value(mean): " + str(real_q_arr.mean().asnumpy()[0]))
+                self.__logger.debug("Loss of Q-Value(mean): " + str(loss.mean().asnumpy()[0]))
+            return True
+        else:
+            self.__logger.debug("The parameter update was skipped because the vanishing gradient problem or gradient explosion occurred.")
+            return False
 
     def inference(self, iter_n=100):
         '''
@@ -338,90 +720,14 @@ class DQLController(HybridBlock, ControllableModel):
         try:
             for n in range(iter_n):
                 # Draw samples of next possible actions from any distribution.
-                # (batch, possible_n, dim1, dim2, ...)
-                possible_action_arr, action_meta_data_arr = self.policy_sampler.draw()
-
-                possible_reward_value_arr = None
-                next_q_arr = None
-                possible_predicted_q_arr = None
-
-                for possible_i in range(possible_action_arr.shape[1]):
-                    if action_meta_data_arr is not None:
-                        meta_data_arr = action_meta_data_arr[:, possible_i]
-                    else:
-                        meta_data_arr = None
-
-                    # Inference Q-Values.
-                    _predicted_q_arr = self.function_approximator.inference(
-                        possible_action_arr[:, possible_i]
-                    )
-                    if possible_predicted_q_arr is None:
-                        possible_predicted_q_arr = nd.expand_dims(_predicted_q_arr, axis=1)
-                    else:
-                        possible_predicted_q_arr = nd.concat(
-                            possible_predicted_q_arr,
-                            nd.expand_dims(_predicted_q_arr, axis=1),
-                            dim=1
-                        )
-
-                    # Observe reward values.
-                    _reward_value_arr = self.policy_sampler.observe_reward_value(
-                        state_arr, 
-                        possible_action_arr[:, possible_i],
-                        meta_data_arr=meta_data_arr,
-                    )
-                    if possible_reward_value_arr is None:
-                        possible_reward_value_arr = nd.expand_dims(_reward_value_arr, axis=1)
-                    else:
-                        possible_reward_value_arr = nd.concat(
-                            possible_reward_value_arr,
-                            nd.expand_dims(_reward_value_arr, axis=1),
-                            dim=1
-                        )
+                drawn_tuple = self.__draw_possible_actions(state_arr)
+                possible_action_arr, action_meta_data_arr, possible_reward_value_arr, next_possible_action_arr_list, next_q_arr = drawn_tuple
 
-                    # Inference the Max-Q-Value in next action time.
-                    self.policy_sampler.observe_state(
-                        state_arr=possible_action_arr[:, possible_i],
-                        meta_data_arr=meta_data_arr
-                    )
-                    next_possible_action_arr, _ = self.policy_sampler.draw()
-                    next_next_q_arr = None
-
-                    for possible_j in range(next_possible_action_arr.shape[1]):
-                        _next_next_q_arr = self.function_approximator.inference(
-                            next_possible_action_arr[:, possible_j]
-                        )
-                        if next_next_q_arr is None:
-                            next_next_q_arr = nd.expand_dims(
-                                _next_next_q_arr,
-                                axis=1
-                            )
-                        else:
-                            next_next_q_arr = nd.concat(
-                                next_next_q_arr,
-                                nd.expand_dims(
-                                    _next_next_q_arr, 
-                                    axis=1
-                                ),
-                                dim=1
-                            )
-
-                    next_max_q_arr = next_next_q_arr.max(axis=1)
-
-                    if next_q_arr is None:
-                        next_q_arr = nd.expand_dims(
-                            next_max_q_arr,
-                            axis=1
-                        )
-                    else:
-                        next_q_arr = nd.concat(
-                            next_q_arr,
-                            nd.expand_dims(
-                                next_max_q_arr,
-                                axis=1
-                            ),
-                            dim=1
-                        )
+                possible_predicted_q_arr, next_q_arr = self.__evaluate_possible_actions(
+                    possible_action_arr,
+                    next_possible_action_arr_list,
+                    next_q_arr
+                )
 
                 # Select action.
                 selected_tuple = self.select_action(
@@ -451,7 +757,7 @@ class DQLController(HybridBlock, ControllableModel):
                 # Check.
                 end_flag = self.policy_sampler.check_the_end_flag(
                     state_arr, 
-                    meta_data_arr=meta_data_arr
+                    meta_data_arr=state_meta_data_arr
                 )
                 if end_flag is True:
                     break
@@ -580,6 +886,31 @@ class DQLController(HybridBlock, ControllableModel):
 
     __q_logs_arr = None
 
+    # is-a `ReplayBuffer`.
+    __replay_buffer = None
+
+    def get_replay_buffer(self):
+        ''' getter for `ReplayBuffer`. '''
+        return self.__replay_buffer
+
+    def set_replay_buffer(self, value):
+        ''' setter for `ReplayBuffer`. '''
+        if isinstance(value, ReplayBuffer) is False and value is not None:
+            raise TypeError("The type of `replay_buffer` must be `ReplayBuffer`.")
+        self.__replay_buffer = value
+
+    replay_buffer = property(get_replay_buffer, set_replay_buffer)
+
+    def get_target_function_approximator(self):
+        ''' getter for `FunctionApproximator` of target network. '''
+        return self.__target_function_approximator
+
+    def set_target_function_approximator(self, value):
+        ''' setter for `FunctionApproximator` of target network. '''
+        raise TypeError("This property must be read-only.")
+
+    target_function_approximator = property(get_target_function_approximator, set_target_function_approximator)
+
     def get_q_logs_arr(self):
         ''' getter '''
         return self.__q_logs_arr
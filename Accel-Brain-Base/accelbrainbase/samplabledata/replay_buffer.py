@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+from accelbrainbase.samplable_data import SamplableData
+from abc import abstractmethod
+
+
+class ReplayBuffer(SamplableData):
+    '''
+    The interface of the experience replay memory for the Deep Q-Learning.
+
+    The transitions observed by the agent are stored in the memory, 
+    and the mini-batches are drawn from the memory to update the function approximator. 
+    The reuse of each transition in many updates improves the data efficiency, 
+    and the random sampling breaks the correlations between consecutive samples.
+
+    References:
+        - Lin, L. J. (1992). Self-improving reactive agents based on reinforcement learning, planning and teaching. Machine learning, 8(3-4), 293-321.
+        - Mnih, V., Kavukcuoglu, K., Silver, D., Graves, A., Antonoglou, I., Wierstra, D., & Riedmiller, M. (2013). Playing atari with deep reinforcement learning. arXiv preprint arXiv:1312.5602.
+        - Schaul, T., Quan, J., Antonoglou, I., & Silver, D. (2015). Prioritized experience replay. arXiv preprint arXiv:1511.05952.
+
+    '''
+
+    # The number of transitions in one mini-batch.
+    __batch_size = 32
+
+    def get_batch_size(self):
+        ''' getter '''
+        return self.__batch_size
+
+    def set_batch_size(self, value):
+        ''' setter '''
+        if isinstance(value, int) is False:
+            raise TypeError("The type of `batch_size` must be `int`.")
+        if value <= 0:
+            raise ValueError("The value of `batch_size` must be more than `0`.")
+        self.__batch_size = value
+
+    batch_size = property(get_batch_size, set_batch_size)
+
+    @abstractmethod
+    def append(self, action_arr, reward_value_arr, next_q_arr):
+        '''
+        Store the batch of transitions.
+
+        Args:
+            action_arr:         Tensor of selected actions, which is the input of the function approximator.
+            reward_value_arr:   Tensor of reward values.
+            next_q_arr:         Tensor of maximum Q-Values in next time step.
+        '''
+        raise NotImplementedError()
+
+    @abstractmethod
+    def draw(self):
+        '''
+        Draw the mini-batch of transitions.
+
+        Returns:
+            Tuple data.
+            - Tensor of actions.
+            - Tensor of reward values.
+            - Tensor of maximum Q-Values in next time step.
+            - `np.ndarray` of indices of the transitions in the memory.
+            - Tensor of importance-sampling weights, or `None`.
+        '''
+        raise NotImplementedError()
+
+    def update_priority(self, index_arr, td_error_arr):
+        '''
+        Update the priorities of the transitions.
+
+        This method can be overrided for prioritized sampling.
+
+        Args:
+            index_arr:      `np.ndarray` of indices of the transitions in the memory.
+            td_error_arr:   `np.ndarray` of TD-errors of the transitions.
+        '''
+        pass
+
+    @abstractmethod
+    def __len__(self):
+        '''
+        Returns:
+            The number of stored transitions.
+        '''
+        raise NotImplementedError()
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+from accelbrainbase.samplabledata.replaybuffer._mxnet.uniform_replay_buffer import UniformReplayBuffer
+import numpy as np
+import mxnet as mx
+import mxnet.ndarray as nd
+
+
+class PrioritizedReplayBuffer(UniformReplayBuffer):
+    '''
+    The experience replay memory which draws transitions 
+    in proportion to their priorities.
+
+    The priority of each transition is `(|TD-error| + epsilon) ** alpha`, and 
+    the priorities are stored in the leaves of the sum-tree, so that drawing 
+    and updating one transition cost O(log N). New transitions have the maximum 
+    priority so far, in order that each transition is drawn at least once.
+    The bias of the prioritized sampling is corrected by the importance-sampling 
+    weights `(N * P(i)) ** -beta`, normalized by their maximum.
+
+    References:
+        - Schaul, T., Quan, J., Antonoglou, I., & Silver, D. (2015). Prioritized experience replay. arXiv preprint arXiv:1511.05952.
+
+    '''
+
+    def __init__(
+        self, 
+        capacity=10000, 
+        batch_size=32, 
+        alpha=0.6, 
+        beta=0.4, 
+        epsilon=1e-06, 
+        ctx=mx.gpu()
+    ):
+        '''
+        Init.
+
+        Args:
+            capacity:       `int` of the maximum number of stored transitions.
+            batch_size:     `int` of the number of transitions in one mini-batch.
+            alpha:          `float` of the exponent of priorities. If `0.0`, sampling is uniform.
+            beta:           `float` of the exponent of importance-sampling weights.
+            epsilon:        `float` of the small positive constant added to TD-errors.
+            ctx:            `mx.cpu()` or `mx.gpu()`.
+        '''
+        super().__init__(capacity=capacity, batch_size=batch_size, ctx=ctx)
+        self.__alpha = alpha
+        self.__beta = beta
+        self.__epsilon = epsilon
+        self.__ctx = ctx
+
+        tree_capacity = 1
+        while tree_capacity < capacity:
+            tree_capacity *= 2
+        self.__tree_capacity = tree_capacity
+        # The sum-tree. The root is `1`, and the leaves are `tree_capacity` to `2 * tree_capacity - 1`.
+        self.__tree_arr = np.zeros(2 * tree_capacity, dtype=np.float64)
+        self.__max_priority = 1.0
+
+    def append(self, action_arr, reward_value_arr, next_q_arr):
+        '''
+        Store the batch of transitions with the maximum priority so far.
+
+        Args:
+            action_arr:         Tensor of selected actions, which is the input of the function approximator.
+            reward_value_arr:   Tensor of reward values.
+            next_q_arr:         Tensor of maximum Q-Values in next time step.
+
+        Returns:
+            `np.ndarray` of indices of the stored transitions in the memory.
+        '''
+        index_arr = super().append(action_arr, reward_value_arr, next_q_arr)
+        self.__update_tree(index_arr, np.full(index_arr.shape[0], self.__max_priority))
+        return index_arr
+
+    def draw(self):
+        '''
+        Draw the mini-batch of transitions in proportion to their priorities.
+
+        Returns:
+            Tuple data.
+            - Tensor of actions.
+            - Tensor of reward values.
+            - Tensor of maximum Q-Values in next time step.
+            - `np.ndarray` of indices of the transitions in the memory.
+            - Tensor of importance-sampling weights.
+        '''
+        total = self.__tree_arr[1]
+        # Stratified sampling in the equal segments of the total priority.
+        segment = total / self.batch_size
+        value_arr = (np.arange(self.batch_size) + np.random.random(self.batch_size)) * segment
+        value_arr = np.minimum(value_arr, np.nextafter(total, 0))
+
+        node_arr = np.ones(self.batch_size, dtype=np.int64)
+        while node_arr[0] < self.__tree_capacity:
+            left_arr = node_arr * 2
+            left_value_arr = self.__tree_arr[left_arr]
+            right_flag_arr = value_arr >= left_value_arr
+            value_arr = np.where(right_flag_arr, value_arr - left_value_arr, value_arr)
+            node_arr = np.where(right_flag_arr, left_arr + 1, left_arr)
+
+        index_arr = node_arr - self.__tree_capacity
+        # Guard against the empty leaves caused by the rounding error.
+        index_arr = np.minimum(index_arr, len(self) - 1)
+
+        prob_arr = self.__tree_arr[index_arr + self.__tree_capacity] / total
+        weight_arr = (len(self) * prob_arr) ** -self.__beta
+        weight_arr = weight_arr / weight_arr.max()
+
+        return self.take(index_arr) + (index_arr, nd.array(weight_arr, ctx=self.__ctx))
+
+    def update_priority(self, index_arr, td_error_arr):
+        '''
+        Update the priorities of the transitions.
+
+        Args:
+            index_arr:      `np.ndarray` of indices of the transitions in the memory.
+            td_error_arr:   `np.ndarray` of TD-errors of the transitions.
+        '''
+        priority_arr = (np.abs(td_error_arr) + self.__epsilon) ** self.__alpha
+        self.__max_priority = max(self.__max_priority, float(priority_arr.max()))
+        self.__update_tree(index_arr, priority_arr)
+
+    def __update_tree(self, index_arr, priority_arr):
+        '''
+        Update the leaves and their ancestors in the sum-tree.
+
+        Args:
+            index_arr:      `np.ndarray` of indices of the transitions in the memory.
+            priority_arr:   `np.ndarray` of priorities.
+        '''
+        node_arr = np.asarray(index_arr, dtype=np.int64) + self.__tree_capacity
+        self.__tree_arr[node_arr] = priority_arr
+        node_arr = np.unique(node_arr // 2)
+        while node_arr[0] >= 1:
+            self.__tree_arr[node_arr] = self.__tree_arr[node_arr * 2] + self.__tree_arr[node_arr * 2 + 1]
+            if node_arr[0] == 1:
+                break
+            node_arr = np.unique(node_arr // 2)
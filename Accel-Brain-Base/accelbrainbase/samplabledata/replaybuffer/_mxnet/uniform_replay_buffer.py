@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+from accelbrainbase.samplabledata.replay_buffer import ReplayBuffer
+import numpy as np
+import mxnet as mx
+import mxnet.ndarray as nd
+
+
+class UniformReplayBuffer(ReplayBuffer):
+    '''
+    The experience replay memory which draws transitions uniformly.
+
+    The transitions are stored in the ring buffers which are preallocated 
+    as `mxnet.ndarray`s when the first transitions are appended. 
+    If the memory is full, the oldest transitions are overwritten.
+
+    References:
+        - Lin, L. J. (1992). Self-improving reactive agents based on reinforcement learning, planning and teaching. Machine learning, 8(3-4), 293-321.
+        - Mnih, V., Kavukcuoglu, K., Silver, D., Graves, A., Antonoglou, I., Wierstra, D., & Riedmiller, M. (2013). Playing atari with deep reinforcement learning. arXiv preprint arXiv:1312.5602.
+
+    '''
+
+    def __init__(self, capacity=10000, batch_size=32, ctx=mx.gpu()):
+        '''
+        Init.
+
+        Args:
+            capacity:       `int` of the maximum number of stored transitions.
+            batch_size:     `int` of the number of transitions in one mini-batch.
+            ctx:            `mx.cpu()` or `mx.gpu()`.
+        '''
+        if isinstance(capacity, int) is False:
+            raise TypeError("The type of `capacity` must be `int`.")
+        if capacity <= 0:
+            raise ValueError("The value of `capacity` must be more than `0`.")
+
+        self.__capacity = capacity
+        self.batch_size = batch_size
+        self.__ctx = ctx
+        self.__action_arr = None
+        self.__reward_value_arr = None
+        self.__next_q_arr = None
+        self.__pos = 0
+        self.__size = 0
+
+    def append(self, action_arr, reward_value_arr, next_q_arr):
+        '''
+        Store the batch of transitions.
+
+        Args:
+            action_arr:         Tensor of selected actions, which is the input of the function approximator.
+            reward_value_arr:   Tensor of reward values.
+            next_q_arr:         Tensor of maximum Q-Values in next time step.
+
+        Returns:
+            `np.ndarray` of indices of the stored transitions in the memory.
+        '''
+        if self.__action_arr is None:
+            self.__action_arr = nd.zeros((self.__capacity, ) + action_arr.shape[1:], ctx=self.__ctx)
+            self.__reward_value_arr = nd.zeros((self.__capacity, ) + reward_value_arr.shape[1:], ctx=self.__ctx)
+            self.__next_q_arr = nd.zeros((self.__capacity, ) + next_q_arr.shape[1:], ctx=self.__ctx)
+
+        index_arr = (self.__pos + np.arange(action_arr.shape[0])) % self.__capacity
+        _index_arr = nd.array(index_arr, ctx=self.__ctx)
+        self.__action_arr[_index_arr] = action_arr.as_in_context(self.__ctx)
+        self.__reward_value_arr[_index_arr] = reward_value_arr.as_in_context(self.__ctx)
+        self.__next_q_arr[_index_arr] = next_q_arr.as_in_context(self.__ctx)
+
+        self.__pos = int((self.__pos + action_arr.shape[0]) % self.__capacity)
+        self.__size = min(self.__size + action_arr.shape[0], self.__capacity)
+        return index_arr
+
+    def draw(self):
+        '''
+        Draw the mini-batch of transitions uniformly.
+
+        Returns:
+            Tuple data.
+            - Tensor of actions.
+            - Tensor of reward values.
+            - Tensor of maximum Q-Values in next time step.
+            - `np.ndarray` of indices of the transitions in the memory.
+            - `None`.
+        '''
+        index_arr = np.random.randint(low=0, high=self.__size, size=(self.batch_size, ))
+        return self.take(index_arr) + (index_arr, None)
+
+    def take(self, index_arr):
+        '''
+        Take the transitions in the memory.
+
+        Args:
+            index_arr:      `np.ndarray` of indices of the transitions in the memory.
+
+        Returns:
+            Tuple data.
+            - Tensor of actions.
+            - Tensor of reward values.
+            - Tensor of maximum Q-Values in next time step.
+        '''
+        _index_arr = nd.array(index_arr, ctx=self.__ctx)
+        return (
+            nd.take(self.__action_arr, _index_arr),
+            nd.take(self.__reward_value_arr, _index_arr),
+            nd.take(self.__next_q_arr, _index_arr)
+        )
+
+    def get_capacity(self):
+        ''' getter '''
+        return self.__capacity
+
+    def set_readonly(self, value):
+        ''' setter '''
+        raise TypeError("This property must be read-only.")
+
+    capacity = property(get_capacity, set_readonly)
+
+    def __len__(self):
+        '''
+        Returns:
+            The number of stored transitions.
+        '''
+        return self.__size
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 from abc import ABCMeta, abstractmethod
+import numpy as np
+from pysummarization.sentence_index import SentenceIndex
 
 
 class AbstractableSemantics(metaclass=ABCMeta):
@@ -53,3 +55,60 @@ class AbstractableSemantics(metaclass=ABCMeta):
             `np.ndarray` of scores.
         '''
         raise NotImplementedError("This method must be implemented.")
+
+    def extract_abstract_sentence_list(
+        self,
+        scored_sample_generator,
+        vectorizable_token,
+        sentence_list,
+        limit=5,
+        ascending_flag=True
+    ):
+        '''
+        Extract the sentences which include the sequences of the `limit` best scores.
+
+        Args:
+            scored_sample_generator:    The generator of `tuple`s of `np.ndarray` of 
+                                        observed data points and `np.ndarray` of scores.
+            vectorizable_token:         is-a `VectorizableToken`.
+            sentence_list:              `list` of all sentences.
+            limit:                      The number of selected abstract sentence.
+            ascending_flag:             If `True`, the smallest scores are the best.
+                                        If `False`, the largest scores are the best.
+
+        Returns:
+            `list` of `str` of abstract sentences.
+        '''
+        score_arr_list = []
+        test_arr_list = []
+        for test_arr, score_arr in scored_sample_generator:
+            score_arr_list.append(score_arr)
+            test_arr_list.append(test_arr)
+
+        if len(score_arr_list) == 0 or limit <= 0:
+            return []
+
+        score_arr = np.concatenate(score_arr_list, axis=0)
+        test_arr = np.concatenate(test_arr_list, axis=0)
+        if ascending_flag is False:
+            score_arr = -score_arr
+
+        # The sequences of the `limit` best scores, in the order of scores.
+        k = min(limit, score_arr.shape[0])
+        key_arr = np.argpartition(score_arr, k - 1)[:k]
+        key_arr = key_arr[np.argsort(score_arr[key_arr], kind="stable")]
+
+        sentence_index = SentenceIndex(sentence_list)
+        abstract_list = []
+        abstract_set = set()
+        for key in key_arr:
+            token_arr = vectorizable_token.tokenize(test_arr[key].tolist())
+            for sentence in sentence_index.extract_sentence_list(token_arr.tolist()):
+                if sentence not in abstract_set:
+                    abstract_set.add(sentence)
+                    abstract_list.append(sentence)
+
+            if len(abstract_list) >= limit:
+                break
+
+        return abstract_list
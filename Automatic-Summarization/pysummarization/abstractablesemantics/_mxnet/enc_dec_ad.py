@@ -17,6 +17,7 @@ from accelbrainbase.observabledata._mxnet.lstmnetworks.encoder_decoder import En
 
 from pysummarization.abstractable_semantics import AbstractableSemantics
 from pysummarization.vectorizable_token import VectorizableToken
+from pysummarization.abstractablesemantics._mxnet.static_graph_inference import StaticGraphInference
 
 
 class EncDecAD(AbstractableSemantics):
@@ -132,6 +133,8 @@ class EncDecAD(AbstractableSemantics):
         self.__logs_tuple_list = []
         self.__computable_loss = computable_loss
 
+        self.__static_graph_inference = StaticGraphInference(encoder_decoder_controller, logger)
+
     def __build_encoder_decoder_controller(
         self,
         computable_loss=None,
@@ -281,50 +284,33 @@ class EncDecAD(AbstractableSemantics):
         if isinstance(vectorizable_token, VectorizableToken) is False:
             raise TypeError()
 
-        _score_arr = None
-        _test_arr = None
-        for _, _, test_arr, _ in iteratable_data.generate_inferenced_samples():
-            reconstruced_arr = self.inference(test_arr)
-            score_arr = self.__computable_loss(test_arr, reconstruced_arr)
-            score_arr = score_arr.asnumpy()
-
-            if _score_arr is None:
-                _score_arr = score_arr
-            else:
-                _score_arr = np.r_[_score_arr, score_arr]
-            if _test_arr is None:
-                _test_arr = test_arr.asnumpy()
-            else:
-                _test_arr = np.r_[_test_arr, test_arr.asnumpy()]
-
-        score_list = _score_arr.tolist()
-        test_arr = _test_arr
-        score_arr = _score_arr
-
-        abstract_list = []
-        for i in range(limit):
-            if self.__normal_prior_flag is True:
-                key = score_arr.argmin()
-            else:
-                key = score_arr.argmax()
-
-            score = score_list.pop(key)
-            score_arr = np.array(score_list)
-
-            seq_arr = test_arr[key]
-            token_arr = vectorizable_token.tokenize(seq_arr.tolist())
-            s = " ".join(token_arr.tolist())
-            _s = "".join(token_arr.tolist())
-
-            for sentence in sentence_list:
-                if s in sentence or _s in sentence:
-                    abstract_list.append(sentence)
-                    abstract_list = list(set(abstract_list))
-
-            if len(abstract_list) >= limit:
-                break
-
-        return abstract_list
+        return self.extract_abstract_sentence_list(
+            self.generate_scored_samples(iteratable_data),
+            vectorizable_token,
+            sentence_list,
+            limit=limit,
+            ascending_flag=self.__normal_prior_flag
+        )
+
+    def generate_scored_samples(self, iteratable_data):
+        '''
+        Score all sequences in predict mode, by the hybridized graph of static shapes.
+        See `StaticGraphInference.generate_scored_samples`.
+
+        Args:
+            iteratable_data:        is-a `IteratableData`.
+
+        Returns:
+            `Tuple` data for each batch. The padded rows are removed.
+            - `np.ndarray` of observed data points.
+            - `np.ndarray` of reconstruction errors of each sequence.
+        '''
+        return self.__static_graph_inference.generate_scored_samples(
+            iteratable_data,
+            self.inference,
+            lambda test_arr, reconstruced_arr, mask_arr: self.__computable_loss(test_arr, reconstruced_arr),
+            self.__ctx
+        )
 
     def set_readonly(self, value):
         ''' setter '''
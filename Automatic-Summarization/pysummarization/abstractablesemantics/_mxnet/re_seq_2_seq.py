@@ -4,6 +4,7 @@ import numpy as np
 
 from pysummarization.abstractable_semantics import AbstractableSemantics
 from pysummarization.vectorizable_token import VectorizableToken
+from pysummarization.abstractablesemantics._mxnet.static_graph_inference import StaticGraphInference
 
 from logging import getLogger
 from logging import getLogger, StreamHandler, NullHandler, DEBUG, ERROR
@@ -218,6 +219,8 @@ class ReSeq2Seq(HybridBlock, AbstractableSemantics):
         self.__logger = logger
         self.__logs_tuple_list = []
 
+        self.__static_graph_inference = StaticGraphInference(self, logger)
+
     def collect_params(self, select=None):
         '''
         Overrided `collect_params` in `mxnet.gluon.HybridBlok`.
@@ -489,57 +492,54 @@ class ReSeq2Seq(HybridBlock, AbstractableSemantics):
         if isinstance(vectorizable_token, VectorizableToken) is False:
             raise TypeError()
 
-        _score_arr = None
-        _test_arr = None
-        for _, _, test_arr, _ in iteratable_data.generate_inferenced_samples():
-            observed_arr, encoded_arr, decoded_arr, re_encoded_arr = self.inference(test_arr)
-            loss = self.compute_retrospective_loss(observed_arr, encoded_arr, decoded_arr, re_encoded_arr)
-            score_arr = loss.asnumpy()
-            if _score_arr is None:
-                _score_arr = score_arr
-            else:
-                _score_arr = np.r_[_score_arr, score_arr]
-            if _test_arr is None:
-                _test_arr = test_arr.asnumpy()
-            else:
-                _test_arr = np.r_[_test_arr, test_arr.asnumpy()]
-
-        score_list = _score_arr.tolist()
-        score_arr = _score_arr
-        test_arr = _test_arr
-
-        abstract_list = []
-        for i in range(limit):
-            key = score_arr.argmin()
-            seq_arr = test_arr[key]
-
-            score = score_list.pop(key)
-            score_arr = np.array(score_list)
-
-            token_arr = vectorizable_token.tokenize(seq_arr.tolist())
-            s = " ".join(token_arr.tolist())
-            _s = "".join(token_arr.tolist())
+        return self.extract_abstract_sentence_list(
+            self.generate_scored_samples(iteratable_data),
+            vectorizable_token,
+            sentence_list,
+            limit=limit,
+            ascending_flag=True
+        )
 
-            for sentence in sentence_list:
-                if s in sentence or _s in sentence:
-                    abstract_list.append(sentence)
-                    abstract_list = list(set(abstract_list))
+    def generate_scored_samples(self, iteratable_data):
+        '''
+        Score all sequences in predict mode, by the hybridized graph of static shapes.
+        See `StaticGraphInference.generate_scored_samples`.
 
-            if len(abstract_list) >= limit:
-                break
+        Args:
+            iteratable_data:        is-a `IteratableData`.
 
-        return abstract_list
+        Returns:
+            `Tuple` data for each batch. The padded rows are removed.
+            - `np.ndarray` of observed data points.
+            - `np.ndarray` of retrospective losses of each sequence.
+        '''
+        return self.__static_graph_inference.generate_scored_samples(
+            iteratable_data,
+            self.inference,
+            lambda test_arr, result, mask_arr: self.compute_retrospective_loss(*result, mask_arr=mask_arr),
+            self.__ctx
+        )
 
     def compute_retrospective_loss(
         self,
         observed_arr, 
         encoded_arr, 
         decoded_arr, 
-        re_encoded_arr
+        re_encoded_arr,
+        mask_arr=None
     ):
         '''
         Compute retrospective loss.
 
+        Args:
+            observed_arr:       `mxnet.ndarray` of observed data points.
+            encoded_arr:        `mxnet.ndarray` of encoded feature points.
+            decoded_arr:        `mxnet.ndarray` of decoded data points.
+            re_encoded_arr:     `mxnet.ndarray` of re-encoded feature points.
+            mask_arr:           `np.ndarray` of the mask of padded rows. `True` for the observed rows.
+                                The padded rows are excluded from the gradient clipping.
+                                If `None`, all rows are observed.
+
         Returns:
             The tuple data.
             - `np.ndarray` of delta.
@@ -574,17 +574,7 @@ class ReSeq2Seq(HybridBlock, AbstractableSemantics):
                 )
                 summary_delta_arr = nd.sqrt(nd.power(decoded_arr - target_arr, 2))
 
-        match_delta_arr = None
-        for i in range(self.__batch_size):
-            arr = nd.sqrt(nd.power(encoded_arr[i, -1] - re_encoded_arr[i, -1], 2))
-            if match_delta_arr is None:
-                match_delta_arr = nd.expand_dims(arr, axis=0)
-            else:
-                match_delta_arr = nd.concat(
-                    match_delta_arr,
-                    nd.expand_dims(arr, axis=0),
-                    dim=0
-                )
+        match_delta_arr = nd.sqrt(nd.power(encoded_arr[:, -1] - re_encoded_arr[:, -1], 2))
 
         """
         other_encoded_delta_arr = None
@@ -676,7 +666,15 @@ class ReSeq2Seq(HybridBlock, AbstractableSemantics):
         delta_arr = summary_delta_arr + nd.expand_dims(
             self.__retrospective_lambda * match_delta_arr, axis=1
         )
-        v = nd.norm(delta_arr)
+        if mask_arr is None:
+            v = nd.norm(delta_arr)
+        else:
+            v = nd.norm(
+                nd.broadcast_mul(
+                    delta_arr,
+                    nd.array(mask_arr, ctx=delta_arr.context).reshape((-1, 1, 1))
+                )
+            )
         if v > self.__grad_clip_threshold:
             delta_arr = delta_arr * self.__grad_clip_threshold / v
 
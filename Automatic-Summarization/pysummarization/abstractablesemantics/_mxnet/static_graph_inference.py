@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+from contextlib import contextmanager
+import numpy as np
+import mxnet.ndarray as nd
+from mxnet import autograd
+from mxnet import MXNetError
+from mxnet.gluon.block import HybridBlock
+
+from pysummarization.iteratabledata.token_iterator import TokenIterator
+
+
+class StaticGraphInference(object):
+    '''
+    Score the sequences by the hybridized graph of static shapes.
+
+    While the sequences are scored, the `HybridBlock`s are hybridized with 
+    `static_alloc` and `static_shape`, and then the states of hybridization 
+    set by the user are restored. If the graph can not be built, the states 
+    are restored at once, and the sequences are inferenced as before.
+
+    Gluon has no public API to read the states of hybridization. If the states 
+    can not be read in the installed version of MXNet, the graph of static shapes 
+    is not used.
+    '''
+
+    def __init__(self, block, logger):
+        '''
+        Init.
+
+        Args:
+            block:      is-a `mxnet.gluon.Block` to be hybridized.
+            logger:     is-a `logging.Logger`.
+        '''
+        self.__block = block
+        self.__logger = logger
+        # `True` if the graph of static shapes is built, `False` if it can not be built.
+        self.__static_graph_flag = None
+
+    def generate_scored_samples(self, iteratable_data, inference, compute_score, ctx):
+        '''
+        Score all sequences in predict mode.
+
+        If `iteratable_data` is-a `TokenIterator`, the last partial batch is padded and
+        masked, so that all windows are scored by the hybridized graph of static shapes.
+        Otherwise, the batches drawn by `generate_inferenced_samples` are scored.
+
+        Args:
+            iteratable_data:        is-a `IteratableData`.
+            inference:              The function to inference the `mxnet.ndarray` of observed data points.
+            compute_score:          The function to compute the `mxnet.ndarray` of scores of each sequence
+                                    from the observed data points, the result of `inference`, and the mask.
+            ctx:                    `mx.cpu()` or `mx.gpu()`.
+
+        Returns:
+            `Tuple` data for each batch. The padded rows are removed.
+            - `np.ndarray` of observed data points.
+            - `np.ndarray` of scores of each sequence.
+        '''
+        if isinstance(iteratable_data, TokenIterator) is True:
+            sample_generator = iteratable_data.generate_padded_samples()
+        else:
+            sample_generator = iteratable_data.generate_inferenced_samples()
+
+        with self.static_hybridization() as hybridization_list:
+            for _, _, test_arr, mask_arr in sample_generator:
+                if isinstance(test_arr, nd.NDArray) is False:
+                    test_arr = nd.ndarray.array(test_arr, ctx=ctx)
+                if isinstance(mask_arr, np.ndarray) is False:
+                    mask_arr = np.ones(test_arr.shape[0], dtype=bool)
+
+                with autograd.predict_mode():
+                    result = self.__inference(inference, test_arr, hybridization_list)
+                    score_arr = compute_score(test_arr, result, mask_arr)
+
+                yield test_arr.asnumpy()[mask_arr], score_arr.asnumpy()[mask_arr]
+
+    @contextmanager
+    def static_hybridization(self):
+        '''
+        Hybridize the `HybridBlock`s with static shapes in the context,
+        and restore the states of hybridization at exit.
+
+        Returns:
+            The context which gives `list` of the saved states of hybridization,
+            or `None` if the graph of static shapes is not used.
+        '''
+        hybridization_list = None
+        if self.__static_graph_flag is not False:
+            hybridization_list = self.__save_hybridization()
+            if hybridization_list is None:
+                self.__logger.debug("The states of hybridization can not be read.")
+                self.__static_graph_flag = False
+            else:
+                self.__block.hybridize(static_alloc=True, static_shape=True)
+
+        try:
+            yield hybridization_list
+        finally:
+            if hybridization_list is not None:
+                self.__restore_hybridization(hybridization_list)
+
+    def __inference(self, inference, observed_arr, hybridization_list):
+        '''
+        Inference by the graph of static shapes.
+        If the graph can not be built, the states of hybridization are restored
+        and the block is inferenced as before.
+
+        Args:
+            inference:              The function to inference.
+            observed_arr:           `mxnet.ndarray` of observed data points.
+            hybridization_list:     The saved states of hybridization.
+                                    If `None`, the graph of static shapes is not used.
+
+        Returns:
+            The result of `inference`.
+        '''
+        if hybridization_list is None or self.__static_graph_flag is False:
+            return inference(observed_arr)
+
+        try:
+            result = inference(observed_arr)
+            # The errors of the graph are raised in the asynchronous execution.
+            if isinstance(result, nd.NDArray) is True:
+                result.wait_to_read()
+            else:
+                for arr in result:
+                    arr.wait_to_read()
+            self.__static_graph_flag = True
+            return result
+        except (MXNetError, ValueError):
+            self.__logger.debug("The graph of static shapes can not be built.")
+            self.__static_graph_flag = False
+            self.__restore_hybridization(hybridization_list)
+            return inference(observed_arr)
+
+    def __save_hybridization(self):
+        '''
+        Save the states of hybridization of the block and its children.
+
+        Returns:
+            `list` of `tuple`s of the `HybridBlock` and its states,
+            or `None` if the states can not be read.
+        '''
+        hybridization_list = []
+
+        def save(block):
+            if isinstance(block, HybridBlock) is True:
+                hybridization_list.append((
+                    block,
+                    getattr(block, "_active", None),
+                    getattr(block, "_flags", None),
+                    getattr(block, "_backend", None)
+                ))
+
+        self.__block.apply(save)
+        for block, active, flags, _ in hybridization_list:
+            if isinstance(active, bool) is False or flags is None or hasattr(block, "_clear_cached_op") is False:
+                return None
+        return hybridization_list
+
+    def __restore_hybridization(self, hybridization_list):
+        '''
+        Restore the states of hybridization, clearing the cached graphs.
+
+        Args:
+            hybridization_list:     The saved states of hybridization.
+        '''
+        for block, active, flags, backend in hybridization_list:
+            block._active = active
+            block._flags = flags
+            if hasattr(block, "_backend") is True:
+                block._backend = backend
+            block._clear_cached_op()
+
+    def get_static_graph_flag(self):
+        ''' getter '''
+        return self.__static_graph_flag
+
+    def set_readonly(self, value):
+        ''' setter '''
+        raise TypeError("This property must be read-only.")
+
+    static_graph_flag = property(get_static_graph_flag, set_readonly)
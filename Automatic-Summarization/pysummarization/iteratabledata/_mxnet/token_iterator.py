@@ -86,3 +86,19 @@ class TokenIterator(_TokenIterator):
         for _, _, test_batch_arr, _ in super().generate_inferenced_samples():
             test_batch_arr = nd.ndarray.array(test_batch_arr, ctx=self.__ctx)
             yield None, None, test_batch_arr, None
+
+    def generate_padded_samples(self):
+        '''
+        Draw and generate all windows in ascending order.
+        The last partial batch is padded with zeros to `batch_size`.
+
+        Returns:
+            `Tuple` data. The shape is ...
+            - `None`.
+            - `None`.
+            - `mxnet.ndarray` of observed data points in test.
+            - `np.ndarray` of the mask. `True` for the windows, and `False` for the padded rows.
+        '''
+        for _, _, test_batch_arr, mask_arr in super().generate_padded_samples():
+            test_batch_arr = nd.ndarray.array(test_batch_arr, ctx=self.__ctx)
+            yield None, None, test_batch_arr, mask_arr
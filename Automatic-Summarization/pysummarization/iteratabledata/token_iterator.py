@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 from accelbrainbase.iteratable_data import IteratableData
 from pysummarization.vectorizable_token import VectorizableToken
+from pysummarization.vectorizabletoken.t_hot_vectorizer import THotVectorizer
 import numpy as np
 
 
@@ -52,30 +53,36 @@ class TokenIterator(IteratableData):
                                             - others : This class will not normalize the data.
 
             noiseable_data:         is-a `NoiseableData`.
+
+        If `vectorizable_token` is-a `THotVectorizer`, only the sequence of token ids 
+        is stored, and the one hot vectors are created in the reused buffers for each batch.
+        Otherwise, the sequence of token vectors is stored.
+        In both cases, the windows of `seq_len` tokens are not stored but indexed for each batch.
         '''
         self.vectorizable_token = vectorizable_token
-        vector_list = vectorizable_token.vectorize(token_list=token_arr.tolist())
-        vector_arr = np.array(vector_list)
-
-        observed_list = []
-        for i in range(seq_len, vector_arr.shape[0]):
-            observed_list.append(vector_arr[i-seq_len:i])
-        observed_arr = np.array(observed_list)
-
-        self.observed_arr = observed_arr
-
-        training_row = int(observed_arr.shape[0] * (1 - test_size))
-        key_arr = np.arange(observed_arr.shape[0])
+        if isinstance(vectorizable_token, THotVectorizer) is True:
+            self.__id_arr = vectorizable_token.convert_tokens_into_ids(token_arr.tolist())
+            self.__vector_arr = None
+            token_n = self.__id_arr.shape[0]
+        else:
+            self.__id_arr = None
+            self.__vector_arr = np.array(vectorizable_token.vectorize(token_list=token_arr.tolist()))
+            token_n = self.__vector_arr.shape[0]
+
+        # The window `k` is the tokens from `k` to `k + seq_len - 1`.
+        window_n = max(token_n - seq_len, 0)
+
+        training_row = int(window_n * (1 - test_size))
+        key_arr = np.arange(window_n)
         np.random.shuffle(key_arr)
-        training_arr = observed_arr[key_arr[:training_row]]
-        test_arr = observed_arr[key_arr[training_row:]]
+        self.__training_window_arr = key_arr[:training_row]
+        self.__test_window_arr = key_arr[training_row:]
+        self.__window_n = window_n
+        self.__buffer_dict = {}
 
-        dataset_size = training_arr.shape[0]
+        dataset_size = self.__training_window_arr.shape[0]
         iter_n = int(epochs * max(dataset_size / batch_size, 1))
 
-        self.training_arr = training_arr
-        self.test_arr = test_arr
-
         self.iter_n = iter_n
         self.epochs = epochs
         self.batch_size = batch_size
@@ -95,14 +102,20 @@ class TokenIterator(IteratableData):
             - `mxnet.ndarray` of supervised data in test.
         '''
         for _ in range(self.iter_n):
-            training_key_arr = np.arange(self.training_arr.shape[0])
-            test_key_arr = np.arange(self.test_arr.shape[0])
+            training_key_arr = np.arange(self.__training_window_arr.shape[0])
+            test_key_arr = np.arange(self.__test_window_arr.shape[0])
 
             np.random.shuffle(training_key_arr)
             np.random.shuffle(test_key_arr)
 
-            training_batch_arr = self.training_arr[training_key_arr[:self.batch_size]]
-            test_batch_arr = self.test_arr[test_key_arr[:self.batch_size]]
+            training_batch_arr = self.__create_windows(
+                self.__training_window_arr[training_key_arr[:self.batch_size]],
+                "training"
+            )
+            test_batch_arr = self.__create_windows(
+                self.__test_window_arr[test_key_arr[:self.batch_size]],
+                "test"
+            )
 
             training_batch_arr = self.pre_normalize(training_batch_arr)
             test_batch_arr = self.pre_normalize(test_batch_arr)
@@ -125,13 +138,70 @@ class TokenIterator(IteratableData):
             - file path.
         '''
         i = 0
-        while i + self.batch_size < self.observed_arr.shape[0]:
-            test_batch_arr = self.observed_arr[i:i+self.batch_size]
+        while i + self.batch_size < self.__window_n:
+            test_batch_arr = self.__create_windows(np.arange(i, i+self.batch_size), "inference")
             test_batch_arr = self.pre_normalize(test_batch_arr)
             i = i + self.batch_size
 
             yield None, None, test_batch_arr, None
 
+    def generate_padded_samples(self):
+        '''
+        Draw and generate all windows in ascending order.
+
+        Unlike `generate_inferenced_samples`, the last partial batch is not dropped
+        but padded with zeros to `batch_size`, so that the models of static shapes
+        can observe all windows. The padded rows are masked.
+
+        Returns:
+            `Tuple` data. The shape is ...
+            - `None`.
+            - `None`.
+            - `np.ndarray` of observed data points in test. The shape is: (`batch_size`, `seq_len`, dimension)
+            - `np.ndarray` of the mask. `True` for the windows, and `False` for the padded rows.
+        '''
+        for i in range(0, self.__window_n, self.batch_size):
+            window_arr = np.arange(i, min(i + self.batch_size, self.__window_n))
+            test_batch_arr = self.__create_windows(window_arr, "padded")
+            test_batch_arr = self.pre_normalize(test_batch_arr)
+
+            mask_arr = np.zeros(self.batch_size, dtype=bool)
+            mask_arr[:window_arr.shape[0]] = True
+            if window_arr.shape[0] < self.batch_size:
+                pad_arr = np.zeros(
+                    (self.batch_size - window_arr.shape[0], ) + test_batch_arr.shape[1:],
+                    dtype=test_batch_arr.dtype
+                )
+                test_batch_arr = np.concatenate([test_batch_arr, pad_arr], axis=0)
+
+            yield None, None, test_batch_arr, mask_arr
+
+    def __create_windows(self, window_arr, buffer_key=None):
+        '''
+        Create the batch of windows.
+
+        Args:
+            window_arr:     `np.ndarray` of the indices of windows.
+            buffer_key:     The key of the buffer of one hot vectors, which is reused 
+                            for the batches of the same key and shape.
+                            If `None`, the buffer is not reused.
+
+        Returns:
+            `np.ndarray` of vectors. The shape is: (batch size, `seq_len`, dimension)
+        '''
+        index_arr = window_arr[:, None] + np.arange(self.seq_len)[None, :]
+        if self.__id_arr is None:
+            return self.__vector_arr[index_arr]
+
+        id_arr = self.__id_arr[index_arr]
+        shape = id_arr.shape + (self.vectorizable_token.token_arr.shape[0], )
+        out = self.__buffer_dict.get(buffer_key)
+        if out is None or out.shape != shape:
+            out = np.zeros(shape, dtype=np.float64)
+            if buffer_key is not None:
+                self.__buffer_dict[buffer_key] = out
+        return self.vectorizable_token.convert_ids_into_matrix(id_arr, out=out)
+
     def pre_normalize(self, arr):
         '''
         Normalize before observation.
@@ -161,6 +231,36 @@ class TokenIterator(IteratableData):
         ''' setter '''
         raise TypeError("This property must be read-only.")
 
+    def get_observed_arr(self):
+        '''
+        getter
+
+        The windows are materialized in each call.
+        '''
+        return self.__create_windows(np.arange(self.__window_n))
+
+    observed_arr = property(get_observed_arr, set_readonly)
+
+    def get_training_arr(self):
+        '''
+        getter
+
+        The windows are materialized in each call.
+        '''
+        return self.__create_windows(self.__training_window_arr)
+
+    training_arr = property(get_training_arr, set_readonly)
+
+    def get_test_arr(self):
+        '''
+        getter
+
+        The windows are materialized in each call.
+        '''
+        return self.__create_windows(self.__test_window_arr)
+
+    test_arr = property(get_test_arr, set_readonly)
+
     def get_epochs(self):
         ''' getter '''
         return self.__epochs
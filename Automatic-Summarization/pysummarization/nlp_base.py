@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from abc import ABCMeta, abstractmethod
+import re
 from pysummarization.tokenizable_doc import TokenizableDoc
 
 
@@ -63,10 +64,88 @@ class NlpBase(object):
         '''
         self.token = self.tokenizable_doc.tokenize(data)
 
+    # The compiled regular expression of `delimiter_list` and its lookup tables.
+    __delimiter_key = None
+    __delimiter_pattern = None
+    __delimiter_level_dict = None
+    __delimiter_suffix_list = None
+
     def listup_sentence(self, data, counter=0):
         '''
         Divide string into sentence list.
 
+        Args:
+            data:               string.
+            counter:            recursive counter.
+
+        Returns:
+            List of sentences.
+
+        '''
+        if counter == 0:
+            return [sentence for sentence, _, _ in self.generate_sentence(data)]
+        return self.__listup_sentence_r(data, counter)
+
+    def generate_sentence(self, data):
+        '''
+        Divide string into sentences lazily.
+
+        The sentences are the same as `listup_sentence`. Each fragment is 
+        followed by its delimiter and all delimiters after that in `delimiter_list`.
+        If the delimiters are distinct single characters, the string is scanned 
+        once by the compiled regular expression. Otherwise, this method falls back 
+        to the recursive division, and the offsets are `None`.
+
+        Args:
+            data:               string.
+
+        Returns:
+            The generator of tuple data.
+            - The sentence.
+            - The start offset of the fragment in `data`.
+            - The end offset of the delimiter in `data`.
+
+        '''
+        delimiter_tuple = tuple(self.delimiter_list)
+        if len(delimiter_tuple) == 0 or len(set(delimiter_tuple)) != len(delimiter_tuple) \
+            or any([len(delimiter) != 1 for delimiter in delimiter_tuple]):
+            for sentence in self.__listup_sentence_r(data, 0):
+                yield sentence, None, None
+            return
+
+        if self.__delimiter_key != delimiter_tuple:
+            self.__delimiter_key = delimiter_tuple
+            self.__delimiter_pattern = re.compile(
+                "[" + "".join([re.escape(delimiter) for delimiter in delimiter_tuple]) + "]"
+            )
+            self.__delimiter_level_dict = {delimiter: k for k, delimiter in enumerate(delimiter_tuple)}
+            self.__delimiter_suffix_list = [
+                "".join(delimiter_tuple[k:]) for k in range(len(delimiter_tuple))
+            ]
+
+        level_dict = self.__delimiter_level_dict
+        suffix_list = self.__delimiter_suffix_list
+        # The end offsets of the last delimiters of each level.
+        last_end_list = [0] * len(delimiter_tuple)
+        start = 0
+        for match in self.__delimiter_pattern.finditer(data):
+            end = match.end()
+            level = level_dict[match.group()]
+            # The fragment is dropped if nothing is between this delimiter 
+            # and the last delimiter of the same or lower level.
+            if end - 1 > max(last_end_list[:level+1]):
+                yield data[start:end-1] + suffix_list[level], start, end
+            last_end_list[level] = end
+            start = end
+
+        # The end of data is regarded as the delimiter of the lowest level.
+        if len(data) > last_end_list[0]:
+            yield data[start:] + suffix_list[0], start, len(data)
+
+    def __listup_sentence_r(self, data, counter=0):
+        '''
+        Divide string into sentence list recursively for each delimiter.
+
         Args:
             data:               string.
             counter:            recursive counter.
@@ -80,7 +159,7 @@ class NlpBase(object):
         [sentence_list.append(sentence + delimiter) for sentence in data.split(delimiter) if sentence != ""]
         if counter + 1 < len(self.delimiter_list):
             sentence_list_r = []
-            [sentence_list_r.extend(self.listup_sentence(sentence, counter+1)) for sentence in sentence_list]
+            [sentence_list_r.extend(self.__listup_sentence_r(sentence, counter+1)) for sentence in sentence_list]
             sentence_list = sentence_list_r
 
         return sentence_list
@@ -1,7 +1,33 @@
 import nltk
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import os
+import time
 from pysummarization.nlp_base import NlpBase
 from pysummarization.abstractable_doc import AbstractableDoc
 from pysummarization.similarity_filter import SimilarityFilter
+from pysummarization.tokenized_document import TokenizedDocument
+
+# The objects for summarization in each worker process of `AutoAbstractor.summarize_many`.
+_worker_tuple = None
+
+
+def _init_worker(auto_abstractor, abstractor, similarity_filter):
+    '''
+    Initialize the worker process.
+    The objects, including tokenizers, are unpickled once per worker.
+    '''
+    global _worker_tuple
+    _worker_tuple = (auto_abstractor, abstractor, similarity_filter)
+
+
+def _summarize_in_worker(document):
+    '''
+    Summarize the document in the worker process.
+    '''
+    auto_abstractor, abstractor, similarity_filter = _worker_tuple
+    return auto_abstractor.summarize(document, abstractor, similarity_filter)
+
 
 class AutoAbstractor(NlpBase):
     '''
@@ -72,6 +98,8 @@ class AutoAbstractor(NlpBase):
             dict data.
             - "summarize_result": The list of summarized sentences., 
             - "scoring_data":     The list of scores.
+            - "timing_data":      The dict of elapsed seconds in each stage:
+                                  "split", "tokenize", "filter", and "score".
         '''
         if isinstance(document, str) is False:
             raise TypeError("The type of document must be str.")
@@ -82,53 +110,150 @@ class AutoAbstractor(NlpBase):
         if isinstance(similarity_filter, SimilarityFilter) is False and similarity_filter is not None:
             raise TypeError("The type of similarity_filter must be SimilarityFilter.")
 
-        normalized_sentences = self.listup_sentence(document)
+        timing_dict = {"split": 0.0, "tokenize": 0.0, "filter": 0.0, "score": 0.0}
+
+        start = time.perf_counter()
+        tokenized_document = TokenizedDocument(self, document)
+        timing_dict["split"] += time.perf_counter() - start
 
         # for filtering similar sentences.
         if similarity_filter is not None:
-            normalized_sentences = similarity_filter.similar_filter_r(normalized_sentences)
+            start = time.perf_counter()
+            token_list_list = tokenized_document.extract_token_list_list(similarity_filter.nlp_base)
+            timing_dict["tokenize"] += time.perf_counter() - start
+
+            start = time.perf_counter()
+            tokenized_document = tokenized_document.select(similarity_filter.filter_index(token_list_list))
+            timing_dict["filter"] += time.perf_counter() - start
+
+        normalized_sentences = tokenized_document.sentence_list
 
+        start = time.perf_counter()
         self.tokenize(document)
         words = self.token
+        tokenized_document.extract_position_dict_list()
+        timing_dict["tokenize"] += time.perf_counter() - start
 
+        start = time.perf_counter()
         fdist = nltk.FreqDist(words)
         top_n_words = [w[0] for w in fdist.items()][:self.target_n]
-        scored_list = self.__closely_associated_score(normalized_sentences, top_n_words)
+        scored_list = self.__closely_associated_score(tokenized_document, top_n_words)
         filtered_list = Abstractor.filter(scored_list)
         result_list = [normalized_sentences[idx] for (idx, score) in filtered_list]
+        timing_dict["score"] += time.perf_counter() - start
+
         result_dict = {
             "summarize_result": result_list,
-            "scoring_data": filtered_list
+            "scoring_data": filtered_list,
+            "timing_data": timing_dict
         }
         return result_dict
 
-    def __closely_associated_score(self, normalized_sentences, top_n_words):
+    def summarize_many(
+        self,
+        document_iter,
+        Abstractor,
+        similarity_filter=None,
+        worker_n=None,
+        max_in_flight=None
+    ):
+        '''
+        Execute summarization of many documents in the process pool.
+
+        This object, `Abstractor`, and `similarity_filter` are sent to each worker 
+        process once, when the worker is initialized. Then only the documents and 
+        the results are exchanged.
+
+        Args:
+            document_iter:      The iterable of target documents.
+            Abstractor:         The object of AbstractableDoc.
+            similarity_filter   The object of SimilarityFilter.
+            worker_n:           `int` of the number of worker processes.
+                                If `None`, `os.cpu_count()`.
+                                If `1`, the documents are summarized in this process.
+            max_in_flight:      `int` of the maximum number of documents which have been 
+                                submitted but not yielded. This bounds the memory.
+                                If `None`, `worker_n * 4`.
+
+        Returns:
+            The generator of the results of `summarize`, in the order of `document_iter`.
+        '''
+        if isinstance(Abstractor, AbstractableDoc) is False:
+            raise TypeError("The type of Abstractor must be AbstractableDoc.")
+
+        if isinstance(similarity_filter, SimilarityFilter) is False and similarity_filter is not None:
+            raise TypeError("The type of similarity_filter must be SimilarityFilter.")
+
+        if worker_n is None:
+            worker_n = os.cpu_count() or 1
+        if isinstance(worker_n, int) is False:
+            raise TypeError("The type of worker_n must be int.")
+        if worker_n <= 0:
+            raise ValueError("The value of worker_n must be more than 0.")
+
+        if max_in_flight is None:
+            max_in_flight = worker_n * 4
+        if isinstance(max_in_flight, int) is False:
+            raise TypeError("The type of max_in_flight must be int.")
+        if max_in_flight <= 0:
+            raise ValueError("The value of max_in_flight must be more than 0.")
+
+        return self.__summarize_many(
+            document_iter,
+            Abstractor,
+            similarity_filter,
+            worker_n,
+            max_in_flight
+        )
+
+    def __summarize_many(self, document_iter, Abstractor, similarity_filter, worker_n, max_in_flight):
+        '''
+        The generator of `summarize_many`.
+        '''
+        if worker_n == 1:
+            for document in document_iter:
+                yield self.summarize(document, Abstractor, similarity_filter)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=worker_n,
+            initializer=_init_worker,
+            initargs=(self, Abstractor, similarity_filter)
+        ) as executor:
+            future_deque = deque()
+            try:
+                for document in document_iter:
+                    if isinstance(document, str) is False:
+                        raise TypeError("The type of document must be str.")
+                    if len(future_deque) >= max_in_flight:
+                        yield future_deque.popleft().result()
+                    future_deque.append(executor.submit(_summarize_in_worker, document))
+
+                while len(future_deque) > 0:
+                    yield future_deque.popleft().result()
+            finally:
+                for future in future_deque:
+                    future.cancel()
+
+    def __closely_associated_score(self, tokenized_document, top_n_words):
         '''
         Scoring the sentence with closely associations.
 
         Args:
-            normalized_sentences:   The list of sentences.
+            tokenized_document:     `TokenizedDocument`.
             top_n_words:            Important sentences.
 
         Returns:
             The list of scores.
         '''
         scores_list = []
-        sentence_idx = -1
-
-        for sentence in normalized_sentences:
-            self.tokenize(sentence)
-            sentence = self.token
-
-            sentence_idx += 1
-            word_idx = []
-
-            for w in top_n_words:
-                try:
-                    word_idx.append(sentence.index(w))
-                except ValueError:
-                    pass
+        top_n_word_set = set(top_n_words)
 
+        for sentence_idx, position_dict in enumerate(tokenized_document.extract_position_dict_list()):
+            # The first positions of top-n words in the sentence.
+            word_idx = [
+                position_list[0] for w, position_list in position_dict.items() if w in top_n_word_set
+            ]
             word_idx.sort()
 
             if len(word_idx) == 0:
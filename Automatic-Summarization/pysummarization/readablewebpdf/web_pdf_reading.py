@@ -1,11 +1,32 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from io import StringIO
 from pdfminer.pdfpage import PDFPage
 from pdfminer.pdfinterp import PDFResourceManager
 from pdfminer.pdfinterp import PDFPageInterpreter
 from pdfminer.converter import TextConverter
 from pdfminer.layout import LAParams
+import os
+import tempfile
+import urllib.error
 import urllib.request
 from pysummarization.readable_web_pdf import ReadableWebPDF
+from pysummarization.web_cache import WebCache
+
+
+def _extract_page_text(path, start, end):
+    '''
+    Extract the texts of pages in the worker process.
+
+    Args:
+        path:   path to PDF file.
+        start:  The first page number.
+        end:    The last page number (exclusive).
+
+    Returns:
+        `list` of texts of pages.
+    '''
+    return list(WebPDFReading().generate_page_text(path, page_range=(start, end)))
 
 
 class WebPDFReading(ReadableWebPDF):
@@ -13,10 +34,31 @@ class WebPDFReading(ReadableWebPDF):
     Read the PDF.
     '''
 
+    # Object of WebCache.
+    __web_cache = None
+
+    def get_web_cache(self):
+        ''' getter '''
+        return self.__web_cache
+
+    def set_web_cache(self, value):
+        ''' setter '''
+        if isinstance(value, WebCache) is False and value is not None:
+            raise TypeError("The type of __web_cache must be WebCache.")
+        self.__web_cache = value
+
+    web_cache = property(get_web_cache, set_web_cache)
+
     def url_to_text(self, url):
         '''
         Download PDF file and transform its document to string.
 
+        If `web_cache` is not `None`, the PDF file and the text are cached, 
+        and the cached PDF file is parsed without temporary files.
+        The PDF file is pinned in `web_cache` while it is parsed. If it has been 
+        evicted already, for example because it is larger than `max_byte_size` 
+        of `web_cache`, the downloaded bytes are parsed via a temporary file.
+
         Args:
             url:   PDF url.
 
@@ -24,8 +66,88 @@ class WebPDFReading(ReadableWebPDF):
             string.
 
         '''
-        path, headers = urllib.request.urlretrieve(url)
-        return self.path_to_text(path)
+        if self.web_cache is None:
+            with urllib.request.urlopen(url) as f:
+                body = f.read()
+            return self.__bytes_to_text(body)
+
+        content_hash, body = self.__fetch(url)
+        pinned_hash = content_hash
+        self.web_cache.pin(pinned_hash)
+        try:
+            text = self.web_cache.load_text(content_hash, "web_pdf_reading")
+            if text is not None:
+                return text
+
+            path = self.web_cache.extract_path(content_hash)
+            if path is not None:
+                text = self.path_to_text(path)
+            else:
+                if body is None:
+                    # The cached content was evicted before it was pinned.
+                    content_hash, body = self.__fetch(url, revalidate_flag=False)
+                text = self.__bytes_to_text(body)
+            self.web_cache.save_text(content_hash, "web_pdf_reading", text)
+            return text
+        finally:
+            self.web_cache.unpin(pinned_hash)
+
+    def __bytes_to_text(self, body):
+        '''
+        Transform the bytes of PDF file to string via a temporary file.
+
+        Args:
+            body:   `bytes` of PDF file.
+
+        Returns:
+            string.
+        '''
+        fd, path = tempfile.mkstemp(suffix=".pdf")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(body)
+            return self.path_to_text(path)
+        finally:
+            os.remove(path)
+
+    def __fetch(self, url, revalidate_flag=True):
+        '''
+        Fetch PDF file into `web_cache`.
+
+        Args:
+            url:                PDF url.
+            revalidate_flag:    If `False`, the cached entry is ignored.
+
+        Returns:
+            Tuple data.
+            - The hash of PDF file in `web_cache`.
+            - `bytes` of PDF file if it was downloaded, or `None` if the cached file is used.
+        '''
+        entry_dict = None
+        if revalidate_flag is True:
+            entry_dict = self.web_cache.lookup(url)
+            if entry_dict is not None and entry_dict["fresh_flag"] is True:
+                return entry_dict["content_hash"], None
+
+        req = urllib.request.Request(url=url, headers=self.web_cache.create_validator_header(entry_dict))
+        try:
+            with urllib.request.urlopen(req) as f:
+                body = f.read()
+                headers = f.headers
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and entry_dict is not None:
+                self.web_cache.revalidate(url)
+                return entry_dict["content_hash"], None
+            raise
+
+        content_hash = self.web_cache.save_bytes(
+            url,
+            body,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+            content_type=headers.get("Content-Type")
+        )
+        return content_hash, body
 
     def path_to_text(self, path):
         '''
@@ -38,6 +160,54 @@ class WebPDFReading(ReadableWebPDF):
             string.
 
         '''
+        return "".join(self.generate_page_text(path))
+
+    def generate_page_text(self, path, page_range=None, worker_n=1, page_n_per_task=10, max_in_flight=None):
+        '''
+        Transform local PDF file to strings page by page.
+
+        Args:
+            path:               path to PDF file.
+            page_range:         `tuple` of the first page number and the last page number (exclusive).
+                                If `None`, all pages.
+            worker_n:           `int` of the number of worker processes.
+                                If `1`, the pages are parsed in this process.
+            page_n_per_task:    `int` of the number of pages parsed by a worker process at once.
+            max_in_flight:      `int` of the maximum number of tasks which have been submitted 
+                                but not generated. If `None`, `worker_n * 2`.
+
+        Returns:
+            The generator of strings of pages, in the order of pages.
+
+        '''
+        if path is None:
+            raise ValueError("The path to PDF file must not be None.")
+        if isinstance(worker_n, int) is False:
+            raise TypeError("The type of worker_n must be int.")
+        if worker_n <= 0:
+            raise ValueError("The value of worker_n must be more than 0.")
+        if isinstance(page_n_per_task, int) is False:
+            raise TypeError("The type of page_n_per_task must be int.")
+        if page_n_per_task <= 0:
+            raise ValueError("The value of page_n_per_task must be more than 0.")
+        if max_in_flight is None:
+            max_in_flight = worker_n * 2
+
+        if worker_n == 1:
+            return self.__generate_page_text(path, page_range)
+        return self.__generate_page_text_parallel(path, page_range, worker_n, page_n_per_task, max_in_flight)
+
+    def __generate_page_text(self, path, page_range):
+        '''
+        Parse pages in this process.
+
+        Args:
+            path:           path to PDF file.
+            page_range:     `tuple` of the first page number and the last page number (exclusive).
+
+        Returns:
+            The generator of strings of pages.
+        '''
         rsrcmgr = PDFResourceManager()
         retstr = StringIO()
         codec = 'utf-8'
@@ -49,26 +219,78 @@ class WebPDFReading(ReadableWebPDF):
         maxpages = 0
         caching = True
         pagenos = set()
+        if page_range is not None:
+            pagenos = set(range(page_range[0], page_range[1]))
+            maxpages = page_range[1]
 
-        pages_data = PDFPage.get_pages(
-            fp,
-            pagenos,
-            maxpages=maxpages,
-            password=password,
-            caching=caching,
-            check_extractable=True
-        )
+        try:
+            if page_range is not None and page_range[0] >= page_range[1]:
+                return
+
+            pages_data = PDFPage.get_pages(
+                fp,
+                pagenos,
+                maxpages=maxpages,
+                password=password,
+                caching=caching,
+                check_extractable=True
+            )
+
+            # The text of each page is taken out of the buffer, which is cleared for the next page.
+            for page in pages_data:
+                interpreter.process_page(page)
+                text = retstr.getvalue()
+                retstr.seek(0)
+                retstr.truncate(0)
+                yield text.replace("\n", "")
+        finally:
+            fp.close()
+            device.close()
+            retstr.close()
+
+    def __generate_page_text_parallel(self, path, page_range, worker_n, page_n_per_task, max_in_flight):
+        '''
+        Parse the ranges of pages in worker processes.
+
+        Args:
+            path:               path to PDF file.
+            page_range:         `tuple` of the first page number and the last page number (exclusive).
+            worker_n:           `int` of the number of worker processes.
+            page_n_per_task:    `int` of the number of pages parsed by a worker process at once.
+            max_in_flight:      `int` of the maximum number of tasks which have been submitted but not generated.
+
+        Returns:
+            The generator of strings of pages.
+        '''
+        with open(path, 'rb') as fp:
+            page_n = sum(1 for _ in PDFPage.get_pages(fp, check_extractable=True))
 
-        for page in pages_data:
-            interpreter.process_page(page)
+        start, end = 0, page_n
+        if page_range is not None:
+            start, end = max(page_range[0], 0), min(page_range[1], page_n)
 
-        text = retstr.getvalue()
-        text = text.replace("\n", "")
+        with ProcessPoolExecutor(max_workers=worker_n) as executor:
+            future_deque = deque()
+            try:
+                for task_start in range(start, end, page_n_per_task):
+                    if len(future_deque) >= max_in_flight:
+                        for text in future_deque.popleft().result():
+                            yield text
+                    future_deque.append(
+                        executor.submit(
+                            _extract_page_text,
+                            path,
+                            task_start,
+                            min(task_start + page_n_per_task, end)
+                        )
+                    )
 
-        fp.close()
-        device.close()
-        retstr.close()
-        return text
+                while len(future_deque) > 0:
+                    for text in future_deque.popleft().result():
+                        yield text
+            finally:
+                for future in future_deque:
+                    future.cancel()
 
     def is_pdf_url(self, url):
         '''
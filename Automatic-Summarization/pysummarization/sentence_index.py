@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+from bisect import bisect_right
+
+
+class SentenceIndex(object):
+    '''
+    The index to search the sentences which contain the token sequences.
+
+    The sentences are joined into one text by the null character, and the
+    start offsets of sentences are kept in ascending order. So one search of
+    the text finds all sentences containing the sequence, and the sentence
+    of each occurrence is found by the binary search of offsets.
+    The results are cached for each sequence.
+    '''
+
+    # The separator of sentences, which never appears in the token sequences.
+    __separator = "\0"
+
+    def __init__(self, sentence_list):
+        '''
+        Init.
+
+        Args:
+            sentence_list:  `list` of sentences.
+        '''
+        start_list = []
+        start = 0
+        for sentence in sentence_list:
+            start_list.append(start)
+            start += len(sentence) + len(self.__separator)
+
+        self.__sentence_list = sentence_list
+        self.__text = self.__separator.join(sentence_list)
+        self.__start_list = start_list
+        self.__index_list_dict = {}
+
+    def search(self, query):
+        '''
+        Search the sentences which contain the string.
+
+        Args:
+            query:      `str` of the token sequence.
+
+        Returns:
+            `list` of indices of sentences in ascending order.
+        '''
+        if query in self.__index_list_dict:
+            return self.__index_list_dict[query]
+
+        if query == "":
+            index_list = list(range(len(self.__sentence_list)))
+        elif self.__separator in query:
+            index_list = [i for i, sentence in enumerate(self.__sentence_list) if query in sentence]
+        else:
+            index_list = []
+            position = self.__text.find(query)
+            while position != -1:
+                i = bisect_right(self.__start_list, position) - 1
+                index_list.append(i)
+                if i + 1 >= len(self.__start_list):
+                    break
+                # Skip the rest of the sentence.
+                position = self.__text.find(query, self.__start_list[i + 1])
+
+        self.__index_list_dict[query] = index_list
+        return index_list
+
+    def extract_sentence_list(self, token_list):
+        '''
+        Extract the sentences which contain the token sequence.
+
+        The tokens are joined by the space, as in the languages such as English,
+        and joined without the separator, as in the languages such as Japanese.
+
+        Args:
+            token_list:     `list` of tokens.
+
+        Returns:
+            `list` of sentences in the order of `sentence_list`.
+        '''
+        index_set = set(self.search(" ".join(token_list)))
+        index_set |= set(self.search("".join(token_list)))
+        return [self.__sentence_list[i] for i in sorted(index_set)]
+
+    def get_sentence_list(self):
+        ''' getter '''
+        return self.__sentence_list
+
+    def set_readonly(self, value):
+        ''' setter '''
+        raise TypeError("This property must be read-only.")
+
+    sentence_list = property(get_sentence_list, set_readonly)
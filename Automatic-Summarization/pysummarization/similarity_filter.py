@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 from abc import ABCMeta, abstractmethod
+import numpy as np
 from pysummarization.nlp_base import NlpBase
+from pysummarization.similarityfilter.min_hash_lsh import MinHashLSH
 
 
 class SimilarityFilter(metaclass=ABCMeta):
@@ -44,6 +46,21 @@ class SimilarityFilter(metaclass=ABCMeta):
 
     similarity_limit = property(get_similarity_limit, set_similarity_limit)
 
+    # MinHashLSH to extract the candidate pairs. If `None`, all pairs are compared.
+    __min_hash_lsh = None
+
+    def get_min_hash_lsh(self):
+        ''' getter '''
+        return self.__min_hash_lsh
+
+    def set_min_hash_lsh(self, value):
+        ''' setter '''
+        if value is not None and isinstance(value, MinHashLSH) is False:
+            raise TypeError("The type of value must be MinHashLSH.")
+        self.__min_hash_lsh = value
+
+    min_hash_lsh = property(get_min_hash_lsh, set_min_hash_lsh)
+
     @abstractmethod
     def calculate(self, token_list_x, token_list_y):
         '''
@@ -93,35 +110,194 @@ class SimilarityFilter(metaclass=ABCMeta):
                 token_dict[token] = 1
         return token_dict
 
+    def calculate_matrix(self, token_list_list):
+        '''
+        Calculate similarities of all pairs of token lists at once.
+
+        This method can be overrided, if the similarities of all pairs can be 
+        calculated faster than by `calculate` pair by pair.
+
+        Args:
+            token_list_list:    [[token, token, ...], [token, token, ...], ...]
+
+        Returns:
+            `np.ndarray` whose element `[i, j]` is the similarity of
+            `token_list_list[i]` and `token_list_list[j]`,
+            or `None` if the similarities are calculated by `calculate` pair by pair.
+        '''
+        return None
+
+    def calculate_product_matrix(self, weight_dict_list_x, weight_dict_list_y=None):
+        '''
+        Calculate the product of sparse matrices, whose rows are given as `dict`s.
+
+        Args:
+            weight_dict_list_x:     [{token: weight, ...}, {token: weight, ...}, ...]
+            weight_dict_list_y:     [{token: weight, ...}, {token: weight, ...}, ...]
+                                    If `None`, this is `weight_dict_list_x`.
+
+        Returns:
+            `np.ndarray` whose element `[i, j]` is the sum of products of weights 
+            of the tokens which both `weight_dict_list_x[i]` and `weight_dict_list_y[j]` have.
+        '''
+        if weight_dict_list_y is None:
+            weight_dict_list_y = weight_dict_list_x
+
+        posting_dict_x = self.__create_posting_dict(weight_dict_list_x)
+        if weight_dict_list_y is weight_dict_list_x:
+            posting_dict_y = posting_dict_x
+        else:
+            posting_dict_y = self.__create_posting_dict(weight_dict_list_y)
+
+        product_arr = np.zeros((len(weight_dict_list_x), len(weight_dict_list_y)))
+        for token, (row_list_x, weight_list_x) in posting_dict_x.items():
+            if token not in posting_dict_y:
+                continue
+            row_list_y, weight_list_y = posting_dict_y[token]
+            product_arr[np.ix_(row_list_x, row_list_y)] += np.outer(weight_list_x, weight_list_y)
+
+        return product_arr
+
+    def calculate_common_matrix(self, token_list_list):
+        '''
+        Count the unique tokens which each pair of token lists have in common.
+
+        Args:
+            token_list_list:    [[token, token, ...], [token, token, ...], ...]
+
+        Returns:
+            Tuple data.
+            - `np.ndarray` of the numbers of common tokens. The shape is: (n, n)
+            - `np.ndarray` of the numbers of unique tokens. The shape is: (n, )
+        '''
+        weight_dict_list = [dict.fromkeys(token_list, 1.0) for token_list in token_list_list]
+        common_arr = self.calculate_product_matrix(weight_dict_list)
+        size_arr = np.array([len(weight_dict) for weight_dict in weight_dict_list], dtype=np.float64)
+        return common_arr, size_arr
+
+    def __create_posting_dict(self, weight_dict_list):
+        '''
+        Create the posting lists of tokens.
+
+        Args:
+            weight_dict_list:   [{token: weight, ...}, {token: weight, ...}, ...]
+
+        Returns:
+            {token: ([row, row, ...], [weight, weight, ...])}
+        '''
+        posting_dict = {}
+        for row, weight_dict in enumerate(weight_dict_list):
+            for token, weight in weight_dict.items():
+                row_list, weight_list = posting_dict.setdefault(token, ([], []))
+                row_list.append(row)
+                weight_list.append(weight)
+        return posting_dict
+
     def similar_filter_r(self, sentence_list):
         '''
         Filter mutually similar sentences.
-        
+
+        Each sentence is tokenized once, and filtered by `filter_index`.
+
         Args:
             sentence_list:    The list of sentences.
 
         Returns:
             The list of filtered sentences.
         '''
-        result_list = []
-        recursive_list = []
-
-        try:
-            self.nlp_base.tokenize(sentence_list[0])
-            subject_token = self.nlp_base.token
-            result_list.append(sentence_list[0])
-            if len(sentence_list) > 1:
-                for i in range(len(sentence_list)):
-                    if i > 0:
-                        self.nlp_base.tokenize(sentence_list[i])
-                        object_token = self.nlp_base.token
-                        similarity = self.calculate(subject_token, object_token)
-                        if similarity <= self.similarity_limit:
-                            recursive_list.append(sentence_list[i])
-
-            if len(recursive_list) > 0:
-                result_list.extend(self.similar_filter_r(recursive_list))
-        except IndexError:
-            result_list = sentence_list
-
-        return result_list
+        if len(sentence_list) == 0:
+            return sentence_list
+
+        token_list_list = []
+        for sentence in sentence_list:
+            self.nlp_base.tokenize(sentence)
+            token_list_list.append(self.nlp_base.token)
+
+        return [sentence_list[i] for i in self.filter_index(token_list_list)]
+
+    def filter_index(self, token_list_list):
+        '''
+        Filter mutually similar token lists.
+
+        From the first token list, the token lists are kept in order unless 
+        the similarity to any kept token list before them is more than `similarity_limit`.
+
+        If `calculate_matrix` returns the similarities of all pairs, they are used.
+        Otherwise, only each kept token list and the token lists after it 
+        which are not filtered yet are compared by `calculate`.
+
+        If `min_hash_lsh` is not `None`, only the candidate pairs which share 
+        a bucket of LSH are compared by `calculate`, so that the similarities 
+        of all pairs are not stored. This mode approximates the filtering 
+        by the Jaccard coefficient of the sets of tokens, and suits `Jaccard`, 
+        `Dice`, `Simpson`, and `Tanimoto`.
+
+        Args:
+            token_list_list:    [[token, token, ...], [token, token, ...], ...]
+
+        Returns:
+            The list of indices of kept token lists.
+        '''
+        if len(token_list_list) == 0:
+            return []
+
+        if self.__min_hash_lsh is not None:
+            return self.__lsh_filter_index(token_list_list)
+
+        similarity_arr = self.calculate_matrix(token_list_list)
+
+        alive_arr = np.ones(len(token_list_list), dtype=bool)
+        index_list = []
+        for i in range(len(token_list_list)):
+            if not alive_arr[i]:
+                continue
+            index_list.append(i)
+            if similarity_arr is not None:
+                alive_arr[i+1:] = np.logical_and(
+                    alive_arr[i+1:],
+                    similarity_arr[i, i+1:] <= self.similarity_limit
+                )
+            else:
+                for j in np.flatnonzero(alive_arr[i+1:]) + i + 1:
+                    if self.calculate(token_list_list[i], token_list_list[j]) > self.similarity_limit:
+                        alive_arr[j] = False
+
+        return index_list
+
+    def __lsh_filter_index(self, token_list_list):
+        '''
+        Filter mutually similar token lists, comparing the candidate pairs of LSH only.
+
+        Args:
+            token_list_list:    [[token, token, ...], [token, token, ...], ...]
+
+        Returns:
+            The list of indices of kept token lists.
+        '''
+        bucket_arr = self.__min_hash_lsh.extract_bucket(token_list_list)
+
+        # The members of each bucket in each band.
+        member_list = []
+        for band in range(bucket_arr.shape[1]):
+            order_arr = np.argsort(bucket_arr[:, band], kind="stable")
+            key_arr, start_arr = np.unique(bucket_arr[order_arr, band], return_index=True)
+            member_list.append(dict(zip(key_arr.tolist(), np.split(order_arr, start_arr[1:]))))
+
+        alive_arr = np.ones(len(token_list_list), dtype=bool)
+        index_list = []
+        for i in range(len(token_list_list)):
+            if not alive_arr[i]:
+                continue
+            index_list.append(i)
+            if bucket_arr[i, 0] < 0:
+                continue
+
+            candidate_arr = np.unique(np.concatenate([
+                member_list[band][bucket_arr[i, band]] for band in range(bucket_arr.shape[1])
+            ]))
+            candidate_arr = candidate_arr[candidate_arr > i]
+            for j in candidate_arr[alive_arr[candidate_arr]]:
+                if self.calculate(token_list_list[i], token_list_list[j]) > self.similarity_limit:
+                    alive_arr[j] = False
+
+        return index_list
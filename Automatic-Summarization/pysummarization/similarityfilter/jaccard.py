@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import numpy as np
 from pysummarization.similarity_filter import SimilarityFilter
 
 
@@ -27,3 +28,19 @@ class Jaccard(SimilarityFilter):
         except ZeroDivisionError:
             result = 0.0
         return result
+
+    def calculate_matrix(self, token_list_list):
+        '''
+        Calculate similarities of all pairs of token lists at once.
+        
+        Override.
+        
+        Args:
+            token_list_list:    [[token, token, ...], [token, token, ...], ...]
+        
+        Returns:
+            `np.ndarray` of similarities.
+        '''
+        common_arr, size_arr = self.calculate_common_matrix(token_list_list)
+        union_arr = size_arr[:, None] + size_arr[None, :] - common_arr
+        return np.divide(common_arr, union_arr, out=np.zeros_like(common_arr), where=union_arr > 0)
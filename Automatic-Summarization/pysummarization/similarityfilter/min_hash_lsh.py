@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+
+class MinHashLSH(object):
+    '''
+    Locality-Sensitive Hashing of MinHash signatures to extract
+    the candidate pairs of similar sentences.
+
+    The MinHash signature of the set of tokens consists of `band_n * row_n` minimum
+    values of random hash functions. The probability that two signatures have the same
+    value in each row is the Jaccard coefficient `s` of the sets, so the probability
+    that two sentences share at least one of `band_n` bands of `row_n` rows is
+    `1 - (1 - s ** row_n) ** band_n`. Increasing `band_n` raises the recall, and
+    increasing `row_n` raises the precision. The threshold of this S-curve is
+    approximately `(1 / band_n) ** (1 / row_n)`.
+
+    References:
+        - Broder, A. Z. (1997, June). On the resemblance and containment of documents. In Proceedings. Compression and Complexity of SEQUENCES 1997 (pp. 21-29). IEEE.
+        - Leskovec, J., Rajaraman, A., & Ullman, J. D. (2014). Mining of massive datasets. Cambridge university press.
+    '''
+
+    # Mersenne prime for the universal hashing.
+    __prime = (1 << 31) - 1
+
+    def __init__(self, band_n=20, row_n=5, seed=None, chunk_size=10000000):
+        '''
+        Init.
+
+        Args:
+            band_n:         `int` of the number of bands.
+            row_n:          `int` of the number of rows in each band.
+            seed:           `int` of the seed of random hash functions.
+            chunk_size:     `int` of the number of hash values computed at once.
+                            This bounds the memory to compute signatures.
+        '''
+        if isinstance(band_n, int) is False:
+            raise TypeError("The type of `band_n` must be `int`.")
+        if isinstance(row_n, int) is False:
+            raise TypeError("The type of `row_n` must be `int`.")
+        if isinstance(chunk_size, int) is False:
+            raise TypeError("The type of `chunk_size` must be `int`.")
+        if band_n <= 0 or row_n <= 0 or chunk_size <= 0:
+            raise ValueError("The values of `band_n`, `row_n`, and `chunk_size` must be more than `0`.")
+
+        random_state = np.random.RandomState(seed)
+        self.__a_arr = random_state.randint(1, self.__prime, size=band_n * row_n).astype(np.int64)
+        self.__b_arr = random_state.randint(0, self.__prime, size=band_n * row_n).astype(np.int64)
+        self.__band_n = band_n
+        self.__row_n = row_n
+        self.__chunk_size = chunk_size
+
+    def compute_signature(self, token_list_list):
+        '''
+        Compute MinHash signatures.
+
+        Args:
+            token_list_list:    [[token, token, ...], [token, token, ...], ...]
+
+        Returns:
+            `np.ndarray` of signatures. The shape is: (the number of token lists, `band_n * row_n`)
+            The rows of empty token lists are filled with the maximum hash value.
+        '''
+        token_id_dict = {}
+        id_list = []
+        start_list = []
+        for token_list in token_list_list:
+            start_list.append(len(id_list))
+            for token in set(token_list):
+                id_list.append(token_id_dict.setdefault(token, len(token_id_dict)))
+
+        id_arr = np.array(id_list, dtype=np.int64)
+        start_arr = np.array(start_list, dtype=np.int64)
+        signature_arr = np.full((len(token_list_list), self.__a_arr.shape[0]), self.__prime, dtype=np.int64)
+        if id_arr.shape[0] == 0:
+            return signature_arr
+
+        empty_arr = np.diff(np.append(start_arr, id_arr.shape[0])) == 0
+        start_arr = start_arr[~empty_arr]
+
+        step = max(1, self.__chunk_size // id_arr.shape[0])
+        for i in range(0, self.__a_arr.shape[0], step):
+            hash_arr = (self.__a_arr[i:i+step, None] * id_arr[None, :] + self.__b_arr[i:i+step, None]) % self.__prime
+            signature_arr[~empty_arr, i:i+step] = np.minimum.reduceat(hash_arr, start_arr, axis=1).T
+
+        return signature_arr
+
+    def extract_bucket(self, token_list_list):
+        '''
+        Hash the token lists into the buckets of each band.
+
+        Args:
+            token_list_list:    [[token, token, ...], [token, token, ...], ...]
+
+        Returns:
+            `np.ndarray` of bucket ids. The shape is: (the number of token lists, `band_n`)
+            The token lists in the same bucket of any band are the candidate pairs.
+            Empty token lists are assigned to the bucket `-1`, which is never a candidate.
+        '''
+        signature_arr = self.compute_signature(token_list_list)
+        empty_arr = np.array([len(token_list) == 0 for token_list in token_list_list], dtype=bool)
+        bucket_arr = np.empty((len(token_list_list), self.__band_n), dtype=np.int64)
+        for band in range(self.__band_n):
+            _, bucket_arr[:, band] = np.unique(
+                signature_arr[:, band*self.__row_n:(band+1)*self.__row_n],
+                axis=0,
+                return_inverse=True
+            )
+        bucket_arr[empty_arr] = -1
+        return bucket_arr
+
+    def get_band_n(self):
+        ''' getter '''
+        return self.__band_n
+
+    def get_row_n(self):
+        ''' getter '''
+        return self.__row_n
+
+    def get_threshold(self):
+        ''' getter '''
+        return (1 / self.__band_n) ** (1 / self.__row_n)
+
+    def set_readonly(self, value):
+        ''' setter '''
+        raise TypeError("This property must be read-only.")
+
+    band_n = property(get_band_n, set_readonly)
+    row_n = property(get_row_n, set_readonly)
+    threshold = property(get_threshold, set_readonly)
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import numpy as np
 from pysummarization.similarity_filter import SimilarityFilter
 
 
@@ -22,3 +23,29 @@ class Tanimoto(SimilarityFilter):
         '''
         match_list = [tanimoto_value for tanimoto_value in token_list_x if tanimoto_value in token_list_y]
         return float(len(match_list) / (len(token_list_x) + len(token_list_y) - len(match_list)))
+
+    def calculate_matrix(self, token_list_list):
+        '''
+        Calculate similarities of all pairs of token lists at once.
+        
+        Override.
+        
+        Args:
+            token_list_list:    [[token, token, ...], [token, token, ...], ...]
+        
+        Returns:
+            `np.ndarray` of similarities.
+        '''
+        count_dict_list = []
+        for token_list in token_list_list:
+            count_dict = {}
+            for token in token_list:
+                count_dict[token] = count_dict.get(token, 0.0) + 1.0
+            count_dict_list.append(count_dict)
+        weight_dict_list = [dict.fromkeys(token_list, 1.0) for token_list in token_list_list]
+
+        # The number of tokens in `x` which are found in `y`.
+        match_arr = self.calculate_product_matrix(count_dict_list, weight_dict_list)
+        size_arr = np.array([len(token_list) for token_list in token_list_list], dtype=np.float64)
+        denominator_arr = size_arr[:, None] + size_arr[None, :] - match_arr
+        return np.divide(match_arr, denominator_arr, out=np.zeros_like(match_arr), where=denominator_arr > 0)
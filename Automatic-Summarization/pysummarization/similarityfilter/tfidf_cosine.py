@@ -50,3 +50,61 @@ class TfIdfCosine(SimilarityFilter):
                 return result
         except ZeroDivisionError:
             return 0.0
+
+    def calculate_matrix(self, token_list_list):
+        '''
+        Calculate the Cosine similarities of Tf-Idf vectors of all pairs of token lists at once.
+
+        Override.
+
+        The Tf-Idf vectors of `calculate` depend on the collection of each pair,
+        so they can not be calculated at once. Only if `document_idf_flag` is `True`,
+        each token list is regarded as one document in the collection of `token_list_list`,
+        and the Idf of a token is
+        `log(the number of token lists / the number of token lists which include the token)`.
+
+        Args:
+            token_list_list:    [[token, token, ...], [token, token, ...], ...]
+
+        Returns:
+            `np.ndarray` of similarities, 
+            or `None` if `document_idf_flag` is `False`.
+        '''
+        if self.document_idf_flag is False:
+            return None
+
+        df_dict = {}
+        for token_list in token_list_list:
+            for token in set(token_list):
+                df_dict[token] = df_dict.get(token, 0) + 1
+
+        weight_dict_list = []
+        for token_list in token_list_list:
+            weight_dict = {}
+            for token in token_list:
+                weight_dict[token] = weight_dict.get(token, 0.0) + 1.0
+            for token in weight_dict.keys():
+                tf = weight_dict[token] / len(token_list)
+                idf = np.log(len(token_list_list) / df_dict[token])
+                weight_dict[token] = tf * idf
+            weight_dict_list.append(weight_dict)
+
+        dot_arr = self.calculate_product_matrix(weight_dict_list)
+        norm_arr = np.sqrt(np.diag(dot_arr))
+        norm_arr = norm_arr[:, None] * norm_arr[None, :]
+        return np.divide(dot_arr, norm_arr, out=np.zeros_like(dot_arr), where=norm_arr > 0)
+
+    # If `True`, `calculate_matrix` calculates the similarities at once with the Idf of the whole document.
+    __document_idf_flag = False
+
+    def get_document_idf_flag(self):
+        ''' getter '''
+        return self.__document_idf_flag
+
+    def set_document_idf_flag(self, value):
+        ''' setter '''
+        if isinstance(value, bool) is False:
+            raise TypeError("The type of document_idf_flag must be bool.")
+        self.__document_idf_flag = value
+
+    document_idf_flag = property(get_document_idf_flag, set_document_idf_flag)
@@ -20,3 +20,17 @@ class TokenizableDoc(metaclass=ABCMeta):
             [token, token, token, ...]
         '''
         raise NotImplementedError("This method must be implemented.")
+
+    def tokenize_many(self, sentence_list):
+        '''
+        Tokenize the list of str.
+
+        This method can be overrided to tokenize in batch.
+
+        Args:
+            sentence_list:  `list` of tokenized strings.
+
+        Returns:
+            [[token, token, token, ...], [token, token, token, ...], ...]
+        '''
+        return [self.tokenize(sentence_str) for sentence_str in sentence_list]
@@ -1,15 +1,57 @@
 # -*- coding: utf-8 -*-
+from collections import OrderedDict
+import os
+import threading
 from pysummarization.tokenizable_doc import TokenizableDoc
 import MeCab
 
+# The pool of `MeCab.Tagger`s in each thread.
+# The taggers are keyed by the process id, the dictionary and the output mode,
+# so that the taggers are neither shared by threads nor inherited by forked processes.
+_tagger_local = threading.local()
+
+
+def _get_tagger(mecab_system_dic, output_mode):
+    '''
+    Get the long-lived `MeCab.Tagger` of this thread.
+
+    Args:
+        mecab_system_dic:   The option of dictionary.
+        output_mode:        The option of output mode, such as "-Owakati".
+
+    Returns:
+        `MeCab.Tagger`.
+    '''
+    tagger_dict = getattr(_tagger_local, "tagger_dict", None)
+    if tagger_dict is None:
+        tagger_dict = {}
+        _tagger_local.tagger_dict = tagger_dict
+
+    key = (os.getpid(), mecab_system_dic, output_mode)
+    if key not in tagger_dict:
+        tagger_dict[key] = MeCab.Tagger(mecab_system_dic + " " + output_mode)
+    return tagger_dict[key]
+
 
 class MeCabTokenizer(TokenizableDoc):
     '''
     Tokenize string.
     
     Japanese morphological analysis with MeCab.
+
+    The `MeCab.Tagger`s, which load the dictionary, are created once
+    per thread and reused. The results of repeated sentences are
+    cached in the LRU cache.
     '''
 
+    def __init__(self):
+        '''
+        Init.
+        '''
+        # The LRU cache of token lists, and its lock.
+        self.__cache_dict = OrderedDict()
+        self.__cache_lock = threading.Lock()
+
     # Path ot mecab dictionary.
     # For instance, "-d /usr/lib/x86_64-linux-gnu/mecab/dic/mecab-ipadic-neologd".
     # If empty(""), this class will see default settings.
@@ -37,6 +79,43 @@ class MeCabTokenizer(TokenizableDoc):
 
     part_of_speech = property(get_part_of_speech, set_part_of_speech)
 
+    # The maximum number of sentences in the LRU cache. If `0`, the results are not cached.
+    __cache_size = 1024
+
+    def get_cache_size(self):
+        ''' getter '''
+        return self.__cache_size
+
+    def set_cache_size(self, value):
+        ''' setter '''
+        if isinstance(value, int) is False:
+            raise TypeError("The type of cache_size must be int.")
+        if value < 0:
+            raise ValueError("The value of cache_size must be more than or equal to 0.")
+        self.__cache_size = value
+        with self.__cache_lock:
+            while len(self.__cache_dict) > value:
+                self.__cache_dict.popitem(last=False)
+
+    cache_size = property(get_cache_size, set_cache_size)
+
+    def __getstate__(self):
+        '''
+        Drop the cache and its lock in pickling, because the lock can not be pickled.
+        '''
+        state_dict = self.__dict__.copy()
+        state_dict.pop("_MeCabTokenizer__cache_dict", None)
+        state_dict.pop("_MeCabTokenizer__cache_lock", None)
+        return state_dict
+
+    def __setstate__(self, state_dict):
+        '''
+        Create the empty cache and its lock in unpickling.
+        '''
+        self.__dict__.update(state_dict)
+        self.__cache_dict = OrderedDict()
+        self.__cache_lock = threading.Lock()
+
     def tokenize(self, sentence_str):
         '''
         Tokenize str.
@@ -44,19 +123,74 @@ class MeCabTokenizer(TokenizableDoc):
         Args:
             sentence_str:   tokenized string.
         
+        Returns:
+            [token, token, token, ...]
+        '''
+        return self.tokenize_many([sentence_str])[0]
+
+    def tokenize_many(self, sentence_list):
+        '''
+        Tokenize the list of str.
+
+        The duplicated sentences are parsed once, and all sentences are
+        parsed by the same `MeCab.Tagger`.
+
+        Args:
+            sentence_list:  `list` of tokenized strings.
+
+        Returns:
+            [[token, token, token, ...], [token, token, token, ...], ...]
+        '''
+        part_of_speech_tuple = tuple(self.part_of_speech)
+        key_list = [
+            (sentence_str, self.mecab_system_dic, part_of_speech_tuple) for sentence_str in sentence_list
+        ]
+
+        token_list_dict = {}
+        with self.__cache_lock:
+            cache_dict = self.__cache_dict
+            for key in key_list:
+                if key in cache_dict:
+                    cache_dict.move_to_end(key)
+                    token_list_dict[key] = cache_dict[key]
+
+        parsed_dict = {}
+        for key in key_list:
+            if key not in token_list_dict and key not in parsed_dict:
+                parsed_dict[key] = self.__parse(key[0])
+
+        if len(parsed_dict) > 0:
+            token_list_dict.update(parsed_dict)
+            if self.cache_size > 0:
+                with self.__cache_lock:
+                    cache_dict = self.__cache_dict
+                    for key, token_list in parsed_dict.items():
+                        cache_dict[key] = token_list
+                        cache_dict.move_to_end(key)
+                    while len(cache_dict) > self.cache_size:
+                        cache_dict.popitem(last=False)
+
+        return [token_list_dict[key][:] for key in key_list]
+
+    def __parse(self, sentence_str):
+        '''
+        Parse str by MeCab.
+
+        Args:
+            sentence_str:   tokenized string.
+
         Returns:
             [token, token, token, ...]
         '''
         if len(self.part_of_speech) == 0:
-            mt = MeCab.Tagger(self.mecab_system_dic + " -Owakati")
+            mt = _get_tagger(self.mecab_system_dic, "-Owakati")
             wordlist = mt.parse(sentence_str)
             token_list = wordlist.rstrip(" \n").split(" ")
             return token_list
         else:
-            tagger = MeCab.Tagger(self.mecab_system_dic + " -Ochasen")
+            tagger = _get_tagger(self.mecab_system_dic, "-Ochasen")
             node = tagger.parseToNode(sentence_str)
 
-            result_tuple_list = []
             token_list = []
             while node:
                 feature_list = node.feature.split(",")
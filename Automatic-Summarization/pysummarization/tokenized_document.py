@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+from pysummarization.nlp_base import NlpBase
+
+
+class TokenizedDocument(object):
+    '''
+    The document whose sentences are divided and tokenized once.
+
+    The token lists of sentences are cached for each `NlpBase`, so that
+    the automatic summarization and the similarity filter can share them.
+    The inverted index of positions of tokens in each sentence is also cached.
+    '''
+
+    def __init__(self, nlp_base, document=None, sentence_list=None):
+        '''
+        Init.
+
+        Args:
+            nlp_base:       is-a `NlpBase` to divide and tokenize the document.
+            document:       `str` of the document.
+            sentence_list:  `list` of sentences. If not `None`, `document` is not divided.
+        '''
+        if isinstance(nlp_base, NlpBase) is False:
+            raise TypeError("The type of nlp_base must be NlpBase.")
+
+        if sentence_list is None:
+            if isinstance(document, str) is False:
+                raise TypeError("The type of document must be str.")
+            sentence_list = nlp_base.listup_sentence(document)
+
+        self.__nlp_base = nlp_base
+        self.__sentence_list = sentence_list
+        self.__token_list_dict = {}
+        self.__position_dict_list = None
+
+    def extract_token_list_list(self, nlp_base=None):
+        '''
+        Extract the token lists of sentences.
+
+        Args:
+            nlp_base:   is-a `NlpBase` to tokenize sentences.
+                        If `None`, the `NlpBase` given to the constructor.
+
+        Returns:
+            [[token, token, ...], [token, token, ...], ...]
+        '''
+        if nlp_base is None:
+            nlp_base = self.__nlp_base
+
+        key = id(nlp_base)
+        if key not in self.__token_list_dict:
+            token_list_list = []
+            for sentence in self.__sentence_list:
+                nlp_base.tokenize(sentence)
+                token_list_list.append(nlp_base.token)
+            # The reference to `nlp_base` keeps `id(nlp_base)` unique.
+            self.__token_list_dict[key] = (nlp_base, token_list_list)
+
+        return self.__token_list_dict[key][1]
+
+    def extract_position_dict_list(self):
+        '''
+        Extract the inverted index of positions of tokens in each sentence.
+
+        Returns:
+            [{token: [position, position, ...], ...}, ...]
+            The positions are in ascending order.
+        '''
+        if self.__position_dict_list is None:
+            position_dict_list = []
+            for token_list in self.extract_token_list_list():
+                position_dict = {}
+                for position, token in enumerate(token_list):
+                    position_dict.setdefault(token, []).append(position)
+                position_dict_list.append(position_dict)
+            self.__position_dict_list = position_dict_list
+
+        return self.__position_dict_list
+
+    def select(self, index_list):
+        '''
+        Select sentences.
+
+        Args:
+            index_list:     `list` of indices of sentences.
+
+        Returns:
+            `TokenizedDocument` of the selected sentences, which inherits the caches.
+        '''
+        document = TokenizedDocument(
+            self.__nlp_base,
+            sentence_list=[self.__sentence_list[i] for i in index_list]
+        )
+        for key, (nlp_base, token_list_list) in self.__token_list_dict.items():
+            document.__token_list_dict[key] = (nlp_base, [token_list_list[i] for i in index_list])
+        if self.__position_dict_list is not None:
+            document.__position_dict_list = [self.__position_dict_list[i] for i in index_list]
+        return document
+
+    def get_sentence_list(self):
+        ''' getter '''
+        return self.__sentence_list
+
+    def set_readonly(self, value):
+        ''' setter '''
+        raise TypeError("This property must be read-only.")
+
+    sentence_list = property(get_sentence_list, set_readonly)
+
+    def __len__(self):
+        '''
+        Returns:
+            The number of sentences.
+        '''
+        return len(self.__sentence_list)
@@ -16,6 +16,7 @@ class THotVectorizer(VectorizableToken):
             token_list:    The list of all tokens.
         '''
         self.__token_arr = np.array(list(set(token_list)))
+        self.__token_index_dict = {token: i for i, token in enumerate(self.__token_arr.tolist())}
 
     def vectorize(self, token_list):
         '''
@@ -27,7 +28,80 @@ class THotVectorizer(VectorizableToken):
         Returns:
             [vector of token, vector of token, vector of token, ...]
         '''
-        return [self.__t_hot(token).tolist() for token in token_list]
+        return self.convert_tokens_into_matrix(token_list).tolist()
+
+    def convert_tokens_into_ids(self, token_list):
+        '''
+        Convert tokens into the ids, which are the indices in `token_arr`.
+
+        Args:
+            token_list:     The list of tokens.
+
+        Returns:
+            1-D `np.ndarray` of ids.
+        '''
+        try:
+            return np.array([self.__token_index_dict[token] for token in token_list], dtype=np.int64)
+        except KeyError as e:
+            raise ValueError("The token is not in the vocabulary: " + str(e))
+
+    def convert_ids_into_matrix(self, id_arr, out=None):
+        '''
+        Create one hot vectors from ids.
+
+        Args:
+            id_arr:         `np.ndarray` of ids.
+            out:            `np.ndarray` to be overwritten by the one hot vectors.
+                            The shape is: `id_arr.shape` + (the size of vocabulary, )
+                            If `None`, new `np.ndarray` of `np.float32` is allocated.
+
+        Returns:
+            `np.ndarray` of one hot vectors. The shape is: `id_arr.shape` + (the size of vocabulary, )
+        '''
+        id_arr = np.asarray(id_arr, dtype=np.int64)
+        shape = id_arr.shape + (self.__token_arr.shape[0], )
+        if out is None:
+            out = np.zeros(shape, dtype=np.float32)
+        else:
+            if out.shape != shape:
+                raise ValueError("The shape of `out` must be " + str(shape) + ".")
+            out[...] = 0
+
+        np.put_along_axis(out, id_arr[..., None], 1, axis=-1)
+        return out
+
+    def convert_tokens_into_csr(self, token_list):
+        '''
+        Create the sparse matrix of one hot vectors in the CSR format.
+
+        The result can be given to `scipy.sparse.csr_matrix((data, indices, indptr))` or
+        `mxnet.nd.sparse.csr_matrix((data, indices, indptr))` without copies.
+
+        Args:
+            token_list:     The list of tokens.
+
+        Returns:
+            Tuple data. The shape of matrix is: (the number of tokens, the size of vocabulary)
+            - `np.ndarray` of data.
+            - `np.ndarray` of column indices.
+            - `np.ndarray` of row pointers.
+        '''
+        indices_arr = self.convert_tokens_into_ids(token_list)
+        data_arr = np.ones(indices_arr.shape[0], dtype=np.float32)
+        indptr_arr = np.arange(indices_arr.shape[0] + 1, dtype=np.int64)
+        return data_arr, indices_arr, indptr_arr
+
+    def convert_ids_into_tokens(self, id_arr):
+        '''
+        Convert ids into tokens.
+
+        Args:
+            id_arr:         `np.ndarray` of ids.
+
+        Returns:
+            `np.ndarray` of tokens. The shape is the same as `id_arr`.
+        '''
+        return self.__token_arr[id_arr]
 
     def convert_tokens_into_matrix(self, token_list):
         '''
@@ -40,7 +114,7 @@ class THotVectorizer(VectorizableToken):
             2-D `np.ndarray` of sentences.
             Each row means one hot vectors of one sentence.
         '''
-        return np.array(self.vectorize(token_list)).astype(np.float32)
+        return self.convert_ids_into_matrix(self.convert_tokens_into_ids(token_list))
 
     def tokenize(self, vector_list):
         '''
@@ -57,14 +131,7 @@ class THotVectorizer(VectorizableToken):
             key_arr = vector_arr.argmax()
         else:
             key_arr = vector_arr.argmax(axis=-1)
-        return self.__token_arr[key_arr]
-
-    def __t_hot(self, token):
-        arr = np.zeros(len(self.__token_arr))
-        key = self.__token_arr.tolist().index(token)
-        arr[key] = 1
-        arr = arr.astype(np.float32)
-        return arr
+        return self.convert_ids_into_tokens(key_arr)
 
     def get_token_arr(self):
         ''' getter '''
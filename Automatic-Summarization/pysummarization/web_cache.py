@@ -0,0 +1,346 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+
+class WebCache(object):
+    '''
+    Content-addressed on-disk cache of Web documents.
+
+    The raw bytes of documents are stored in the files named by their SHA-256 hash,
+    and the texts extracted from them are stored separately, keyed by the hash
+    and the kind of extraction. So the same content fetched from several URLs is
+    stored once, and the extraction is not repeated while the content is unchanged.
+
+    Each URL refers to the hash of its latest content with the validators `ETag`
+    and `Last-Modified`. The entries younger than `max_age` are used without
+    network access, and the older entries are revalidated by conditional requests.
+
+    The files are evicted in the least recently used order when their total size
+    exceeds `max_byte_size`, except the files of pinned contents, which are being
+    read by callers. The index is stored in SQLite.
+    '''
+
+    def __init__(self, cache_dir, max_byte_size=1024 ** 3, max_age=None):
+        '''
+        Init.
+
+        Args:
+            cache_dir:          The path of directory of the cache.
+            max_byte_size:      `int` of the maximum total size of files in bytes.
+            max_age:            `int` or `float` of the seconds while the entries are fresh.
+                                If `None`, the entries are always fresh and never revalidated.
+        '''
+        if isinstance(max_byte_size, int) is False:
+            raise TypeError("The type of max_byte_size must be int.")
+        if max_byte_size <= 0:
+            raise ValueError("The value of max_byte_size must be more than 0.")
+        if max_age is not None and isinstance(max_age, int) is False and isinstance(max_age, float) is False:
+            raise TypeError("The type of max_age must be int or float.")
+
+        os.makedirs(os.path.join(cache_dir, "blob"), exist_ok=True)
+        self.__cache_dir = cache_dir
+        self.__max_byte_size = max_byte_size
+        self.__max_age = max_age
+        self.__lock = threading.Lock()
+        self.__pin_dict = {}
+        self.__connection = sqlite3.connect(
+            os.path.join(cache_dir, "index.sqlite3"),
+            timeout=30,
+            check_same_thread=False
+        )
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                "CREATE TABLE IF NOT EXISTS entry ("
+                "url TEXT PRIMARY KEY, content_hash TEXT, etag TEXT, "
+                "last_modified TEXT, content_type TEXT, validated_at REAL)"
+            )
+            self.__connection.execute(
+                "CREATE TABLE IF NOT EXISTS blob ("
+                "file_name TEXT PRIMARY KEY, content_hash TEXT, byte_size INTEGER, accessed_at REAL)"
+            )
+
+    def lookup(self, url):
+        '''
+        Look up the entry of URL.
+
+        Args:
+            url:    URL.
+
+        Returns:
+            `dict` of the entry, or `None` if not cached.
+            - "content_hash":   The SHA-256 hash of content.
+            - "etag":           The value of `ETag`.
+            - "last_modified":  The value of `Last-Modified`.
+            - "content_type":   The value of `Content-Type`.
+            - "fresh_flag":     `True` if the entry can be used without revalidation.
+        '''
+        with self.__lock:
+            row = self.__connection.execute(
+                "SELECT content_hash, etag, last_modified, content_type, validated_at FROM entry WHERE url = ?",
+                (url, )
+            ).fetchone()
+        if row is None:
+            return None
+
+        content_hash, etag, last_modified, content_type, validated_at = row
+        if os.path.exists(self.__create_path(content_hash)) is False:
+            return None
+
+        return {
+            "content_hash": content_hash,
+            "etag": etag,
+            "last_modified": last_modified,
+            "content_type": content_type,
+            "fresh_flag": self.__max_age is None or time.time() - validated_at < self.__max_age
+        }
+
+    def create_validator_header(self, entry_dict):
+        '''
+        Create the headers of conditional request.
+
+        Args:
+            entry_dict:     The result of `lookup`.
+
+        Returns:
+            `dict` of headers.
+        '''
+        header_dict = {}
+        if entry_dict is not None:
+            if entry_dict["etag"] is not None:
+                header_dict["If-None-Match"] = entry_dict["etag"]
+            if entry_dict["last_modified"] is not None:
+                header_dict["If-Modified-Since"] = entry_dict["last_modified"]
+        return header_dict
+
+    def revalidate(self, url):
+        '''
+        Mark the entry as validated, when the server responded `304 Not Modified`.
+
+        Args:
+            url:    URL.
+        '''
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                "UPDATE entry SET validated_at = ? WHERE url = ?",
+                (time.time(), url)
+            )
+
+    def save_bytes(self, url, body, etag=None, last_modified=None, content_type=None):
+        '''
+        Save the raw bytes of content fetched from URL.
+
+        Args:
+            url:            URL.
+            body:           `bytes` of content.
+            etag:           The value of `ETag`.
+            last_modified:  The value of `Last-Modified`.
+            content_type:   The value of `Content-Type`.
+
+        Returns:
+            The SHA-256 hash of content.
+        '''
+        content_hash = hashlib.sha256(body).hexdigest()
+        # The content just written is not evicted, even if it is larger than `max_byte_size`.
+        self.pin(content_hash)
+        try:
+            self.__write_file(self.__create_path(content_hash), body, content_hash)
+            with self.__lock, self.__connection:
+                self.__connection.execute(
+                    "INSERT OR REPLACE INTO entry VALUES (?, ?, ?, ?, ?, ?)",
+                    (url, content_hash, etag, last_modified, content_type, time.time())
+                )
+            self.evict()
+        finally:
+            self.unpin(content_hash)
+        return content_hash
+
+    def load_bytes(self, content_hash):
+        '''
+        Load the raw bytes of content.
+
+        Args:
+            content_hash:   The SHA-256 hash of content.
+
+        Returns:
+            `bytes` of content, or `None` if not cached.
+        '''
+        return self.__read_file(self.__create_path(content_hash))
+
+    def extract_path(self, content_hash):
+        '''
+        Extract the path of the file of raw bytes.
+        The content should be pinned while the path is used.
+
+        Args:
+            content_hash:   The SHA-256 hash of content.
+
+        Returns:
+            The path, or `None` if not cached.
+        '''
+        path = self.__create_path(content_hash)
+        if os.path.exists(path) is False:
+            return None
+        self.__touch(path)
+        return path
+
+    def save_text(self, content_hash, kind, text):
+        '''
+        Save the text extracted from content.
+
+        Args:
+            content_hash:   The SHA-256 hash of content.
+            kind:           `str` of the kind of extraction.
+            text:           `str` of the extracted text.
+        '''
+        self.__write_file(self.__create_path(content_hash, kind), text.encode("utf-8"), content_hash)
+        self.evict()
+
+    def load_text(self, content_hash, kind):
+        '''
+        Load the text extracted from content.
+
+        Args:
+            content_hash:   The SHA-256 hash of content.
+            kind:           `str` of the kind of extraction.
+
+        Returns:
+            `str` of the extracted text, or `None` if not cached.
+        '''
+        data = self.__read_file(self.__create_path(content_hash, kind))
+        if data is None:
+            return None
+        return data.decode("utf-8")
+
+    def pin(self, content_hash):
+        '''
+        Pin the content, so that its files are not evicted until `unpin` is called.
+        The content can be pinned several times, and must be unpinned as many times.
+
+        Args:
+            content_hash:   The SHA-256 hash of content.
+        '''
+        with self.__lock:
+            self.__pin_dict[content_hash] = self.__pin_dict.get(content_hash, 0) + 1
+
+    def unpin(self, content_hash):
+        '''
+        Unpin the content.
+
+        Args:
+            content_hash:   The SHA-256 hash of content.
+        '''
+        with self.__lock:
+            if self.__pin_dict.get(content_hash, 0) <= 1:
+                self.__pin_dict.pop(content_hash, None)
+            else:
+                self.__pin_dict[content_hash] -= 1
+
+    def evict(self):
+        '''
+        Evict the least recently used files until the total size is `max_byte_size` or less.
+        The files of pinned contents are not evicted.
+        The entries of URLs whose raw bytes are evicted are deleted.
+        '''
+        with self.__lock, self.__connection:
+            total = self.__connection.execute("SELECT COALESCE(SUM(byte_size), 0) FROM blob").fetchone()[0]
+            if total <= self.__max_byte_size:
+                return
+
+            row_list = self.__connection.execute(
+                "SELECT file_name, content_hash, byte_size FROM blob ORDER BY accessed_at"
+            ).fetchall()
+            for file_name, content_hash, byte_size in row_list:
+                if total <= self.__max_byte_size:
+                    break
+                if content_hash in self.__pin_dict:
+                    continue
+                try:
+                    os.remove(os.path.join(self.__cache_dir, "blob", file_name))
+                except FileNotFoundError:
+                    pass
+                self.__connection.execute("DELETE FROM blob WHERE file_name = ?", (file_name, ))
+                if file_name == content_hash:
+                    self.__connection.execute("DELETE FROM entry WHERE content_hash = ?", (content_hash, ))
+                total -= byte_size
+
+    def __create_path(self, content_hash, kind=None):
+        '''
+        Create the path of the file.
+
+        Args:
+            content_hash:   The SHA-256 hash of content.
+            kind:           `str` of the kind of extraction. If `None`, the path of raw bytes.
+
+        Returns:
+            The path.
+        '''
+        file_name = content_hash
+        if kind is not None:
+            file_name += "." + hashlib.sha1(kind.encode("utf-8")).hexdigest() + ".txt"
+        return os.path.join(self.__cache_dir, "blob", file_name)
+
+    def __write_file(self, path, data, content_hash):
+        '''
+        Write the file atomically and register it.
+
+        Args:
+            path:           The path.
+            data:           `bytes`.
+            content_hash:   The SHA-256 hash of content.
+        '''
+        if os.path.exists(path) is False:
+            tmp_path = path + "." + str(os.getpid()) + "." + str(threading.get_ident()) + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO blob VALUES (?, ?, ?, ?)",
+                (os.path.basename(path), content_hash, len(data), time.time())
+            )
+
+    def __read_file(self, path):
+        '''
+        Read the file and update its access time.
+
+        Args:
+            path:   The path.
+
+        Returns:
+            `bytes`, or `None` if not cached.
+        '''
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        self.__touch(path)
+        return data
+
+    def __touch(self, path):
+        '''
+        Update the access time of the file.
+
+        Args:
+            path:   The path.
+        '''
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                "UPDATE blob SET accessed_at = ? WHERE file_name = ?",
+                (time.time(), os.path.basename(path))
+            )
+
+    def get_cache_dir(self):
+        ''' getter '''
+        return self.__cache_dir
+
+    def set_readonly(self, value):
+        ''' setter '''
+        raise TypeError("This property must be read-only.")
+
+    cache_dir = property(get_cache_dir, set_readonly)
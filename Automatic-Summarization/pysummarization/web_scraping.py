@@ -1,7 +1,14 @@
 # -*- coding: utf-8 -*-
 from pysummarization.readable_web_pdf import ReadableWebPDF
-from time import sleep
-import urllib
+from pysummarization.web_cache import WebCache
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from email.message import Message
+import http.client
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
 from pyquery import PyQuery as pq
 
 
@@ -34,11 +41,78 @@ class WebScraping(object):
 
     readable_web_pdf = property(get_readable_web_pdf, set_readable_web_pdf)
 
+    # Object of WebCache.
+    __web_cache = None
+
+    def get_web_cache(self):
+        ''' getter '''
+        return self.__web_cache
+
+    def set_web_cache(self, value):
+        ''' setter '''
+        if isinstance(value, WebCache) is False and value is not None:
+            raise TypeError("The type of __web_cache must be WebCache.")
+        self.__web_cache = value
+
+    web_cache = property(get_web_cache, set_web_cache)
+
+    # The minimum interval in seconds between the requests to the same host.
+    __interval = 1.0
+
+    def get_interval(self):
+        ''' getter '''
+        return self.__interval
+
+    def set_interval(self, value):
+        ''' setter '''
+        if isinstance(value, int) is False and isinstance(value, float) is False:
+            raise TypeError("The type of interval must be int or float.")
+        if value < 0:
+            raise ValueError("The value of interval must be more than or equal to 0.")
+        self.__interval = value
+
+    interval = property(get_interval, set_interval)
+
+    # Timeout in seconds of connections.
+    __timeout = 30.0
+
+    def get_timeout(self):
+        ''' getter '''
+        return self.__timeout
+
+    def set_timeout(self, value):
+        ''' setter '''
+        if isinstance(value, int) is False and isinstance(value, float) is False:
+            raise TypeError("The type of timeout must be int or float.")
+        self.__timeout = value
+
+    timeout = property(get_timeout, set_timeout)
+
+    # The maximum number of redirects.
+    __max_redirect_n = 5
+
+    def __init__(self):
+        '''
+        Init.
+        '''
+        # The state of the politeness scheduler.
+        self.__host_time_dict = {}
+        self.__host_lock = threading.Lock()
+        # The kept-alive connections of each thread, and the list of pairs of 
+        # the thread and its `dict` of connections to close them after the thread ends.
+        self.__connection_local = threading.local()
+        self.__connection_dict_list = []
+
     def scrape(self, url):
         '''
         Execute Web-Scraping.
         The target dom objects are in self.__dom_object_list.
 
+        The requests to the same host are throttled by `interval`.
+        The document is fetched by `urllib.request`, so the proxies and 
+        the opener installed by `urllib.request.install_opener` are used.
+        If `web_cache` is not `None`, the fetched documents and the scraped texts are cached.
+
         Args:
             url:    Web site url.
 
@@ -47,21 +121,363 @@ class WebScraping(object):
 
         @TODO(chimera0): check URLs format.
         '''
+        return self.__scrape(url, keep_alive_flag=False)
+
+    def __scrape(self, url, keep_alive_flag):
+        '''
+        Execute Web-Scraping.
+
+        Args:
+            url:                Web site url.
+            keep_alive_flag:    If `True`, the connections are kept alive and reused in each thread.
+
+        Returns:
+            The result. this is a string.
+        '''
         if isinstance(url, str) is False:
             raise TypeError("The type of url must be str.")
 
         if self.readable_web_pdf is not None and self.readable_web_pdf.is_pdf_url(url) is True:
+            self.__wait_host(url)
             web_data = self.readable_web_pdf.url_to_text(url)
         else:
-            web_data = ""
-            req = urllib.request.Request(url=url)
-            with urllib.request.urlopen(req) as f:
-                web = f.read().decode('utf-8')
+            body, content_type, content_hash = self.__fetch(url, keep_alive_flag)
+            kind = "web_scraping:" + repr((self.__dom_object_list, self.__remove_object_list))
+            web_data = None
+            if content_hash is not None:
+                web_data = self.web_cache.load_text(content_hash, kind)
+
+            if web_data is None:
+                web_data = ""
+                web = self.__decode(body, content_type)
                 dom = pq(web)
                 [dom(remove_object).remove() for remove_object in self.__remove_object_list]
 
                 for dom_object in self.__dom_object_list:
                     web_data += dom(dom_object).text()
 
-        sleep(1)
+                if content_hash is not None:
+                    self.web_cache.save_text(content_hash, kind, web_data)
+
         return web_data
+
+    def scrape_many(self, url_iter, worker_n=8, max_in_flight=None):
+        '''
+        Execute Web-Scraping of many URLs concurrently.
+
+        The URLs are fetched by the pool of threads. The requests to the same 
+        host are throttled by `interval`, and the requests to the different hosts 
+        are not. The results are generated in the order of completion.
+
+        The connections are kept alive and reused in each thread by `http.client`,
+        except the URLs which are requested via the proxies of `urllib.request.getproxies`
+        and not excluded by `no_proxy`. Those URLs are fetched by `urllib.request`.
+
+        Args:
+            url_iter:       The iterable of URLs.
+            worker_n:       `int` of the number of threads.
+            max_in_flight:  `int` of the maximum number of URLs which have been 
+                            submitted but not generated. If `None`, `worker_n * 2`.
+
+        Returns:
+            The generator of tuple data.
+            - The URL.
+            - The result of `scrape`. If failed, `None`.
+            - The exception. If succeeded, `None`.
+        '''
+        if isinstance(worker_n, int) is False:
+            raise TypeError("The type of worker_n must be int.")
+        if worker_n <= 0:
+            raise ValueError("The value of worker_n must be more than 0.")
+        if max_in_flight is None:
+            max_in_flight = worker_n * 2
+        if isinstance(max_in_flight, int) is False:
+            raise TypeError("The type of max_in_flight must be int.")
+        if max_in_flight <= 0:
+            raise ValueError("The value of max_in_flight must be more than 0.")
+
+        return self.__scrape_many(url_iter, worker_n, max_in_flight)
+
+    def __scrape_many(self, url_iter, worker_n, max_in_flight):
+        '''
+        The generator of `scrape_many`.
+        '''
+        url_iter = iter(url_iter)
+        try:
+            with ThreadPoolExecutor(max_workers=worker_n) as executor:
+                future_dict = {}
+                try:
+                    exhausted_flag = False
+                    while True:
+                        while exhausted_flag is False and len(future_dict) < max_in_flight:
+                            try:
+                                url = next(url_iter)
+                            except StopIteration:
+                                exhausted_flag = True
+                                break
+                            future_dict[executor.submit(self.__scrape, url, True)] = url
+
+                        if len(future_dict) == 0:
+                            break
+
+                        done_set, _ = wait(future_dict.keys(), return_when=FIRST_COMPLETED)
+                        for future in done_set:
+                            url = future_dict.pop(future)
+                            try:
+                                yield url, future.result(), None
+                            except Exception as e:
+                                yield url, None, e
+                finally:
+                    for future in future_dict.keys():
+                        future.cancel()
+        finally:
+            # The threads of the pool have ended, so their connections are never reused.
+            self.__close_ended_connections()
+
+    def __wait_host(self, url):
+        '''
+        Wait until the request to the host of `url` is allowed.
+        The time slot of the request is reserved in the lock, 
+        so the concurrent requests to the same host are spaced by `interval`.
+
+        Args:
+            url:    URL.
+        '''
+        host = urllib.parse.urlsplit(url).netloc
+        with self.__host_lock:
+            now = time.monotonic()
+            request_time = max(now, self.__host_time_dict.get(host, now))
+            self.__host_time_dict[host] = request_time + self.interval
+
+        if request_time > now:
+            time.sleep(request_time - now)
+
+    def __get_connection(self, scheme, netloc):
+        '''
+        Get the kept-alive connection of this thread.
+
+        Args:
+            scheme:     "http" or "https".
+            netloc:     The host and port.
+
+        Returns:
+            `http.client.HTTPConnection`.
+        '''
+        connection_dict = getattr(self.__connection_local, "connection_dict", None)
+        if connection_dict is None:
+            connection_dict = {}
+            self.__connection_local.connection_dict = connection_dict
+            with self.__host_lock:
+                self.__connection_dict_list.append((threading.current_thread(), connection_dict))
+
+        key = (scheme, netloc)
+        if key not in connection_dict:
+            if scheme == "https":
+                connection_dict[key] = http.client.HTTPSConnection(netloc, timeout=self.timeout)
+            elif scheme == "http":
+                connection_dict[key] = http.client.HTTPConnection(netloc, timeout=self.timeout)
+            else:
+                raise ValueError("The scheme of url must be http or https.")
+        return connection_dict[key]
+
+    def __close_connection(self, scheme, netloc):
+        '''
+        Close and forget the connection of this thread.
+
+        Args:
+            scheme:     "http" or "https".
+            netloc:     The host and port.
+        '''
+        connection = self.__connection_local.connection_dict.pop((scheme, netloc), None)
+        if connection is not None:
+            connection.close()
+
+    def __close_ended_connections(self):
+        '''
+        Close the connections of the threads which have ended.
+        '''
+        with self.__host_lock:
+            ended_list = [pair for pair in self.__connection_dict_list if pair[0].is_alive() is False]
+            self.__connection_dict_list = [pair for pair in self.__connection_dict_list if pair[0].is_alive() is True]
+
+        for _, connection_dict in ended_list:
+            for connection in connection_dict.values():
+                connection.close()
+            connection_dict.clear()
+
+    def __fetch(self, url, keep_alive_flag):
+        '''
+        Fetch the document of `url`, following redirects.
+
+        If `web_cache` is not `None`, the fresh entry is used without requests, 
+        and the stale entry is revalidated by the conditional request.
+
+        Args:
+            url:                URL.
+            keep_alive_flag:    If `True`, the connections are kept alive and reused in each thread,
+                                unless the URL is requested via the proxy.
+
+        Returns:
+            Tuple data.
+            - `bytes` of the document.
+            - The value of `Content-Type`.
+            - The hash of the document in `web_cache`. If `web_cache` is `None`, `None`.
+        '''
+        entry_dict = None
+        header_dict = {}
+        if self.web_cache is not None:
+            entry_dict = self.web_cache.lookup(url)
+            if entry_dict is not None and entry_dict["fresh_flag"] is True:
+                body = self.web_cache.load_bytes(entry_dict["content_hash"])
+                if body is not None:
+                    return body, entry_dict["content_type"], entry_dict["content_hash"]
+                entry_dict = None
+            header_dict = self.web_cache.create_validator_header(entry_dict)
+
+        while True:
+            if keep_alive_flag is True:
+                status, response_header, body = self.__request_keep_alive(url, header_dict)
+            else:
+                status, response_header, body = self.__request_urllib(url, header_dict)
+
+            if status == 304 and entry_dict is not None:
+                body = self.web_cache.load_bytes(entry_dict["content_hash"])
+                if body is not None:
+                    self.web_cache.revalidate(url)
+                    return body, entry_dict["content_type"], entry_dict["content_hash"]
+                # The content was evicted after the lookup, so request without validators.
+                entry_dict = None
+                header_dict = {}
+                continue
+            break
+
+        content_type = response_header.get("Content-Type", "text/html")
+        content_hash = None
+        if self.web_cache is not None:
+            content_hash = self.web_cache.save_bytes(
+                url,
+                body,
+                etag=response_header.get("ETag"),
+                last_modified=response_header.get("Last-Modified"),
+                content_type=content_type
+            )
+        return body, content_type, content_hash
+
+    def __request_urllib(self, url, header_dict):
+        '''
+        Request the document by `urllib.request`, following redirects.
+
+        Args:
+            url:            URL.
+            header_dict:    `dict` of the headers of request.
+
+        Returns:
+            Tuple data.
+            - The status code.
+            - The headers of response.
+            - `bytes` of the document.
+        '''
+        self.__wait_host(url)
+        req = urllib.request.Request(url=url, headers=header_dict)
+        try:
+            with urllib.request.urlopen(req, timeout=self.timeout) as f:
+                return f.status, f.headers, f.read()
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return e.code, e.headers, b""
+            raise
+
+    def __request_keep_alive(self, url, header_dict):
+        '''
+        Request the document by the kept-alive connection of this thread, following redirects.
+        The URLs which are requested via the proxy are delegated to `urllib.request`.
+
+        Args:
+            url:            URL.
+            header_dict:    `dict` of the headers of request.
+
+        Returns:
+            Tuple data.
+            - The status code.
+            - The headers of response.
+            - `bytes` of the document.
+        '''
+        request_url = url
+        for _ in range(self.__max_redirect_n + 1):
+            if self.__check_proxy(request_url) is True:
+                return self.__request_urllib(request_url, header_dict)
+
+            self.__wait_host(request_url)
+            split_result = urllib.parse.urlsplit(request_url)
+            path = urllib.parse.urlunsplit(("", "", split_result.path or "/", split_result.query, ""))
+            headers = {"Host": split_result.netloc, "User-Agent": "Python-urllib"}
+            headers.update(header_dict)
+
+            # The kept-alive connection may be closed by the server, so retry once.
+            for retry in range(2):
+                connection = self.__get_connection(split_result.scheme, split_result.netloc)
+                try:
+                    connection.request("GET", path, headers=headers)
+                    response = connection.getresponse()
+                    body = response.read()
+                    break
+                except (http.client.HTTPException, ConnectionError):
+                    self.__close_connection(split_result.scheme, split_result.netloc)
+                    if retry > 0:
+                        raise
+                except Exception:
+                    self.__close_connection(split_result.scheme, split_result.netloc)
+                    raise
+
+            if response.will_close:
+                self.__close_connection(split_result.scheme, split_result.netloc)
+
+            if response.status in (301, 302, 303, 307, 308) and response.getheader("Location") is not None:
+                request_url = urllib.parse.urljoin(request_url, response.getheader("Location"))
+                continue
+
+            if response.status >= 400:
+                raise urllib.error.HTTPError(request_url, response.status, response.reason, response.headers, None)
+
+            return response.status, response.headers, body
+
+        raise urllib.error.HTTPError(request_url, response.status, "Too many redirects.", response.headers, None)
+
+    def __check_proxy(self, url):
+        '''
+        Check whether the URL is requested via the proxy.
+        The proxies are set by the environment variables such as `http_proxy`,
+        and the hosts in `no_proxy` are excluded.
+
+        Args:
+            url:    URL.
+
+        Returns:
+            True: via the proxy, False: directly.
+        '''
+        split_result = urllib.parse.urlsplit(url)
+        if split_result.scheme not in urllib.request.getproxies():
+            return False
+        if urllib.request.proxy_bypass(split_result.netloc):
+            return False
+        return True
+
+    def __decode(self, body, content_type):
+        '''
+        Decode the document.
+
+        Args:
+            body:           `bytes` of the document.
+            content_type:   The value of `Content-Type`.
+
+        Returns:
+            The decoded document.
+            The charset in `content_type` is used, and UTF-8 is used by default.
+        '''
+        message = Message()
+        message["Content-Type"] = content_type or "text/html"
+        charset = message.get_content_charset() or "utf-8"
+        try:
+            return body.decode(charset, errors="replace")
+        except LookupError:
+            return body.decode("utf-8", errors="replace")
@@ -32,6 +32,9 @@ class QuantumMonteCarlo(AnnealingModel):
     '''
     
     __spin_arr = None
+
+    # The structured `np.ndarray` of logs of Monte Carlo moves.
+    __predicted_log_arr = None
     
     # User function for optimization.
     __distance_computable = None
@@ -47,7 +50,10 @@ class QuantumMonteCarlo(AnnealingModel):
         mc_step=None,
         point_num=None,
         spin_arr=None,
-        tolerance_diff_e=None
+        tolerance_diff_e=None,
+        dist_mat_arr=None,
+        sweep_flag=False,
+        log_interval=1
     ):
         '''
         Init.
@@ -64,6 +70,16 @@ class QuantumMonteCarlo(AnnealingModel):
             tolerance_diff_e:            Tolerance for the optimization.
                                          When the ΔE is not improving by at least `tolerance_diff_e`
                                          for two consecutive iterations, annealing will stops.
+            dist_mat_arr:                `np.ndarray` of the precomputed distance matrix 
+                                         whose shape is (`point_num`, `point_num`).
+                                         If `None`, the matrix is computed by `distance_computable` 
+                                         at the beginning of annealing.
+            sweep_flag:                  If `True`, each Monte Carlo step is a sweep which proposes 
+                                         one flip in every Trotter slice. The slices are updated 
+                                         in checkerboard groups, so that the flips in one group 
+                                         can be accepted at once.
+            log_interval:                The interval of logging Monte Carlo moves.
+                                         If `n`, one in every `n` moves is logged.
 
         '''
         if isinstance(distance_computable, DistanceComputable):
@@ -76,7 +92,17 @@ class QuantumMonteCarlo(AnnealingModel):
         self.__gammma = gammma
         self.__fractional_reduction = fractional_reduction
         self.__tolerance_diff_e = tolerance_diff_e
-        
+        self.__sweep_flag = sweep_flag
+        if isinstance(log_interval, int) is False:
+            raise TypeError("The type of `log_interval` must be int.")
+        if log_interval <= 0:
+            raise ValueError("The value of `log_interval` must be more than `0`.")
+        self.__log_interval = log_interval
+
+        if dist_mat_arr is not None and isinstance(dist_mat_arr, np.ndarray) is False:
+            raise TypeError("The type of `dist_mat_arr` must be `np.ndarray`.")
+        self.__dist_mat_arr = dist_mat_arr
+
         if spin_arr is not None:
             if isinstance(spin_arr, np.ndarray):
                 self.__spin_arr = spin_arr
@@ -109,81 +135,159 @@ class QuantumMonteCarlo(AnnealingModel):
                 spin_arr_list[i] = arr[key_arr]
             self.__spin_arr = np.array(spin_arr_list)
 
+    # The dtype of logs of Monte Carlo moves.
+    __log_dtype = np.dtype([
+        ("torotter", np.int64),
+        ("pre_time", np.int64),
+        ("post_time", np.int64),
+        ("pre_point", np.int64),
+        ("post_point", np.int64),
+        ("delta_e", np.float64),
+        ("prob", np.float64),
+        ("flip_flag", np.bool_)
+    ])
+
     def annealing(self):
         '''
         Annealing.
         '''
-        self.__predicted_log_list = []
+        if self.__dist_mat_arr is None:
+            self.__dist_mat_arr = self.__compute_dist_mat()
+
+        if self.__sweep_flag is True:
+            # Checkerboard groups of Trotter slices which are not adjacent to each other.
+            torotter_arr = np.arange(self.__trotter_dimention)
+            if self.__trotter_dimention % 2 == 1 and self.__trotter_dimention > 1:
+                self.__group_list = [torotter_arr[:-1:2], torotter_arr[1::2], torotter_arr[-1:]]
+            else:
+                self.__group_list = [torotter_arr[::2], torotter_arr[1::2]]
+            move_n = self.__trotter_dimention
+        else:
+            move_n = 1
+
+        log_n = -(-self.__cycles_num * self.__mc_step * move_n // self.__log_interval)
+        self.__predicted_log_arr = np.zeros(log_n, dtype=self.__log_dtype)
+        self.__move_n = 0
+        self.__log_n = 0
+
         for cycle in range(self.__cycles_num):
             for mc_step in range(self.__mc_step):
-                self.__move()
+                if self.__sweep_flag is True:
+                    for torotter_arr in self.__group_list:
+                        self.__move(torotter_arr)
+                else:
+                    self.__move(np.random.randint(self.__trotter_dimention, size=1))
             self.__gammma *= self.__fractional_reduction
 
-            if isinstance(self.__tolerance_diff_e, float) and len(self.__predicted_log_list) > 1:
-                diff = abs(self.__predicted_log_list[-1][5] - self.__predicted_log_list[-2][5])
+            if isinstance(self.__tolerance_diff_e, float) and self.__log_n > 1:
+                diff = abs(
+                    self.__predicted_log_arr["delta_e"][self.__log_n - 1] - self.__predicted_log_arr["delta_e"][self.__log_n - 2]
+                )
                 if diff < self.__tolerance_diff_e:
                     break
 
-        self.predicted_log_arr = np.array(self.__predicted_log_list)
+        self.__predicted_log_arr = self.__predicted_log_arr[:self.__log_n]
+        self.predicted_log_arr = np.array(
+            [self.__predicted_log_arr[name].astype(np.float64) for name in self.__log_dtype.names]
+        ).T
+
+    def __compute_dist_mat(self):
+        '''
+        Compute the distance matrix by `DistanceComputable`.
+
+        Returns:
+            `np.ndarray` of distance matrix.
+        '''
+        dist_mat_arr = np.zeros((self.__point_num, self.__point_num))
+        for x in range(self.__point_num):
+            for y in range(self.__point_num):
+                dist_mat_arr[x, y] = self.__distance_computable.compute(x, y)
+        return dist_mat_arr
+
+    def __move(self, torotter_arr):
+        '''
+        Propose and accept or reject the flips in Trotter slices at once.
+
+        Args:
+            torotter_arr:   `np.ndarray` of the indices of Trotter slices which are not adjacent to each other.
+        '''
+        spin_arr = self.__spin_arr
+        k = torotter_arr.shape[0]
 
-    def __move(self):
-        # Choice torotter.
-        torotter = np.random.randint(self.__trotter_dimention)
-        
         # Choice times.
-        time_arr = np.arange(self.__mc_step)
-        np.random.shuffle(time_arr)
-        pre_time, post_time = (time_arr[0], time_arr[1])
-        
+        pre_time_arr = np.random.randint(self.__mc_step, size=k)
+        post_time_arr = (pre_time_arr + np.random.randint(1, self.__mc_step, size=k)) % self.__mc_step
+
         # Decide point.
-        pre_point = self.__spin_arr[torotter, pre_time].argmax()
-        post_point = self.__spin_arr[torotter, post_time].argmax()
+        pre_point_arr = spin_arr[torotter_arr, pre_time_arr].argmax(axis=1)
+        post_point_arr = spin_arr[torotter_arr, post_time_arr].argmax(axis=1)
+
+        dist_pre_point_arr = self.__dist_mat_arr[pre_point_arr]
+        dist_post_point_arr = self.__dist_mat_arr[post_point_arr]
+
+        pre_pre_arr = spin_arr[torotter_arr, pre_time_arr, pre_point_arr][:, np.newaxis]
+        pre_post_arr = spin_arr[torotter_arr, pre_time_arr, post_point_arr][:, np.newaxis]
+        post_post_arr = spin_arr[torotter_arr, post_time_arr, post_point_arr][:, np.newaxis]
+
+        pre_neighbor_arr = spin_arr[torotter_arr, pre_time_arr - 1] + spin_arr[torotter_arr, (pre_time_arr + 1) % self.__mc_step]
+        post_neighbor_arr = spin_arr[torotter_arr, post_time_arr - 1] + spin_arr[torotter_arr, (post_time_arr + 1) % self.__mc_step]
 
         # ΔE
-        delta_e_arr = np.array([0] * 5)
-        for point in range(self.__point_num):
-            dist_pre_point = self.__distance_computable.compute(pre_point, point)
-            dist_post_point = self.__distance_computable.compute(post_point, point)
-            delta_e_arr[0] += 2 * (-dist_pre_point * self.__spin_arr[torotter][pre_time][pre_point] - dist_post_point * self.__spin_arr[torotter][pre_time][post_point]) * (self.__spin_arr[torotter][pre_time - 1][point] + self.__spin_arr[torotter][(pre_time + 1) % self.__mc_step][point])
-            delta_e_arr[0] += 2 + (-dist_pre_point * self.__spin_arr[torotter][pre_time][post_point] - dist_post_point * self.__spin_arr[torotter][post_time][post_point]) * (self.__spin_arr[torotter][post_time - 1][point] + self.__spin_arr[torotter][(post_time + 1) % self.__mc_step][point])
+        delta_e_arr = np.zeros((k, 5))
+        delta_e_arr[:, 0] = (
+            2 * (-dist_pre_point_arr * pre_pre_arr - dist_post_point_arr * pre_post_arr) * pre_neighbor_arr
+        ).sum(axis=1)
+        delta_e_arr[:, 0] += (
+            2 + (-dist_pre_point_arr * pre_post_arr - dist_post_point_arr * post_post_arr) * post_neighbor_arr
+        ).sum(axis=1)
 
         annealing_e = (1 / self.__inverse_temperature_beta) * np.log(np.cosh(self.__inverse_temperature_beta * self.__gammma / self.__trotter_dimention) / np.sinh(self.__inverse_temperature_beta * self.__gammma / self.__trotter_dimention))
 
-        delta_e_arr[1] = self.__spin_arr[torotter][pre_time][pre_point] * (self.__spin_arr[(torotter - 1) % self.__trotter_dimention][pre_time][pre_point] + self.__spin_arr[(torotter + 1) % self.__trotter_dimention][pre_time][pre_point])
-        delta_e_arr[2] = self.__spin_arr[torotter][pre_time][post_time] * (self.__spin_arr[(torotter - 1) % self.__trotter_dimention][pre_time][post_point] + self.__spin_arr[(torotter + 1) % self.__trotter_dimention][pre_time][post_point])
-        delta_e_arr[3] = self.__spin_arr[torotter][post_time][pre_point] * (self.__spin_arr[(torotter - 1) % self.__trotter_dimention][post_time][pre_point] + self.__spin_arr[(torotter + 1) % self.__trotter_dimention][post_time][pre_point])
-        delta_e_arr[4] = self.__spin_arr[torotter][post_time][post_point] * (self.__spin_arr[(torotter - 1) % self.__trotter_dimention][post_time][post_point] + self.__spin_arr[(torotter + 1) % self.__trotter_dimention][post_time][post_point])
+        up_arr = (torotter_arr - 1) % self.__trotter_dimention
+        down_arr = (torotter_arr + 1) % self.__trotter_dimention
+        for i, (time_arr, point_arr) in enumerate([
+            (pre_time_arr, pre_point_arr),
+            (pre_time_arr, post_point_arr),
+            (post_time_arr, pre_point_arr),
+            (post_time_arr, post_point_arr)
+        ]):
+            delta_e_arr[:, i + 1] = spin_arr[torotter_arr, time_arr, point_arr] * (
+                spin_arr[up_arr, time_arr, point_arr] + spin_arr[down_arr, time_arr, point_arr]
+            )
 
-        delta_e = delta_e_arr[0] / self.__trotter_dimention + annealing_e * delta_e_arr[1:].sum()
+        delta_e_arr = delta_e_arr[:, 0] / self.__trotter_dimention + annealing_e * delta_e_arr[:, 1:].sum(axis=1)
 
         # Flip or not.
-        flip_flag = False
-        prob = 0.0
-        if delta_e <= 0:
-            flip_flag = True
-        else:
-            prob = np.exp(-self.__inverse_temperature_beta * self.__gammma)
-            if np.random.binomial(1, prob) == 1:
-                flip_flag = True
-
-        if flip_flag is True:
-            self.__spin_arr[torotter][pre_time][pre_point] *= -1
-            self.__spin_arr[torotter][pre_time][post_point] *= -1
-            self.__spin_arr[torotter][post_time][pre_point] *= -1
-            self.__spin_arr[torotter][post_time][post_point] *= -1
-
-        self.__predicted_log_list.append(
-            (
-                torotter,
-                pre_time,
-                post_time,
-                pre_point,
-                post_point,
-                delta_e,
-                prob,
-                flip_flag
-            )
-        )
+        prob = np.exp(-self.__inverse_temperature_beta * self.__gammma)
+        prob_arr = np.where(delta_e_arr <= 0, 0.0, prob)
+        flip_arr = (delta_e_arr <= 0) | (np.random.binomial(1, prob, size=k) == 1)
+
+        flip_torotter_arr = torotter_arr[flip_arr]
+        for time_arr, point_arr in [
+            (pre_time_arr, pre_point_arr),
+            (pre_time_arr, post_point_arr),
+            (post_time_arr, pre_point_arr),
+            (post_time_arr, post_point_arr)
+        ]:
+            spin_arr[flip_torotter_arr, time_arr[flip_arr], point_arr[flip_arr]] *= -1
+
+        # Log.
+        move_arr = self.__move_n + np.arange(k)
+        log_arr = np.where(move_arr % self.__log_interval == 0)[0]
+        self.__move_n += k
+        if log_arr.shape[0] == 0:
+            return
+
+        predicted_log_arr = self.__predicted_log_arr[self.__log_n:self.__log_n + log_arr.shape[0]]
+        predicted_log_arr["torotter"] = torotter_arr[log_arr]
+        predicted_log_arr["pre_time"] = pre_time_arr[log_arr]
+        predicted_log_arr["post_time"] = post_time_arr[log_arr]
+        predicted_log_arr["pre_point"] = pre_point_arr[log_arr]
+        predicted_log_arr["post_point"] = post_point_arr[log_arr]
+        predicted_log_arr["delta_e"] = delta_e_arr[log_arr]
+        predicted_log_arr["prob"] = prob_arr[log_arr]
+        predicted_log_arr["flip_flag"] = flip_arr[log_arr]
+        self.__log_n += log_arr.shape[0]
 
     def get_spin_arr(self):
         ''' getter '''
@@ -194,3 +298,16 @@ class QuantumMonteCarlo(AnnealingModel):
         raise TypeError("This property must be read-only.")
     
     spin_arr = property(get_spin_arr, set_readonly)
+
+    def get_predicted_log_record_arr(self):
+        '''
+        getter
+
+        Returns:
+            The structured `np.ndarray` of logs of Monte Carlo moves, whose fields are 
+            `torotter`, `pre_time`, `post_time`, `pre_point`, `post_point`, `delta_e`, `prob`, and `flip_flag`.
+            `predicted_log_arr` is the 2-D `np.ndarray` of the same logs.
+        '''
+        return self.__predicted_log_arr
+
+    predicted_log_record_arr = property(get_predicted_log_record_arr, set_readonly)
@@ -1,8 +1,67 @@
 # -*- coding: utf-8 -*-
 import numpy as np
+import random
+from concurrent.futures import ProcessPoolExecutor
 from pyqlearning.annealing_model import AnnealingModel
 from pyqlearning.annealingmodel.cost_functionable import CostFunctionable
 
+# `CostFunctionable` in each worker process.
+_worker_cost_functionable = None
+
+
+def _init_worker(cost_functionable):
+    '''
+    Initialize the worker process of `SimulatedAnnealing.annealing_parallel`.
+
+    Args:
+        cost_functionable:    The object of `CostFunctionable`.
+    '''
+    global _worker_cost_functionable
+    _worker_cost_functionable = cost_functionable
+
+
+def _compute_cost(cost_functionable, x, seed):
+    '''
+    Compute the cost with the fixed seeds of random number generators,
+    so that the result is reproducible in any process.
+    The states of the global random number generators are restored after the computation,
+    so that the random numbers of the caller are not affected.
+
+    Args:
+        cost_functionable:    The object of `CostFunctionable`.
+        x:                    `np.ndarray` of explanatory variables.
+        seed:                 The seed of random number generators. If `None`, the seeds are not fixed.
+
+    Returns:
+        Cost.
+    '''
+    if seed is None:
+        return cost_functionable.compute(x)
+
+    np_random_state = np.random.get_state()
+    random_state = random.getstate()
+    try:
+        np.random.seed(seed)
+        random.seed(seed)
+        return cost_functionable.compute(x)
+    finally:
+        np.random.set_state(np_random_state)
+        random.setstate(random_state)
+
+
+def _compute_cost_in_worker(args):
+    '''
+    Compute the cost in the worker process.
+
+    Args:
+        args:    Tuple of `np.ndarray` of explanatory variables and the seed.
+
+    Returns:
+        Cost.
+    '''
+    x, seed = args
+    return _compute_cost(_worker_cost_functionable, x, seed)
+
 
 class SimulatedAnnealing(AnnealingModel):
     '''
@@ -102,27 +161,43 @@ class SimulatedAnnealing(AnnealingModel):
         # Fractional reduction every cycle.
         self.__fractional_reduction = (self.__final_temp / self.__init_temp) ** (1.0 / (self.__cycles_num-1.0))
 
-    def __move(self, current_pos):
+    def __move(self, current_pos, random_state=None):
         '''
         Move in the feature map.
 
         Args:
             current_pos:    The now position.
+            random_state:   `np.random.RandomState`. If `None`, `np.random` is used.
 
         Returns:
             The next position.
         '''
+        if random_state is None:
+            random_state = np.random
+
         if self.__move_range is not None:
-            next_pos = np.random.randint(current_pos - self.__move_range, current_pos + self.__move_range)
+            next_pos = random_state.randint(current_pos - self.__move_range, current_pos + self.__move_range)
             if next_pos < 0:
                 next_pos = 0
             elif next_pos >= self.var_arr.shape[0] - 1:
                 next_pos = self.var_arr.shape[0] - 1
             return next_pos
         else:
-            next_pos = np.random.randint(self.var_arr.shape[0] - 1)
+            next_pos = random_state.randint(self.var_arr.shape[0] - 1)
             return next_pos
 
+    def change_t(self, t):
+        '''
+        Change temperature.
+
+        Args:
+            t:    Now temperature.
+
+        Returns:
+            Next temperature.
+        '''
+        return t * self.__fractional_reduction
+
     def annealing(self):
         '''
         Annealing.
@@ -180,6 +255,152 @@ class SimulatedAnnealing(AnnealingModel):
 
             self.var_log_arr[i + 1] = current_var_arr
             self.computed_cost_arr[i + 1] = current_cost_arr
-            t = t * self.__fractional_reduction
+            t = self.change_t(t)
 
         self.predicted_log_arr = np.array(predicted_log_list)
+
+    def annealing_parallel(self, replica_n=4, worker_n=None, seed=None, memoize_flag=True):
+        '''
+        Annealing by independent replicas in parallel.
+
+        Each replica is a chain of annealing which has its own random number generator.
+        The replicas are advanced in lockstep, and the candidate positions 
+        proposed by the replicas in each trial are evaluated concurrently 
+        in the pool of worker processes. The `CostFunctionable` must be picklable.
+
+        If `memoize_flag` is `True`, the cost in each position in `var_arr` is 
+        computed only once and reused by all replicas, because revisits are 
+        frequent with the small `move_range`. If `seed` is not `None`, 
+        the random number generators in the cost function are seeded by 
+        `seed` and the position, so that the result is deterministic.
+
+        After annealing, `var_log_arr` and `computed_cost_arr` are the logs of 
+        the replica whose final cost is the minimum. `predicted_log_arr` is 
+        the merged logs of all replicas, sorted in the order of trials and replicas. 
+        The last column of `predicted_log_arr` is the index of replica.
+
+        Args:
+            replica_n:      The number of replicas.
+            worker_n:       The number of worker processes. 
+                            If `1`, the costs are computed in this process.
+                            If `None`, the number of processors on the machine.
+            seed:           The seed of random number generators.
+            memoize_flag:   If `True`, the computed costs are memoized.
+        '''
+        if replica_n <= 0:
+            raise ValueError("The value of `replica_n` must be more than `0`.")
+
+        if seed is not None:
+            random_state_list = [np.random.RandomState(seed + r) for r in range(replica_n)]
+        else:
+            random_state_list = [np.random.RandomState() for _ in range(replica_n)]
+
+        if worker_n == 1:
+            executor = None
+        else:
+            executor = ProcessPoolExecutor(
+                max_workers=worker_n,
+                initializer=_init_worker,
+                initargs=(self.__cost_functionable, )
+            )
+
+        memo_dict = {}
+
+        def compute_cost_list(pos_list):
+            if memoize_flag is True:
+                compute_pos_list = sorted(set([pos for pos in pos_list if pos not in memo_dict]))
+            else:
+                compute_pos_list = pos_list
+
+            if seed is not None:
+                seed_list = [(seed * 1000003 + pos) % (2 ** 32) for pos in compute_pos_list]
+            else:
+                seed_list = [None] * len(compute_pos_list)
+
+            args_list = [(self.var_arr[pos, :], _seed) for pos, _seed in zip(compute_pos_list, seed_list)]
+            if executor is None:
+                cost_list = [_compute_cost(self.__cost_functionable, x, _seed) for x, _seed in args_list]
+            else:
+                cost_list = list(executor.map(_compute_cost_in_worker, args_list))
+
+            if memoize_flag is False:
+                return cost_list
+
+            for pos, cost in zip(compute_pos_list, cost_list):
+                memo_dict[pos] = cost
+            return [memo_dict[pos] for pos in pos_list]
+
+        try:
+            shape_list = list(self.var_arr.shape)
+            shape_list[0] = self.__cycles_num + 1
+            var_log_arr = np.zeros(tuple([replica_n] + shape_list))
+            computed_cost_arr = np.zeros((replica_n, self.__cycles_num + 1))
+
+            current_pos_list = [self.__start_pos] * replica_n
+            current_cost_list = compute_cost_list(current_pos_list)
+            current_var_list = [self.var_arr[self.__start_pos, :]] * replica_n
+            computed_cost_arr[:, 0] = current_cost_list
+            delta_e_avg_list = [0.0] * replica_n
+            accepted_sol_num_list = [self.__accepted_sol_num] * replica_n
+            predicted_log_list_list = [[] for _ in range(replica_n)]
+            merged_log_list = []
+            active_list = [True] * replica_n
+
+            t = self.__init_temp
+            for i in range(self.__cycles_num):
+                for r in range(replica_n):
+                    predicted_log_list = predicted_log_list_list[r]
+                    if isinstance(self.__tolerance_diff_e, float) and len(predicted_log_list) > 1:
+                        diff = abs(predicted_log_list[-1][2] - predicted_log_list[-2][2])
+                        if diff < self.__tolerance_diff_e:
+                            active_list[r] = False
+
+                replica_list = [r for r in range(replica_n) if active_list[r] is True]
+                if len(replica_list) == 0:
+                    break
+
+                for j in range(self.__trials_per_cycle):
+                    for r in replica_list:
+                        current_pos_list[r] = self.__move(current_pos_list[r], random_state_list[r])
+
+                    cost_list = compute_cost_list([current_pos_list[r] for r in replica_list])
+                    for r, cost_arr in zip(replica_list, cost_list):
+                        delta_e = np.abs(cost_arr - current_cost_list[r])
+                        if (cost_arr > current_cost_list[r]):
+                            if (i == 0 and j == 0):
+                                delta_e_avg_list[r] = delta_e
+                            try:
+                                p = np.exp(-delta_e/(delta_e_avg_list[r] * t))
+                            except ZeroDivisionError:
+                                p = 0.0
+
+                            if (random_state_list[r].random_sample() < p):
+                                accept = True
+                            else:
+                                accept = False
+                        else:
+                            accept = True
+                            p = 0.0
+
+                        if accept is True:
+                            current_var_list[r] = self.var_arr[current_pos_list[r], :]
+                            current_cost_list[r] = cost_arr
+                            accepted_sol_num_list[r] = accepted_sol_num_list[r] + 1.0
+                            delta_e_avg_list[r] = (delta_e_avg_list[r] * (accepted_sol_num_list[r] - 1.0) + delta_e) / accepted_sol_num_list[r]
+
+                        predicted_log = (cost_arr, delta_e, delta_e_avg_list[r], p, int(accept))
+                        predicted_log_list_list[r].append(predicted_log)
+                        merged_log_list.append(predicted_log + (r, ))
+
+                for r in replica_list:
+                    var_log_arr[r, i + 1] = current_var_list[r]
+                    computed_cost_arr[r, i + 1] = current_cost_list[r]
+                t = self.change_t(t)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        best_r = int(np.argmin(current_cost_list))
+        self.var_log_arr = var_log_arr[best_r]
+        self.computed_cost_arr = computed_cost_arr[best_r]
+        self.predicted_log_arr = np.array(merged_log_list)
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 from pyqlearning.q_learning import QLearning
 from abc import ABCMeta, abstractmethod
+import os
+import pickle
 import pandas as pd
 import numpy as np
 import random
@@ -71,6 +73,79 @@ class MultiAgentQLearning(metaclass=ABCMeta):
         self.__t = value
 
     t = property(get_t, set_t)
+
+    # The time from which the first game is resumed. If `None`, the games start from `1`.
+    __resumed_t = None
+
+    def start_game(self):
+        '''
+        Set the time in the beginning of each game.
+
+        The time is `1`, except in the first game after `resume`,
+        which continues from the time loaded from the directory.
+        '''
+        if self.__resumed_t is None:
+            self.t = 1
+        else:
+            self.t = self.__resumed_t
+            self.__resumed_t = None
+
+    # The number of steps of each agent.
+    __step_n_arr = None
+    # The elapsed seconds of each agent.
+    __elapsed_arr = None
+
+    def add_throughput(self, agent_i, step_n, elapsed_sec):
+        '''
+        Count the steps of the agent and its elapsed time.
+
+        Args:
+            agent_i:        `int` of the index of agent in `q_learning_list`.
+            step_n:         `int` of the number of steps.
+            elapsed_sec:    `float` of the elapsed seconds.
+        '''
+        if self.__step_n_arr is None or self.__step_n_arr.shape[0] != len(self.q_learning_list):
+            self.reset_throughput()
+        self.__step_n_arr[agent_i] += step_n
+        self.__elapsed_arr[agent_i] += elapsed_sec
+
+    def reset_throughput(self):
+        ''' Reset the counters of throughput. '''
+        self.__step_n_arr = np.zeros(len(self.q_learning_list), dtype=np.int64)
+        self.__elapsed_arr = np.zeros(len(self.q_learning_list), dtype=np.float64)
+
+    def get_throughput_df(self):
+        '''
+        getter
+
+        Returns:
+            `pd.DataFrame` of throughput, which has the columns of 
+            `agent`, `step_n`, `elapsed_sec`, and `steps_per_sec`.
+        '''
+        if self.__step_n_arr is None or self.__step_n_arr.shape[0] != len(self.q_learning_list):
+            self.reset_throughput()
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            steps_per_sec_arr = np.where(
+                self.__elapsed_arr > 0,
+                self.__step_n_arr / self.__elapsed_arr,
+                0.0
+            )
+        return pd.DataFrame(
+            {
+                "agent": np.arange(self.__step_n_arr.shape[0]),
+                "step_n": self.__step_n_arr,
+                "elapsed_sec": self.__elapsed_arr,
+                "steps_per_sec": steps_per_sec_arr
+            },
+            columns=["agent", "step_n", "elapsed_sec", "steps_per_sec"]
+        )
+
+    def set_throughput_df(self, value):
+        ''' setter '''
+        raise TypeError("This property must be read-only.")
+
+    throughput_df = property(get_throughput_df, set_throughput_df)
     
     @abstractmethod
     def learn(self, initial_state_key, limit=1000, game_n=1):
@@ -83,3 +158,64 @@ class MultiAgentQLearning(metaclass=ABCMeta):
             game_n:             The number of games.
         '''
         raise NotImplementedError("This method must be implemented.")
+
+    def save(self, dir_path):
+        '''
+        Save Q-Values, R-Values, and time of all agents in the directory.
+
+        The tables of each agent are saved by `QLearning.save` in `dir_path/agent_{i}`.
+
+        Args:
+            dir_path:       The path of directory.
+        '''
+        os.makedirs(dir_path, exist_ok=True)
+        for i in range(len(self.q_learning_list)):
+            self.q_learning_list[i].save(os.path.join(dir_path, "agent_" + str(i)))
+
+        meta_path = os.path.join(dir_path, "multi_agent_q_learning.pkl")
+        with open(meta_path + ".tmp", "wb") as f:
+            pickle.dump({"t": self.t, "agent_n": len(self.q_learning_list)}, f)
+        os.replace(meta_path + ".tmp", meta_path)
+
+    def load(self, dir_path, read_only_flag=False):
+        '''
+        Load Q-Values, R-Values, and time of all agents from the directory.
+
+        Args:
+            dir_path:           The path of directory.
+            read_only_flag:     If `True`, Q-Values are memory-mapped without copy 
+                                and can not be updated.
+                                The keys of states and actions are still loaded into memory.
+        '''
+        with open(os.path.join(dir_path, "multi_agent_q_learning.pkl"), "rb") as f:
+            meta_dict = pickle.load(f)
+
+        if meta_dict["agent_n"] != len(self.q_learning_list):
+            raise ValueError("The number of agents must be " + str(meta_dict["agent_n"]) + ".")
+
+        for i in range(len(self.q_learning_list)):
+            self.q_learning_list[i].load(
+                os.path.join(dir_path, "agent_" + str(i)),
+                read_only_flag=read_only_flag
+            )
+        self.t = meta_dict["t"]
+
+    def resume(self, dir_path, initial_state_key, limit=1000, game_n=1):
+        '''
+        Resume Multi-Agent Learning with the tables saved in the directory.
+
+        The first game continues from the time loaded from the directory,
+        and the following games start from `1`.
+
+        Args:
+            dir_path:           The path of directory.
+            initial_state_key:  first state.
+            limit:              Limit of the number of learning.
+            game_n:             The number of games.
+        '''
+        self.load(dir_path)
+        self.__resumed_t = self.t
+        try:
+            self.learn(initial_state_key, limit=limit, game_n=game_n)
+        finally:
+            self.__resumed_t = None
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
-from pyqlearning.multi_agent_q_learning import MultiAgentQLearning
+from pyqlearning.misc.multi_agent_q_learning import MultiAgentQLearning
+import time
 import copy
 
 
@@ -23,9 +24,10 @@ class AlternatedMultiAgent(MultiAgentQLearning):
         end_flag_list = [False] * len(self.q_learning_list)
         for game in range(game_n):
             state_key = copy.copy(initial_state_key)
-            self.t = 1
+            self.start_game()
             while self.t <= limit:
                 for i in range(len(self.q_learning_list)):
+                    start = time.perf_counter()
                     if game + 1 == game_n:
                         self.state_key_list.append((i, copy.copy(state_key)))
                     self.q_learning_list[i].t = self.t
@@ -66,6 +68,8 @@ class AlternatedMultiAgent(MultiAgentQLearning):
                         # Update State.
                         state_key = next_state_key
 
+                    self.add_throughput(i, 1, time.perf_counter() - start)
+
                     # Epsode.
                     self.t += 1
                     self.q_learning_list[i].t = self.t
@@ -0,0 +1,423 @@
+# -*- coding: utf-8 -*-
+from pyqlearning.misc.multi_agent_q_learning import MultiAgentQLearning
+from multiprocessing import shared_memory
+from threading import BrokenBarrierError
+import multiprocessing as mp
+import numpy as np
+import os
+import queue
+import random
+import time
+import traceback
+
+# Commands to workers.
+_STEP = 1
+_STOP = 0
+
+
+def _attach_arr(shm, agent_n, state_dim):
+    '''
+    Create the views of arrays in the shared memory.
+
+    Args:
+        shm:        `multiprocessing.shared_memory.SharedMemory`.
+        agent_n:    `int` of the number of agents.
+        state_dim:  `int` of the dimension of state of each agent.
+
+    Returns:
+        `dict` of `np.ndarray`s.
+    '''
+    shape_list = [
+        ("control_arr", (3, )),
+        ("state_arr", (agent_n, state_dim)),
+        ("next_state_arr", (agent_n, state_dim)),
+        ("end_arr", (agent_n, )),
+        ("step_n_arr", (agent_n, )),
+        ("elapsed_arr", (agent_n, )),
+    ]
+    arr_dict = {}
+    offset = 0
+    for key, shape in shape_list:
+        arr_dict[key] = np.ndarray(shape, dtype=np.float64, buffer=shm.buf, offset=offset)
+        offset += int(np.prod(shape)) * np.dtype(np.float64).itemsize
+    return arr_dict
+
+
+def _compute_shm_size(agent_n, state_dim):
+    ''' The size of shared memory in bytes. '''
+    return (3 + agent_n * state_dim * 2 + agent_n * 3) * np.dtype(np.float64).itemsize
+
+
+def _step_agent(q_learning, agent_i, joint_state_key, t):
+    '''
+    Step the agent once.
+
+    Args:
+        q_learning:         is-a `QLearning`.
+        agent_i:            `int` of the index of agent.
+        joint_state_key:    `tuple` of the states of all agents in the beginning of this round.
+        t:                  `int` of time.
+
+    Returns:
+        Tuple data.
+        - The next state of the agent.
+        - `bool` of end flag.
+    '''
+    q_learning.t = t
+    state_key = (agent_i, joint_state_key)
+    next_action_list = q_learning.extract_possible_actions(state_key)
+    if len(next_action_list) == 0:
+        return joint_state_key[agent_i], False
+
+    action_key = q_learning.select_action(
+        state_key=state_key,
+        next_action_list=next_action_list
+    )
+    reward_value = q_learning.observe_reward_value(state_key, action_key)
+
+    # Check.
+    end_flag = q_learning.check_the_end_flag(state_key)
+
+    next_agent_state_key = q_learning.update_state(
+        state_key=state_key,
+        action_key=action_key
+    )
+    next_joint_state_key = list(joint_state_key)
+    next_joint_state_key[agent_i] = tuple(next_agent_state_key)
+    next_state_key = (agent_i, tuple(next_joint_state_key))
+
+    # Max-Q-Value in next action time.
+    next_next_action_list = q_learning.extract_possible_actions(next_state_key)
+    if len(next_next_action_list):
+        next_action_key = q_learning.predict_next_action(
+            next_state_key,
+            next_next_action_list
+        )
+        next_max_q = q_learning.extract_q_df(next_state_key, next_action_key)
+
+        # Update Q-Value.
+        q_learning.update_q(
+            state_key=state_key,
+            action_key=action_key,
+            reward_value=reward_value,
+            next_max_q=next_max_q
+        )
+
+    return next_agent_state_key, end_flag is True
+
+
+def _step_agents(agent_i_list, q_learning_list, arr_dict, seed=None):
+    '''
+    Step the agents once, observing the states in the shared arrays.
+
+    Args:
+        agent_i_list:       `list` of the indices of agents.
+        q_learning_list:    `list` of `QLearning`s.
+        arr_dict:           `dict` of the shared arrays.
+        seed:               `int` of the seed of random numbers.
+                            The random numbers are seeded for each game, time, and agent,
+                            so that the result does not depend on the number of workers.
+                            The states of the global random number generators are restored 
+                            after the step, because the agents may be stepped in the caller's process.
+    '''
+    t = int(arr_dict["control_arr"][1])
+    game = int(arr_dict["control_arr"][2])
+    joint_state_key = tuple(tuple(row) for row in arr_dict["state_arr"].tolist())
+    if seed is not None:
+        np_random_state = np.random.get_state()
+        random_state = random.getstate()
+    try:
+        for agent_i, q_learning in zip(agent_i_list, q_learning_list):
+            start = time.perf_counter()
+            if seed is not None:
+                agent_seed = int(np.random.SeedSequence([seed, game, t, agent_i]).generate_state(1)[0])
+                np.random.seed(agent_seed)
+                random.seed(agent_seed)
+            next_agent_state_key, end_flag = _step_agent(q_learning, agent_i, joint_state_key, t)
+            arr_dict["next_state_arr"][agent_i] = next_agent_state_key
+            arr_dict["end_arr"][agent_i] = float(end_flag)
+            arr_dict["step_n_arr"][agent_i] += 1
+            arr_dict["elapsed_arr"][agent_i] += time.perf_counter() - start
+    finally:
+        if seed is not None:
+            np.random.set_state(np_random_state)
+            random.setstate(random_state)
+
+
+def _run_worker(
+    worker_i,
+    agent_i_list,
+    q_learning_list,
+    shm,
+    agent_n,
+    state_dim,
+    barrier,
+    result_queue,
+    seed,
+    timeout
+):
+    '''
+    Run the worker which steps its agents in each round until the stop command.
+    The learned agents are sent back by `result_queue`.
+    If the parent process does not reach the barrier in `timeout` seconds, the worker stops.
+    '''
+    arr_dict = _attach_arr(shm, agent_n, state_dim)
+    try:
+        while True:
+            barrier.wait(timeout)
+            if int(arr_dict["control_arr"][0]) == _STOP:
+                break
+            _step_agents(agent_i_list, q_learning_list, arr_dict, seed)
+            barrier.wait(timeout)
+        result_queue.put((worker_i, q_learning_list, None))
+    except BrokenBarrierError:
+        result_queue.put((worker_i, None, None))
+    except Exception:
+        result_queue.put((worker_i, None, traceback.format_exc()))
+        barrier.abort()
+    finally:
+        del arr_dict
+        shm.close()
+
+
+class ParallelMultiAgent(MultiAgentQLearning):
+    '''
+    Multi-Agent which learn in parallel as independent learners.
+
+    In each round, all agents observe the states of all agents in the beginning
+    of the round, and act simultaneously. The agent `i` is given the state key
+    `(i, joint_state_key)`, where `joint_state_key` is the `tuple` of states of all agents,
+    and its `update_state` must return the next state of the agent `i` only,
+    which is a sequence of `state_dim` numbers.
+
+    Because the updates of agents in one round do not depend on each other,
+    the agents are distributed to the worker processes. The states of agents
+    are exchanged through the arrays in the shared memory, and the learned
+    agents are sent back to `q_learning_list` when the learning ends.
+    '''
+
+    def __init__(self, q_learning_list, worker_n=None, seed=None, timeout=600.0):
+        '''
+        Init.
+
+        Args:
+            q_learning_list:    `list` of `QLearning`s.
+            worker_n:           `int` of the number of worker processes.
+                                If `None`, `min(len(q_learning_list), os.cpu_count())`.
+                                If `1`, the agents are stepped in this process.
+            seed:               `int` of the seed of random numbers. If not `None`, 
+                                the random numbers are seeded for each game, time, and agent.
+            timeout:            `float` of the seconds to wait for the worker processes in each round.
+                                If a worker process does not finish the round in time, 
+                                for instance because it was killed, the learning is aborted.
+        '''
+        super().__init__(q_learning_list)
+        if worker_n is None:
+            worker_n = min(len(q_learning_list), os.cpu_count() or 1)
+        if isinstance(worker_n, int) is False:
+            raise TypeError("The type of `worker_n` must be `int`.")
+        if worker_n <= 0:
+            raise ValueError("The value of `worker_n` must be more than `0`.")
+        if isinstance(timeout, int) is False and isinstance(timeout, float) is False:
+            raise TypeError("The type of `timeout` must be `float`.")
+        if timeout <= 0:
+            raise ValueError("The value of `timeout` must be more than `0`.")
+
+        self.__worker_n = min(worker_n, max(len(q_learning_list), 1))
+        self.__seed = seed
+        self.__timeout = timeout
+
+    def learn(self, initial_state_key, limit=1000, game_n=1):
+        '''
+        Multi-Agent Learning.
+
+        Override.
+
+        Args:
+            initial_state_key:  Initial states of all agents.
+                                The shape is: (the number of agents, `state_dim`)
+            limit:              Limit of the number of rounds.
+            game_n:             The number of games.
+        '''
+        initial_state_arr = np.array(initial_state_key, dtype=np.float64)
+        agent_n = len(self.q_learning_list)
+        if initial_state_arr.ndim != 2 or initial_state_arr.shape[0] != agent_n:
+            raise ValueError("The shape of `initial_state_key` must be (the number of agents, `state_dim`).")
+        state_dim = initial_state_arr.shape[1]
+
+        shm = shared_memory.SharedMemory(create=True, size=_compute_shm_size(agent_n, state_dim))
+        arr_dict = _attach_arr(shm, agent_n, state_dim)
+        arr_dict["step_n_arr"][:] = 0
+        arr_dict["elapsed_arr"][:] = 0
+
+        agent_i_list_list = [list(range(agent_n))[w::self.__worker_n] for w in range(self.__worker_n)]
+        process_list = []
+        barrier = None
+        result_queue = None
+        if self.__worker_n > 1:
+            barrier = mp.Barrier(self.__worker_n + 1)
+            result_queue = mp.Queue()
+            for worker_i, agent_i_list in enumerate(agent_i_list_list):
+                process = mp.Process(
+                    target=_run_worker,
+                    args=(
+                        worker_i,
+                        agent_i_list,
+                        [self.q_learning_list[i] for i in agent_i_list],
+                        shm,
+                        agent_n,
+                        state_dim,
+                        barrier,
+                        result_queue,
+                        self.__seed,
+                        self.__timeout
+                    ),
+                    daemon=True
+                )
+                process.start()
+                process_list.append(process)
+
+        try:
+            for game in range(game_n):
+                arr_dict["state_arr"][:] = initial_state_arr
+                self.start_game()
+                while self.t <= limit:
+                    if game + 1 == game_n:
+                        joint_state_key = tuple(tuple(row) for row in arr_dict["state_arr"].tolist())
+                        self.state_key_list.extend([(i, joint_state_key) for i in range(agent_n)])
+
+                    arr_dict["control_arr"][:] = [_STEP, self.t, game]
+                    if self.__worker_n > 1:
+                        # Start and finish the round.
+                        barrier.wait(self.__timeout)
+                        barrier.wait(self.__timeout)
+                    else:
+                        _step_agents(list(range(agent_n)), self.q_learning_list, arr_dict, self.__seed)
+
+                    arr_dict["state_arr"][:] = arr_dict["next_state_arr"]
+                    self.t += 1
+                    if arr_dict["end_arr"].any():
+                        break
+
+            if self.__worker_n > 1:
+                arr_dict["control_arr"][0] = _STOP
+                barrier.wait(self.__timeout)
+                missing_list = self.__collect(result_queue, process_list)
+                if len(missing_list) > 0:
+                    raise RuntimeError(
+                        "The worker process was terminated. " + self.__describe_exit(process_list, missing_list)
+                    )
+
+            for i in range(agent_n):
+                self.q_learning_list[i].t = self.t
+                self.add_throughput(
+                    i,
+                    int(arr_dict["step_n_arr"][i]),
+                    float(arr_dict["elapsed_arr"][i])
+                )
+
+        except BrokenBarrierError:
+            # The errors raised in the workers are reported first.
+            missing_list = self.__collect(result_queue, process_list)
+            dead_list = [
+                worker_i for worker_i in missing_list if process_list[worker_i].is_alive() is False
+            ]
+            if len(dead_list) > 0:
+                raise RuntimeError(
+                    "The worker process was terminated. " + self.__describe_exit(process_list, dead_list)
+                )
+            raise RuntimeError(
+                "The worker process was aborted or did not finish the round in " + str(self.__timeout) + " seconds."
+            )
+
+        finally:
+            if barrier is not None:
+                barrier.abort()
+            for process in process_list:
+                process.join(timeout=10)
+                if process.is_alive():
+                    process.terminate()
+            del arr_dict
+            shm.close()
+            shm.unlink()
+
+    def __collect(self, result_queue, process_list):
+        '''
+        Collect the learned agents from workers.
+        The workers which were terminated without sending the result are skipped.
+
+        Args:
+            result_queue:   `multiprocessing.Queue`.
+            process_list:   `list` of `multiprocessing.Process`es of workers.
+
+        Returns:
+            `list` of the indices of workers which did not send the result.
+        '''
+        agent_n = len(self.q_learning_list)
+        agent_i_list_list = [list(range(agent_n))[w::self.__worker_n] for w in range(self.__worker_n)]
+        error_list = []
+        received_set = set()
+        last_flag = False
+        while len(received_set) < self.__worker_n:
+            try:
+                worker_i, q_learning_list, error = result_queue.get(timeout=1.0)
+            except queue.Empty:
+                alive_flag = False
+                for worker_i, process in enumerate(process_list):
+                    if worker_i not in received_set and process.is_alive() is True:
+                        alive_flag = True
+                if alive_flag is True:
+                    continue
+                # The result sent just before the termination may still be in the queue.
+                if last_flag is True:
+                    break
+                last_flag = True
+                continue
+
+            received_set.add(worker_i)
+            if error is not None:
+                error_list.append(error)
+            if q_learning_list is None:
+                continue
+            for agent_i, q_learning in zip(agent_i_list_list[worker_i], q_learning_list):
+                self.q_learning_list[agent_i] = q_learning
+
+        if len(error_list) > 0:
+            raise RuntimeError("The worker process raised the error.\n" + "\n".join(error_list))
+
+        return [worker_i for worker_i in range(self.__worker_n) if worker_i not in received_set]
+
+    def __describe_exit(self, process_list, worker_i_list):
+        '''
+        Describe the exit codes of workers.
+
+        Args:
+            process_list:   `list` of `multiprocessing.Process`es of workers.
+            worker_i_list:  `list` of the indices of workers.
+
+        Returns:
+            `str` of the description.
+        '''
+        return ", ".join(
+            ["worker " + str(worker_i) + ": exit code " + str(process_list[worker_i].exitcode) for worker_i in worker_i_list]
+        )
+
+    def get_timeout(self):
+        ''' getter '''
+        return self.__timeout
+
+    def set_timeout(self, value):
+        ''' setter '''
+        raise TypeError("This property must be read-only.")
+
+    timeout = property(get_timeout, set_timeout)
+
+    def get_worker_n(self):
+        ''' getter '''
+        return self.__worker_n
+
+    def set_worker_n(self, value):
+        ''' setter '''
+        raise TypeError("This property must be read-only.")
+
+    worker_n = property(get_worker_n, set_worker_n)
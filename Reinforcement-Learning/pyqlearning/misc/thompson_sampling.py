@@ -1,24 +1,83 @@
 #!/user/bin/env python
 # -*- coding: utf-8 -*-
-from beta_dist import BetaDist
+import os
+import numpy as np
 
 
 class ThompsonSampling(object):
     '''
     Thompson Sampling.
-    '''
 
-    # Dict of Beta Distribution.
-    __beta_dist_dict = {}
+    The posterior of each arm is the Beta distribution whose parameters are
+    the numbers of success and failure added to the prior `default_alpha` and
+    `default_beta`. These parameters of all arms are stored in `np.ndarray`s,
+    so that the samples from the posteriors of all arms can be drawn in one call
+    and the arms can be ranked by `np.argpartition`.
+
+    References:
+        - Agrawal, S., & Goyal, N. (2011). Analysis of Thompson sampling for the multi-armed bandit problem. arXiv preprint arXiv:1111.1797.
+        - Chapelle, O., & Li, L. (2011). An empirical evaluation of thompson sampling. In Advances in neural information processing systems (pp. 2249-2257).
+    '''
 
-    def __init__(self, arm_id_list):
+    def __init__(self, arm_id_list, default_alpha=1.0, default_beta=1.0, init_capacity=1024, seed=None):
         '''
         Initialization
 
+        Args:
+            arm_id_list:        List of arms Master id.
+            default_alpha:      Alpha of the prior distribution.
+            default_beta:       Beta of the prior distribution.
+            init_capacity:      The initial capacity of the arrays of arms.
+            seed:               The seed of random numbers.
+        '''
+        if isinstance(default_alpha, int) is False and isinstance(default_alpha, float) is False:
+            raise TypeError("The type of `default_alpha` must be `int` or `float`.")
+        if isinstance(default_beta, int) is False and isinstance(default_beta, float) is False:
+            raise TypeError("The type of `default_beta` must be `int` or `float`.")
+        if default_alpha <= 0:
+            raise ValueError("The value of `default_alpha` must be more than `0`.")
+        if default_beta <= 0:
+            raise ValueError("The value of `default_beta` must be more than `0`.")
+        if isinstance(init_capacity, int) is False:
+            raise TypeError("The type of `init_capacity` must be `int`.")
+        if init_capacity <= 0:
+            raise ValueError("The value of `init_capacity` must be more than `0`.")
+
+        self.__random = np.random.default_rng(seed)
+        self.__default_alpha = float(default_alpha)
+        self.__default_beta = float(default_beta)
+        self.__arm_id_list = []
+        self.__arm_index_dict = {}
+        self.__success_arr = np.zeros(init_capacity, dtype=np.float64)
+        self.__failure_arr = np.zeros(init_capacity, dtype=np.float64)
+        self.add_arm(arm_id_list)
+
+    def add_arm(self, arm_id_list):
+        '''
+        Add arms. The arms which have been added are ignored.
+
         Args:
             arm_id_list:    List of arms Master id.
         '''
-        [self.__beta_dist_dict.setdefault(key, BetaDist()) for key in arm_id_list]
+        arm_id_list = [
+            arm_id for arm_id in dict.fromkeys(arm_id_list) if arm_id not in self.__arm_index_dict
+        ]
+        size = len(self.__arm_id_list)
+        capacity = self.__success_arr.shape[0]
+        while capacity < size + len(arm_id_list):
+            capacity *= 2
+
+        if capacity > self.__success_arr.shape[0]:
+            success_arr = np.zeros(capacity, dtype=np.float64)
+            failure_arr = np.zeros(capacity, dtype=np.float64)
+            success_arr[:size] = self.__success_arr[:size]
+            failure_arr[:size] = self.__failure_arr[:size]
+            self.__success_arr = success_arr
+            self.__failure_arr = failure_arr
+
+        for i, arm_id in enumerate(arm_id_list):
+            self.__arm_index_dict[arm_id] = size + i
+        self.__arm_id_list.extend(arm_id_list)
 
     def pull(self, arm_id, success, failure):
         '''
@@ -29,18 +88,213 @@ class ThompsonSampling(object):
             success:    The number of success.
             failure:    The number of failure.
         '''
-        self.__beta_dist_dict[arm_id].observe(success, failure)
+        self.pull_many([arm_id], [success], [failure])
+
+    def pull_many(self, arm_id_list, success_list, failure_list):
+        '''
+        Pull arms by the batch of events.
+        The same arm can be pulled several times in one batch.
+
+        Args:
+            arm_id_list:    List of arms Master id.
+            success_list:   List or `np.ndarray` of the numbers of success.
+            failure_list:   List or `np.ndarray` of the numbers of failure.
+        '''
+        success_arr = np.asarray(success_list, dtype=np.float64)
+        failure_arr = np.asarray(failure_list, dtype=np.float64)
+        if success_arr.shape != (len(arm_id_list), ) or failure_arr.shape != (len(arm_id_list), ):
+            raise ValueError("The length of `arm_id_list`, `success_list`, and `failure_list` must be equivalent.")
+        if (success_arr < 0).any() or (failure_arr < 0).any():
+            raise ValueError("The number of success and failure must be non-negative.")
+
+        try:
+            index_arr = np.array(
+                [self.__arm_index_dict[arm_id] for arm_id in arm_id_list],
+                dtype=np.int64
+            )
+        except KeyError as e:
+            raise KeyError("The arm has not been added: " + str(e))
+
+        np.add.at(self.__success_arr, index_arr, success_arr)
+        np.add.at(self.__failure_arr, index_arr, failure_arr)
+
+    def draw(self, sample_n=None):
+        '''
+        Draw samples from the posterior distributions of all arms.
+
+        Args:
+            sample_n:   `int` of the number of samples per arm. If `None`, one sample is drawn.
+
+        Returns:
+            `np.ndarray` of samples. The shape is: (arm_n, ) or (sample_n, arm_n)
+        '''
+        alpha_arr, beta_arr = self.__extract_param()
+        if sample_n is None:
+            return self.__random.beta(alpha_arr, beta_arr)
+        return self.__random.beta(alpha_arr, beta_arr, size=(sample_n, alpha_arr.shape[0]))
+
+    def recommend(self, limit=10, expected_flag=False):
+        '''
+        Listup arms and sampled value.
+
+        Args:
+            limit:          Length of the list.
+            expected_flag:  If `True`, arms are ranked by the expected values of
+                            the posterior distributions instead of the samples.
+
+        Returns:
+            [Tuple(`Arms master id`, `sampled value` or `expected value`)]
+        '''
+        if expected_flag is True:
+            value_arr = self.get_expected_value_arr()
+        else:
+            value_arr = self.draw()
+
+        index_arr = self.__rank(value_arr[None, :], limit)[0]
+        return [(self.__arm_id_list[index], float(value_arr[index])) for index in index_arr]
+
+    def recommend_many(self, request_n, limit=10):
+        '''
+        Listup arms for the batch of requests.
+        Each request is recommended by independent samples.
+
+        Args:
+            request_n:  `int` of the number of requests.
+            limit:      Length of the list per request.
+
+        Returns:
+            `list` of [Tuple(`Arms master id`, `sampled value`)]
+        '''
+        value_arr = self.draw(sample_n=request_n)
+        index_arr = self.__rank(value_arr, limit)
+        return [
+            [(self.__arm_id_list[index], float(value_arr[i, index])) for index in index_arr[i]]
+            for i in range(index_arr.shape[0])
+        ]
 
-    def recommend(self, limit=10):
+    def __rank(self, value_arr, limit):
         '''
-        Listup arms and expected value.
+        Rank arms by values.
 
         Args:
+            value_arr:  `np.ndarray` of values. The shape is: (request_n, arm_n)
             limit:      Length of the list.
 
         Returns:
-            [Tuple(`Arms master id`, `expected value`)]
+            `np.ndarray` of the indices of top arms in descending order.
+        '''
+        limit = min(limit, value_arr.shape[1])
+        if limit <= 0:
+            return np.zeros((value_arr.shape[0], 0), dtype=np.int64)
+
+        if limit < value_arr.shape[1]:
+            index_arr = np.argpartition(-value_arr, limit - 1, axis=1)[:, :limit]
+        else:
+            index_arr = np.tile(np.arange(value_arr.shape[1]), (value_arr.shape[0], 1))
+
+        row_arr = np.arange(value_arr.shape[0])[:, None]
+        order_arr = np.argsort(-value_arr[row_arr, index_arr], axis=1)
+        return index_arr[row_arr, order_arr]
+
+    def __extract_param(self):
+        '''
+        Extract the parameters of the posterior distributions.
+
+        Returns:
+            Tuple(`np.ndarray` of alpha, `np.ndarray` of beta)
+        '''
+        size = len(self.__arm_id_list)
+        return (
+            self.__success_arr[:size] + self.__default_alpha,
+            self.__failure_arr[:size] + self.__default_beta
+        )
+
+    def get_expected_value_arr(self):
+        '''
+        getter
+
+        Returns:
+            `np.ndarray` of the expected values of the posterior distributions.
+        '''
+        alpha_arr, beta_arr = self.__extract_param()
+        return alpha_arr / (alpha_arr + beta_arr)
+
+    def get_variance_arr(self):
+        '''
+        getter
+
+        Returns:
+            `np.ndarray` of the variances of the posterior distributions.
+        '''
+        alpha_arr, beta_arr = self.__extract_param()
+        return alpha_arr * beta_arr / (((alpha_arr + beta_arr) ** 2) * (alpha_arr + beta_arr + 1))
+
+    def get_arm_id_list(self):
+        ''' getter '''
+        return self.__arm_id_list[:]
+
+    def set_readonly(self, value):
+        ''' setter '''
+        raise TypeError("This property must be read-only.")
+
+    expected_value_arr = property(get_expected_value_arr, set_readonly)
+    variance_arr = property(get_variance_arr, set_readonly)
+    arm_id_list = property(get_arm_id_list, set_readonly)
+
+    def save(self, file_path):
+        '''
+        Save the parameters of arms.
+
+        The file is written in the temporary file and replaced atomically,
+        so that the file is never observed as partially written.
+
+        Args:
+            file_path:  The path of file.
+        '''
+        size = len(self.__arm_id_list)
+        arm_id_arr = np.empty(size, dtype=object)
+        arm_id_arr[:] = self.__arm_id_list
+
+        tmp_file_path = file_path + ".tmp"
+        with open(tmp_file_path, "wb") as f:
+            np.savez(
+                f,
+                arm_id_arr=arm_id_arr,
+                success_arr=self.__success_arr[:size],
+                failure_arr=self.__failure_arr[:size],
+                prior_arr=np.array([self.__default_alpha, self.__default_beta])
+            )
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file_path, file_path)
+
+    def load(self, file_path):
+        '''
+        Load the parameters of arms.
+        All arms in this object are replaced.
+
+        Args:
+            file_path:  The path of file.
+        '''
+        with np.load(file_path, allow_pickle=True) as data:
+            arm_id_list = data["arm_id_arr"].tolist()
+            success_arr = data["success_arr"]
+            failure_arr = data["failure_arr"]
+            default_alpha, default_beta = data["prior_arr"].tolist()
+
+        capacity = max(self.__success_arr.shape[0], len(arm_id_list))
+        self.__default_alpha = default_alpha
+        self.__default_beta = default_beta
+        self.__arm_id_list = arm_id_list
+        self.__arm_index_dict = {arm_id: index for index, arm_id in enumerate(arm_id_list)}
+        self.__success_arr = np.zeros(capacity, dtype=np.float64)
+        self.__failure_arr = np.zeros(capacity, dtype=np.float64)
+        self.__success_arr[:len(arm_id_list)] = success_arr
+        self.__failure_arr[:len(arm_id_list)] = failure_arr
+
+    def __len__(self):
+        '''
+        Returns:
+            The number of arms.
         '''
-        expected_list = [(arm_id, beta_dist.expected_value()) for arm_id, beta_dist in self.__beta_dist_dict.items()]
-        expected_list = sorted(expected_list, key=lambda x: x[1], reverse=True)
-        return expected_list[:limit]
+        return len(self.__arm_id_list)
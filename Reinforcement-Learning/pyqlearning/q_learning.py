@@ -2,7 +2,12 @@
 from abc import ABCMeta, abstractmethod
 import pandas as pd
 import numpy as np
+import os
+import pickle
 import random
+from copy import copy
+from pyqlearning.q_value_storable import QValueStorable
+from pyqlearning.qvaluestorable.hash_indexed_q_store import HashIndexedQStore
 
 
 class QLearning(metaclass=ABCMeta):
@@ -87,13 +92,46 @@ class QLearning(metaclass=ABCMeta):
 
     gamma_value = property(get_gamma_value, set_gamma_value)
 
+    # The store of Q(state, action).
+    __q_store = None
+
+    def get_q_store(self):
+        '''
+        getter
+        The store of Q(state, action), which is-a `QValueStorable`.
+        If `None`, Q-Values are stored in `pd.DataFrame`.
+        '''
+        if isinstance(self.__q_store, QValueStorable) is False and self.__q_store is not None:
+            raise TypeError("The type of `__q_store` must be `QValueStorable`.")
+        return self.__q_store
+
+    def set_q_store(self, value):
+        '''
+        setter
+        The store of Q(state, action), which is-a `QValueStorable`.
+        '''
+        if isinstance(value, QValueStorable) is False and value is not None:
+            raise TypeError("The type of `__q_store` must be `QValueStorable`.")
+        self.__q_store = value
+
+    q_store = property(get_q_store, set_q_store)
+
     # Q(state, action)
     __q_df = None
 
     def get_q_df(self):
         '''
         getter
+
+        If `q_store` is not `None`, this property is the view of `q_store`.
+        In this case, the view should not be updated in place.
+        Set the updated `pd.DataFrame` to this property.
         '''
+        if self.q_store is not None:
+            if len(self.q_store) == 0:
+                return None
+            return self.q_store.get_q_df()
+
         if isinstance(self.__q_df, pd.DataFrame) is False and self.__q_df is not None:
             raise TypeError("The type of `__q_df` must be `pd.DataFrame`.")
         return self.__q_df
@@ -104,7 +142,10 @@ class QLearning(metaclass=ABCMeta):
         '''
         if isinstance(value, pd.DataFrame) is False and value is not None:
             raise TypeError("The type of `__q_df` must be `pd.DataFrame`.")
-        self.__q_df = value
+        if self.q_store is not None:
+            self.q_store.set_q_df(value)
+        else:
+            self.__q_df = value
 
     q_df = property(get_q_df, set_q_df)
 
@@ -121,6 +162,14 @@ class QLearning(metaclass=ABCMeta):
 
         '''
         q = 0.0
+        if self.q_store is not None:
+            _q = self.q_store.extract_q(state_key, action_key)
+            if _q is None:
+                self.save_q_df(state_key, action_key, q)
+            else:
+                q = _q
+            return q
+
         if self.q_df is None:
             self.save_q_df(state_key, action_key, q)
             return q
@@ -150,6 +199,10 @@ class QLearning(metaclass=ABCMeta):
         if isinstance(q_value, float) is False:
             raise TypeError("The type of q_value must be float.")
 
+        if self.q_store is not None:
+            self.q_store.save_q(state_key, action_key, q_value)
+            return
+
         new_q_df = pd.DataFrame([(state_key, action_key, q_value)], columns=["state_key", "action_key", "q_value"])
         if self.q_df is not None:
             self.q_df = pd.concat([new_q_df, self.q_df])
@@ -249,15 +302,167 @@ class QLearning(metaclass=ABCMeta):
 
     t = property(get_t, set_t)
 
+    # The path of directory to save checkpoints in learning.
+    __checkpoint_dir_path = None
+
+    def get_checkpoint_dir_path(self):
+        '''
+        getter
+        The path of directory to save checkpoints in learning.
+        If `None`, checkpoints are not saved.
+        '''
+        return self.__checkpoint_dir_path
+
+    def set_checkpoint_dir_path(self, value):
+        '''
+        setter
+        The path of directory to save checkpoints in learning.
+        '''
+        if isinstance(value, str) is False and value is not None:
+            raise TypeError("The type of __checkpoint_dir_path must be str.")
+        self.__checkpoint_dir_path = value
+
+    checkpoint_dir_path = property(get_checkpoint_dir_path, set_checkpoint_dir_path)
+
+    # The interval of checkpoints.
+    __checkpoint_interval = 1000
+
+    def get_checkpoint_interval(self):
+        '''
+        getter
+        The interval of checkpoints.
+        '''
+        if isinstance(self.__checkpoint_interval, int) is False:
+            raise TypeError("The type of __checkpoint_interval must be int.")
+        return self.__checkpoint_interval
+
+    def set_checkpoint_interval(self, value):
+        '''
+        setter
+        The interval of checkpoints.
+        '''
+        if isinstance(value, int) is False:
+            raise TypeError("The type of __checkpoint_interval must be int.")
+        if value <= 0:
+            raise ValueError("The value of __checkpoint_interval must be more than 0.")
+        self.__checkpoint_interval = value
+
+    checkpoint_interval = property(get_checkpoint_interval, set_checkpoint_interval)
+
+    def save(self, dir_path, state_key=None):
+        '''
+        Save Q-Values, R-Values, and time in the directory.
+
+        The Q-Values are saved in the format of `HashIndexedQStore` in `dir_path/q`,
+        and the R-Values are saved in the same format in `dir_path/r`.
+
+        Args:
+            dir_path:       The path of directory.
+            state_key:      The key of state to resume learning.
+        '''
+        os.makedirs(dir_path, exist_ok=True)
+
+        q_store = self.q_store
+        if q_store is None:
+            q_store = HashIndexedQStore()
+            q_store.set_q_df(self.q_df)
+        q_store.save(os.path.join(dir_path, "q"))
+
+        r_action_flag = False
+        r_store = HashIndexedQStore()
+        if self.r_df is not None:
+            r_df = self.r_df.rename(columns={"r_value": "q_value"})
+            if "action_key" in r_df.columns:
+                r_action_flag = True
+            else:
+                r_df["action_key"] = None
+            r_store.set_q_df(r_df)
+        r_store.save(os.path.join(dir_path, "r"))
+
+        meta_path = os.path.join(dir_path, "q_learning.pkl")
+        with open(meta_path + ".tmp", "wb") as f:
+            pickle.dump(
+                {
+                    "t": self.t,
+                    "state_key": state_key,
+                    "r_action_flag": r_action_flag
+                },
+                f
+            )
+        os.replace(meta_path + ".tmp", meta_path)
+
+    def load(self, dir_path, read_only_flag=False):
+        '''
+        Load Q-Values, R-Values, and time from the directory.
+
+        Args:
+            dir_path:           The path of directory.
+            read_only_flag:     If `True`, Q-Values are memory-mapped without copy 
+                                and can not be updated. For instance, greedy actions 
+                                can be predicted by `predict_next_action` 
+                                without loading the column of Q-Values into memory.
+                                The keys of states and actions are still loaded into memory.
+
+        Returns:
+            The key of state to resume learning.
+        '''
+        with open(os.path.join(dir_path, "q_learning.pkl"), "rb") as f:
+            meta_dict = pickle.load(f)
+
+        q_store = self.q_store
+        if q_store is None:
+            q_store = HashIndexedQStore()
+        q_store.load(os.path.join(dir_path, "q"), read_only_flag=read_only_flag)
+        self.__q_df = None
+        self.q_store = q_store
+
+        r_store = HashIndexedQStore()
+        r_store.load(os.path.join(dir_path, "r"))
+        if len(r_store) > 0:
+            r_df = r_store.get_q_df().rename(columns={"q_value": "r_value"})
+            if meta_dict["r_action_flag"] is False:
+                r_df = r_df[["state_key", "r_value"]]
+            self.r_df = r_df
+        else:
+            self.r_df = None
+
+        self.t = meta_dict["t"]
+        return meta_dict["state_key"]
+
+    def resume(self, dir_path, limit=1000):
+        '''
+        Resume learning from the checkpoint saved in the directory.
+
+        Args:
+            dir_path:       The path of directory.
+            limit:          The maximum number of iterative updates based on value iteration algorithms.
+        '''
+        state_key = self.load(dir_path)
+        self.__learn(state_key, limit)
+
     def learn(self, state_key, limit=1000):
         '''
         Learning and searching the optimal solution.
         
+        If `checkpoint_dir_path` is not `None`, the checkpoint is saved 
+        in every `checkpoint_interval` steps, and the learning can be 
+        resumed by `resume`.
+
         Args:
             state_key:      Initial state.
             limit:          The maximum number of iterative updates based on value iteration algorithms.
         '''
         self.t = 1
+        self.__learn(state_key, limit)
+
+    def __learn(self, state_key, limit):
+        '''
+        Learning and searching the optimal solution from the now time.
+
+        Args:
+            state_key:      The key of state in the now time.
+            limit:          The maximum number of iterative updates based on value iteration algorithms.
+        '''
         while self.t <= limit:
             next_action_list = self.extract_possible_actions(state_key)
             if len(next_action_list):
@@ -301,6 +506,252 @@ class QLearning(metaclass=ABCMeta):
             # Epsode.
             self.t += 1
 
+            # Checkpoint.
+            if self.checkpoint_dir_path is not None and (self.t - 1) % self.checkpoint_interval == 0:
+                self.save(self.checkpoint_dir_path, state_key)
+
+    def learn_batch(self, state_key_list, limit=1000):
+        '''
+        Learning and searching the optimal solution in many episodes in lockstep.
+
+        Each episode starts from each initial state in `state_key_list` and 
+        is advanced one transition per step. The hooks in this batch mode 
+        such as `extract_possible_actions_batch` and `observe_reward_value_batch` 
+        delegate to the hooks for a single episode by default, and can be 
+        overrided by array-oriented implementations for concreate usecases.
+
+        The Q-Values are updated by the vectorized TD update over 
+        the integer-indexed `q_store`. If `q_store` is `None`, 
+        `HashIndexedQStore` is set and the Q-Values in `q_df` are loaded.
+        If the same pair of state and action appears more than once in one step, 
+        the last update in the batch is stored.
+
+        An episode which has no possible action is not advanced, 
+        and an episode which `check_the_end_flag_batch` returns `True` is ended.
+        `visualize_learning_result` is not called in this batch mode.
+
+        Args:
+            state_key_list:     `list` of initial states in each episode.
+            limit:              The maximum number of iterative updates based on value iteration algorithms.
+        '''
+        if self.q_store is None:
+            q_df = self.q_df
+            self.__q_df = None
+            self.q_store = HashIndexedQStore()
+            self.q_store.set_q_df(q_df)
+
+        state_key_list = list(state_key_list)
+        active_arr = np.ones(len(state_key_list), dtype=bool)
+
+        self.t = 1
+        while self.t <= limit:
+            active_index_arr = np.where(active_arr)[0]
+            if active_index_arr.shape[0] == 0:
+                break
+
+            _state_key_list = [state_key_list[i] for i in active_index_arr]
+            next_action_list_list = self.extract_possible_actions_batch(_state_key_list)
+            possible_arr = np.array([len(next_action_list) > 0 for next_action_list in next_action_list_list], dtype=bool)
+
+            if possible_arr.any():
+                _state_key_list = [_state_key_list[i] for i in np.where(possible_arr)[0]]
+                next_action_list_list = [next_action_list_list[i] for i in np.where(possible_arr)[0]]
+
+                action_key_list = self.select_action_batch(
+                    state_key_list=_state_key_list,
+                    next_action_list_list=next_action_list_list
+                )
+                reward_value_arr = np.asarray(
+                    self.observe_reward_value_batch(_state_key_list, action_key_list),
+                    dtype=np.float64
+                )
+
+                # Max-Q-Value in next action time.
+                next_state_key_list = self.update_state_batch(
+                    state_key_list=_state_key_list,
+                    action_key_list=action_key_list
+                )
+                next_next_action_list_list = self.extract_possible_actions_batch(next_state_key_list)
+                next_action_key_list = self.predict_next_action_batch(
+                    next_state_key_list, 
+                    next_next_action_list_list
+                )
+
+                # Update Q-Value.
+                self.update_q_batch(
+                    state_key_list=_state_key_list,
+                    action_key_list=action_key_list,
+                    reward_value_arr=reward_value_arr,
+                    next_state_key_list=next_state_key_list,
+                    next_action_key_list=next_action_key_list
+                )
+
+                # Update State.
+                for i, next_state_key in zip(active_index_arr[possible_arr], next_state_key_list):
+                    state_key_list[i] = next_state_key
+
+            # Normalize.
+            self.normalize_q_value()
+            self.normalize_r_value()
+
+            # Check.
+            end_flag_arr = np.asarray(
+                self.check_the_end_flag_batch([state_key_list[i] for i in active_index_arr]),
+                dtype=bool
+            )
+            active_arr[active_index_arr[end_flag_arr]] = False
+
+            # Epsode.
+            self.t += 1
+
+    def update_q_batch(
+        self,
+        state_key_list,
+        action_key_list,
+        reward_value_arr,
+        next_state_key_list,
+        next_action_key_list
+    ):
+        '''
+        Update Q-Values by the vectorized TD update.
+
+        Args:
+            state_key_list:         `list` of the keys of states.
+            action_key_list:        `list` of the keys of actions.
+            reward_value_arr:       `np.ndarray` of R-Values(Rewards).
+            next_state_key_list:    `list` of the keys of states in `self.t+1`.
+            next_action_key_list:   `list` of the keys of actions in `self.t+1`.
+                                    If the key is `None`, the maximum Q-Value is `0.0`.
+
+        '''
+        index_arr = self.q_store.extract_index_arr(state_key_list, action_key_list)
+        next_flag_arr = np.array([next_action_key is not None for next_action_key in next_action_key_list], dtype=bool)
+        next_index_arr = self.q_store.extract_index_arr(
+            [next_state_key_list[i] for i in np.where(next_flag_arr)[0]],
+            [next_action_key_list[i] for i in np.where(next_flag_arr)[0]]
+        )
+
+        # `q_arr` must be referred after the interning of keys.
+        q_arr = self.q_store.get_q_arr()
+        next_max_q_arr = np.zeros(index_arr.shape[0], dtype=np.float64)
+        next_max_q_arr[next_flag_arr] = q_arr[next_index_arr]
+
+        q = q_arr[index_arr]
+        q_arr[index_arr] = q + self.alpha_value * (reward_value_arr + (self.gamma_value * next_max_q_arr) - q)
+
+    def extract_possible_actions_batch(self, state_key_list):
+        '''
+        Extract the lists of the possible action in `self.t+1` in each episode.
+
+        This method can be overrided for concreate usecases.
+
+        Args:
+            state_key_list:     `list` of the keys of states in `self.t+1`.
+
+        Returns:
+            `list` of `list` of the possible actions in `self.t+1`.
+        '''
+        return [self.extract_possible_actions(state_key) for state_key in state_key_list]
+
+    def select_action_batch(self, state_key_list, next_action_list_list):
+        '''
+        Select actions by Q(state, action) in each episode.
+
+        This method can be overrided for concreate usecases.
+
+        Args:
+            state_key_list:             `list` of the keys of states.
+            next_action_list_list:      `list` of the possible actions in `self.t+1`.
+
+        Returns:
+            `list` of the keys of actions.
+        '''
+        return [
+            self.select_action(
+                state_key=state_key,
+                next_action_list=next_action_list
+            ) for state_key, next_action_list in zip(state_key_list, next_action_list_list)
+        ]
+
+    def observe_reward_value_batch(self, state_key_list, action_key_list):
+        '''
+        Compute the reward values in each episode.
+
+        This method can be overrided for concreate usecases.
+
+        Args:
+            state_key_list:         `list` of the keys of states.
+            action_key_list:        `list` of the keys of actions.
+
+        Returns:
+            `np.ndarray` of reward values.
+        '''
+        return np.array(
+            [
+                self.observe_reward_value(state_key, action_key) for state_key, action_key in zip(
+                    state_key_list, 
+                    action_key_list
+                )
+            ],
+            dtype=np.float64
+        )
+
+    def update_state_batch(self, state_key_list, action_key_list):
+        '''
+        Update states in each episode.
+
+        This method can be overrided for concreate usecases.
+
+        Args:
+            state_key_list:     `list` of the keys of states in `self.t`.
+            action_key_list:    `list` of the keys of actions in `self.t`.
+
+        Returns:
+            `list` of the keys of states in `self.t+1`.
+        '''
+        return [
+            self.update_state(
+                state_key=state_key,
+                action_key=action_key
+            ) for state_key, action_key in zip(state_key_list, action_key_list)
+        ]
+
+    def predict_next_action_batch(self, state_key_list, next_action_list_list):
+        '''
+        Predict next actions by Q-Learning in each episode.
+
+        This method can be overrided for concreate usecases.
+
+        Args:
+            state_key_list:             `list` of the keys of states in `self.t+1`.
+            next_action_list_list:      `list` of the possible actions in `self.t+1`.
+
+        Returns:
+            `list` of the keys of actions. 
+            If there is no possible action, the key is `None`.
+        '''
+        return [
+            self.predict_next_action(state_key, next_action_list) if len(next_action_list) else None
+            for state_key, next_action_list in zip(state_key_list, next_action_list_list)
+        ]
+
+    def check_the_end_flag_batch(self, state_key_list):
+        '''
+        Check the end flags in each episode.
+
+        This method can be overrided for concreate usecases.
+
+        Args:
+            state_key_list:     `list` of the keys of states in `self.t`.
+
+        Returns:
+            `np.ndarray` of `bool`.
+        '''
+        return np.array(
+            [self.check_the_end_flag(state_key) for state_key in state_key_list], 
+            dtype=bool
+        )
+
     @abstractmethod
     def select_action(self, state_key, next_action_list):
         '''
@@ -379,6 +830,13 @@ class QLearning(metaclass=ABCMeta):
             The key of action.
 
         '''
+        if self.q_store is not None:
+            q_arr, exist_arr = self.q_store.extract_q_arr(state_key, next_action_list)
+            if bool(exist_arr.any()) is False:
+                return random.choice(next_action_list)
+            q_arr[~exist_arr] = -np.inf
+            return next_action_list[int(q_arr.argmax())]
+
         if self.q_df is not None:
             next_action_q_df = self.q_df[self.q_df.state_key == state_key]
             next_action_q_df = next_action_q_df[next_action_q_df.action_key.isin(next_action_list)]
@@ -462,3 +920,20 @@ class QLearning(metaclass=ABCMeta):
             state_key:    The key of state in `self.t`.
         '''
         pass
+
+    def __copy__(self):
+        '''
+        Shallow copy.
+
+        If `q_store` is not `None`, the store is also copied, 
+        so that the copied object can learn without updating 
+        the Q-Values of this object.
+
+        Returns:
+            `QLearning`.
+        '''
+        q_learning = self.__class__.__new__(self.__class__)
+        q_learning.__dict__.update(self.__dict__)
+        if self.q_store is not None:
+            q_learning.q_store = copy(self.q_store)
+        return q_learning
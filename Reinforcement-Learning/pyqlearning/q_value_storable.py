@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+from abc import ABCMeta, abstractmethod
+
+
+class QValueStorable(metaclass=ABCMeta):
+    '''
+    The interface of the store of Q(state, action) for `QLearning`.
+
+    `QLearning` keeps the Q-Values in `q_df`, which is-a `pd.DataFrame`
+    filtered by boolean masks and rebuilt in each update. The implementation
+    of this interface can be delegated the role of storing the Q-Values,
+    so that the learning algorithm can be decoupled from the data structure.
+
+    The property `q_df` of this interface is the `pd.DataFrame` view of
+    the stored Q-Values, which has the columns of `state_key`,
+    `action_key`, and `q_value`.
+    '''
+
+    @abstractmethod
+    def extract_q(self, state_key, action_key):
+        '''
+        Extract Q-Value.
+
+        Args:
+            state_key:      The key of state.
+            action_key:     The key of action.
+
+        Returns:
+            Q-Value. If the pair of keys has not been stored yet, `None`.
+        '''
+        raise NotImplementedError("This method must be implemented.")
+
+    @abstractmethod
+    def save_q(self, state_key, action_key, q_value):
+        '''
+        Insert or update Q-Value.
+
+        Args:
+            state_key:      The key of state.
+            action_key:     The key of action.
+            q_value:        Q-Value.
+        '''
+        raise NotImplementedError("This method must be implemented.")
+
+    @abstractmethod
+    def extract_q_arr(self, state_key, action_key_list):
+        '''
+        Extract Q-Values of the candidate actions in one state.
+
+        Args:
+            state_key:          The key of state.
+            action_key_list:    `list` of the keys of actions.
+
+        Returns:
+            Tuple data.
+            - `np.ndarray` of Q-Values. Not stored Q-Values are `0.0`.
+            - `np.ndarray` of `bool` flags which are `True` if the Q-Value has been stored.
+        '''
+        raise NotImplementedError("This method must be implemented.")
+
+    @abstractmethod
+    def extract_index_arr(self, state_key_list, action_key_list):
+        '''
+        Extract the indices of pairs of keys in `q_arr`.
+        Not stored pairs are inserted with the Q-Value `0.0`.
+
+        Args:
+            state_key_list:     `list` of the keys of states.
+            action_key_list:    `list` of the keys of actions.
+
+        Returns:
+            `np.ndarray` of indices.
+        '''
+        raise NotImplementedError("This method must be implemented.")
+
+    @abstractmethod
+    def get_q_arr(self):
+        '''
+        getter
+
+        Returns:
+            The writable view of stored Q-Values, which is-a `np.ndarray`.
+        '''
+        raise NotImplementedError("This method must be implemented.")
+
+    @abstractmethod
+    def get_q_df(self):
+        ''' getter '''
+        raise NotImplementedError("This method must be implemented.")
+
+    @abstractmethod
+    def set_q_df(self, value):
+        ''' setter '''
+        raise NotImplementedError("This method must be implemented.")
+
+    @abstractmethod
+    def save(self, dir_path):
+        '''
+        Save Q-Values in the directory.
+
+        Args:
+            dir_path:       The path of directory.
+        '''
+        raise NotImplementedError("This method must be implemented.")
+
+    @abstractmethod
+    def load(self, dir_path, read_only_flag=False):
+        '''
+        Load Q-Values from the directory.
+
+        Args:
+            dir_path:           The path of directory.
+            read_only_flag:     If `True`, Q-Values are opened as read-only.
+        '''
+        raise NotImplementedError("This method must be implemented.")
+
+    @abstractmethod
+    def __len__(self):
+        '''
+        Returns:
+            The number of stored Q-Values.
+        '''
+        raise NotImplementedError("This method must be implemented.")
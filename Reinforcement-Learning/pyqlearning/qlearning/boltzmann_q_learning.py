@@ -70,25 +70,70 @@ class BoltzmannQLearning(QLearning):
             The key of action.
 
         '''
-        if self.q_df is None or self.q_df.shape[0] == 0:
+        if self.__is_empty() is True:
             return random.choice(next_action_list)
 
-        next_action_b_df = self.__calculate_boltzmann_factor(state_key, next_action_list)
+        q_arr = self.__extract_q_arr(state_key, next_action_list)
+        key = self.__sample_boltzmann(q_arr[np.newaxis, :])[0]
+        return next_action_list[key]
 
-        if next_action_b_df.shape[0] == 1:
-            return next_action_b_df["action_key"].values[0]
+    def select_action_batch(self, state_key_list, next_action_list_list):
+        '''
+        Select actions by Q(state, action) in each episode.
+
+        Concreat method for boltzmann distribution. 
+        The Q-Values of candidate actions in each state are stacked 
+        into one matrix, and the actions are sampled at once.
+
+        Args:
+            state_key_list:             `list` of the keys of states.
+            next_action_list_list:      `list` of the possible actions in `self.t+1`.
+
+        Returns:
+            `list` of the keys of actions.
+        '''
+        if self.__is_empty() is True:
+            return [random.choice(next_action_list) for next_action_list in next_action_list_list]
+
+        max_n = max([len(next_action_list) for next_action_list in next_action_list_list])
+        q_arr = np.full((len(next_action_list_list), max_n), -np.inf, dtype=np.float64)
+        for i in range(len(next_action_list_list)):
+            q_arr[i, :len(next_action_list_list[i])] = self.__extract_q_arr(
+                state_key_list[i],
+                next_action_list_list[i]
+            )
+        key_arr = self.__sample_boltzmann(q_arr)
+        return [next_action_list_list[i][key_arr[i]] for i in range(len(next_action_list_list))]
+
+    def __is_empty(self):
+        '''
+        Check whether Q-Values have not been stored yet.
 
-        prob = np.random.random()
-        next_action_b_df = next_action_b_df.sort_values(by=["boltzmann_factor"])
+        Returns:
+            bool
+        '''
+        if self.q_store is not None:
+            return len(self.q_store) == 0
+        return self.q_df is None or self.q_df.shape[0] == 0
 
-        i = 0
-        while prob > next_action_b_df.iloc[i, :]["boltzmann_factor"] + next_action_b_df.iloc[i + 1, :]["boltzmann_factor"]:
-            i += 1
-            if i + 1 >= next_action_b_df.shape[0]:
-                break
+    def __extract_q_arr(self, state_key, next_action_list):
+        '''
+        Extract the Q-Values of the candidate actions as a contiguous row.
 
-        max_b_action_key = next_action_b_df.iloc[i, :]["action_key"]
-        return max_b_action_key
+        Args:
+            state_key:              The key of state.
+            next_action_list:       The possible action in `self.t+1`.
+
+        Returns:
+            `np.ndarray` of Q-Values. Not stored Q-Values are `0.0`.
+        '''
+        if self.q_store is not None:
+            q_arr, _ = self.q_store.extract_q_arr(state_key, next_action_list)
+            return q_arr
+
+        q_df = self.q_df[self.q_df.state_key == state_key]
+        q_dict = dict(zip(q_df.action_key.tolist(), q_df.q_value.tolist()))
+        return np.array([q_dict.get(action_key, 0.0) for action_key in next_action_list], dtype=np.float64)
 
     def __calculate_sigmoid(self):
         '''
@@ -101,23 +146,44 @@ class BoltzmannQLearning(QLearning):
         sigmoid = 1 / np.log(self.t * self.time_rate + 1.1)
         return sigmoid
 
-    def __calculate_boltzmann_factor(self, state_key, next_action_list):
+    def __calculate_boltzmann_factor(self, q_arr):
         '''
-        Calculate boltzmann factor.
+        Calculate boltzmann factor by the numerically stable log-sum-exp.
 
         Args:
-            state_key:              The key of state.
-            next_action_list:       The possible action in `self.t+1`.
-                                    If the length of this list is 0, all action should be possible.
+            q_arr:      `np.ndarray` of Q-Values whose rank is 2.
+                        The shape is (the number of states, the number of candidate actions).
+                        `-np.inf` means that the action is not possible.
 
         Returns:
-            [(`The key of action`, `boltzmann probability`)]
+            `np.ndarray` of boltzmann probabilities whose shape is the same as `q_arr`.
         '''
         sigmoid = self.__calculate_sigmoid()
-        q_df = self.q_df[self.q_df.state_key == state_key]
-        q_df = q_df[q_df.isin(next_action_list)]
-        q_df["boltzmann_factor"] = q_df["q_value"] / sigmoid
-        q_df["boltzmann_factor"] = q_df["boltzmann_factor"].apply(np.exp)
-        q_df["boltzmann_factor"] = q_df["boltzmann_factor"] / q_df["boltzmann_factor"].sum()
-        
-        return q_df
+        logit_arr = q_arr / sigmoid
+        max_arr = logit_arr.max(axis=1, keepdims=True)
+        log_z_arr = max_arr + np.log(np.exp(logit_arr - max_arr).sum(axis=1, keepdims=True))
+        return np.exp(logit_arr - log_z_arr)
+
+    def __sample_boltzmann(self, q_arr):
+        '''
+        Sample the actions from boltzmann distribution.
+
+        Args:
+            q_arr:      `np.ndarray` of Q-Values whose rank is 2.
+                        The shape is (the number of states, the number of candidate actions).
+                        `-np.inf` means that the action is not possible.
+
+        Returns:
+            `np.ndarray` of the indices of sampled actions in each row.
+        '''
+        prob_arr = self.__calculate_boltzmann_factor(q_arr)
+        cdf_arr = prob_arr.cumsum(axis=1)
+        prob = np.random.random(size=(q_arr.shape[0], 1)) * cdf_arr[:, -1:]
+        if q_arr.shape[0] == 1:
+            key_arr = np.array([np.searchsorted(cdf_arr[0], prob[0, 0], side="right")])
+        else:
+            # The same as `np.searchsorted` in each row.
+            key_arr = (cdf_arr <= prob).sum(axis=1)
+
+        possible_n_arr = np.isfinite(q_arr).sum(axis=1)
+        return np.minimum(key_arr, possible_n_arr - 1)
@@ -0,0 +1,380 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import pickle
+import numpy as np
+import pandas as pd
+from pyqlearning.q_value_storable import QValueStorable
+
+
+class HashIndexedQStore(QValueStorable):
+    '''
+    The store of Q(state, action) which is-a `QValueStorable`.
+
+    Each pair of `state_key` and `action_key` is interned to an integer index
+    by the hash table, and the Q-Values are stored in the preallocated
+    `np.ndarray` which grows by doubling its capacity. Therefore the cost of
+    `extract_q` and `save_q` is O(1) regardless of the number of pairs.
+
+    The `pd.DataFrame` view `q_df` is built lazily only when it is read,
+    and cached until the next update.
+
+    The Q-Values can be saved in the directory, which contains
+    - `key.pkl`: the stream of pickled chunks of keys, appended in each save,
+    - `q_value.bin`: the column of Q-Values as raw `float64`, and
+    - `meta.json`: the number of Q-Values, which is replaced atomically in the last of each save.
+
+    The Q-Values in the directory can be opened as read-only, and then
+    `q_value.bin` is memory-mapped. Note that the keys are not memory-mapped:
+    all keys are unpickled into the hash table in memory even in read-only mode,
+    so that they can be looked up with the same equality as in writable mode.
+    '''
+
+    # File names in the saved directory.
+    __key_file_name = "key.pkl"
+    __value_file_name = "q_value.bin"
+    __meta_file_name = "meta.json"
+
+    def __init__(self, init_capacity=1024):
+        '''
+        Init.
+
+        Args:
+            init_capacity:      The initial capacity of the array of Q-Values.
+        '''
+        if isinstance(init_capacity, int) is False:
+            raise TypeError("The type of `init_capacity` must be int.")
+        if init_capacity <= 0:
+            raise ValueError("The value of `init_capacity` must be more than `0`.")
+
+        self.__init_capacity = init_capacity
+        self.__clear()
+
+    def __clear(self):
+        '''
+        Remove all Q-Values.
+
+        The record of the last save is also reset, because the keys
+        may be interned in a different order after this.
+        '''
+        self.__key_dict = {}
+        self.__state_key_list = []
+        self.__action_key_list = []
+        self.__q_arr = np.zeros(self.__init_capacity, dtype=np.float64)
+        self.__size = 0
+        self.__q_df = None
+        self.__read_only_flag = False
+        self.__saved_dir_path = None
+        self.__saved_size = 0
+
+    def __intern(self, state_key, action_key):
+        '''
+        Intern the pair of keys.
+
+        Args:
+            state_key:      The key of state.
+            action_key:     The key of action.
+
+        Returns:
+            The index of the pair of keys.
+        '''
+        key = (state_key, action_key)
+        index = self.__key_dict.get(key)
+        if index is None:
+            if self.__read_only_flag is True:
+                raise TypeError("This store is read-only.")
+            if self.__size >= self.__q_arr.shape[0]:
+                q_arr = np.zeros(self.__q_arr.shape[0] * 2, dtype=np.float64)
+                q_arr[:self.__size] = self.__q_arr[:self.__size]
+                self.__q_arr = q_arr
+
+            index = self.__size
+            self.__key_dict[key] = index
+            self.__state_key_list.append(state_key)
+            self.__action_key_list.append(action_key)
+            self.__size += 1
+        return index
+
+    def extract_q(self, state_key, action_key):
+        '''
+        Extract Q-Value.
+
+        Args:
+            state_key:      The key of state.
+            action_key:     The key of action.
+
+        Returns:
+            Q-Value. If the pair of keys has not been stored yet, `None`.
+        '''
+        index = self.__key_dict.get((state_key, action_key))
+        if index is None:
+            return None
+        return float(self.__q_arr[index])
+
+    def save_q(self, state_key, action_key, q_value):
+        '''
+        Insert or update Q-Value.
+
+        Args:
+            state_key:      The key of state.
+            action_key:     The key of action.
+            q_value:        Q-Value.
+        '''
+        if self.__read_only_flag is True:
+            raise TypeError("This store is read-only.")
+        index = self.__intern(state_key, action_key)
+        self.__q_arr[index] = q_value
+        self.__q_df = None
+
+    def extract_q_arr(self, state_key, action_key_list):
+        '''
+        Extract Q-Values of the candidate actions in one state.
+
+        Args:
+            state_key:          The key of state.
+            action_key_list:    `list` of the keys of actions.
+
+        Returns:
+            Tuple data.
+            - `np.ndarray` of Q-Values. Not stored Q-Values are `0.0`.
+            - `np.ndarray` of `bool` flags which are `True` if the Q-Value has been stored.
+        '''
+        index_arr = np.array(
+            [self.__key_dict.get((state_key, action_key), -1) for action_key in action_key_list],
+            dtype=np.int64
+        )
+        exist_arr = index_arr >= 0
+        q_arr = np.zeros(index_arr.shape[0], dtype=np.float64)
+        q_arr[exist_arr] = self.__q_arr[index_arr[exist_arr]]
+        return q_arr, exist_arr
+
+    def extract_index_arr(self, state_key_list, action_key_list):
+        '''
+        Extract the indices of pairs of keys in `q_arr`.
+        Not stored pairs are inserted with the Q-Value `0.0`.
+
+        Args:
+            state_key_list:     `list` of the keys of states.
+            action_key_list:    `list` of the keys of actions.
+
+        Returns:
+            `np.ndarray` of indices.
+        '''
+        if len(state_key_list) != len(action_key_list):
+            raise ValueError("The length of `state_key_list` and `action_key_list` must be equivalent.")
+
+        size = self.__size
+        index_arr = np.array(
+            [self.__intern(state_key, action_key) for state_key, action_key in zip(state_key_list, action_key_list)],
+            dtype=np.int64
+        )
+        if self.__size != size:
+            self.__q_df = None
+        return index_arr
+
+    def get_q_arr(self):
+        '''
+        getter
+
+        Returns:
+            The writable view of stored Q-Values, which is-a `np.ndarray`.
+            For instance, `QLearning.normalize_q_value` can update this array in place.
+        '''
+        # The view may be updated by the caller.
+        self.__q_df = None
+        return self.__q_arr[:self.__size]
+
+    def set_q_arr(self, value):
+        ''' setter '''
+        raise TypeError("This property must be read-only.")
+
+    q_arr = property(get_q_arr, set_q_arr)
+
+    def get_q_df(self):
+        '''
+        getter
+
+        Returns:
+            `pd.DataFrame` view of Q-Values.
+        '''
+        if self.__q_df is None:
+            self.__q_df = pd.DataFrame(
+                {
+                    "state_key": pd.Series(self.__state_key_list, dtype=object),
+                    "action_key": pd.Series(self.__action_key_list, dtype=object),
+                    "q_value": self.__q_arr[:self.__size].copy()
+                },
+                columns=["state_key", "action_key", "q_value"]
+            )
+        return self.__q_df
+
+    def set_q_df(self, value):
+        '''
+        setter
+
+        Args:
+            value:      `pd.DataFrame` which has the columns of
+                        `state_key`, `action_key`, and `q_value`.
+                        If `None`, all Q-Values are removed.
+        '''
+        if isinstance(value, pd.DataFrame) is False and value is not None:
+            raise TypeError("The type of `q_df` must be `pd.DataFrame`.")
+
+        self.__clear()
+        if value is None:
+            return
+
+        value = value.drop_duplicates(["state_key", "action_key"])
+        for state_key, action_key, q_value in zip(
+            value.state_key.tolist(),
+            value.action_key.tolist(),
+            value.q_value.tolist()
+        ):
+            index = self.__intern(state_key, action_key)
+            self.__q_arr[index] = q_value
+
+    q_df = property(get_q_df, set_q_df)
+
+    def save(self, dir_path):
+        '''
+        Save Q-Values in the directory.
+
+        If Q-Values have been saved in the same directory by this object,
+        only the keys inserted after the last save are appended.
+
+        Args:
+            dir_path:       The path of directory.
+        '''
+        dir_path = os.path.abspath(dir_path)
+        os.makedirs(dir_path, exist_ok=True)
+        key_path = os.path.join(dir_path, self.__key_file_name)
+        value_path = os.path.join(dir_path, self.__value_file_name)
+        meta_path = os.path.join(dir_path, self.__meta_file_name)
+
+        meta_dict = self.__load_meta(dir_path)
+        if self.__saved_dir_path == dir_path and meta_dict is not None and meta_dict["size"] == self.__saved_size:
+            start = self.__saved_size
+            key_bytes = meta_dict["key_bytes"]
+        else:
+            start = 0
+            key_bytes = 0
+
+        with open(key_path, "ab") as f:
+            # Discard the keys which were not committed by `meta.json`.
+            f.truncate(key_bytes)
+            f.seek(key_bytes)
+            if self.__size > start:
+                pickle.dump(
+                    list(zip(self.__state_key_list[start:self.__size], self.__action_key_list[start:self.__size])),
+                    f
+                )
+            key_bytes = f.tell()
+
+        value_bytes = self.__size * np.dtype(np.float64).itemsize
+        with open(value_path, "ab") as f:
+            if f.tell() < value_bytes:
+                f.truncate(value_bytes)
+        if self.__size > 0:
+            value_arr = np.memmap(value_path, dtype=np.float64, mode="r+", shape=(self.__size, ))
+            value_arr[:] = self.__q_arr[:self.__size]
+            value_arr.flush()
+            del value_arr
+
+        tmp_meta_path = meta_path + ".tmp"
+        with open(tmp_meta_path, "w") as f:
+            json.dump({"size": self.__size, "key_bytes": key_bytes}, f)
+        os.replace(tmp_meta_path, meta_path)
+
+        self.__saved_dir_path = dir_path
+        self.__saved_size = self.__size
+
+    def load(self, dir_path, read_only_flag=False):
+        '''
+        Load Q-Values from the directory.
+
+        Args:
+            dir_path:           The path of directory.
+            read_only_flag:     If `True`, Q-Values are memory-mapped without copy,
+                                and this store can not be updated.
+                                The keys are loaded into memory in any case.
+        '''
+        dir_path = os.path.abspath(dir_path)
+        meta_dict = self.__load_meta(dir_path)
+        if meta_dict is None:
+            raise FileNotFoundError("Q-Values are not saved in " + dir_path)
+
+        self.__clear()
+        size = meta_dict["size"]
+        key_list = []
+        with open(os.path.join(dir_path, self.__key_file_name), "rb") as f:
+            while len(key_list) < size and f.tell() < meta_dict["key_bytes"]:
+                key_list.extend(pickle.load(f))
+        key_list = key_list[:size]
+
+        if size > 0:
+            value_arr = np.memmap(
+                os.path.join(dir_path, self.__value_file_name),
+                dtype=np.float64,
+                mode="r",
+                shape=(size, )
+            )
+        else:
+            value_arr = np.zeros(0, dtype=np.float64)
+
+        self.__key_dict = {key: index for index, key in enumerate(key_list)}
+        self.__state_key_list = [key[0] for key in key_list]
+        self.__action_key_list = [key[1] for key in key_list]
+        self.__size = size
+        if read_only_flag is True:
+            self.__q_arr = value_arr
+            self.__read_only_flag = True
+        else:
+            self.__q_arr = np.zeros(max(self.__init_capacity, size), dtype=np.float64)
+            self.__q_arr[:size] = value_arr
+
+        self.__saved_dir_path = dir_path
+        self.__saved_size = size
+
+    def __load_meta(self, dir_path):
+        '''
+        Load the meta data in the directory.
+
+        Args:
+            dir_path:       The path of directory.
+
+        Returns:
+            `dict` of meta data. If the directory has no meta data, `None`.
+        '''
+        meta_path = os.path.join(dir_path, self.__meta_file_name)
+        if os.path.exists(meta_path) is False:
+            return None
+        with open(meta_path) as f:
+            return json.load(f)
+
+    def __len__(self):
+        '''
+        Returns:
+            The number of stored Q-Values.
+        '''
+        return self.__size
+
+    def __copy__(self):
+        '''
+        Copy the store so that the copied one can be updated independently.
+
+        Returns:
+            `HashIndexedQStore`.
+        '''
+        q_store = self.__class__.__new__(self.__class__)
+        q_store.__init_capacity = self.__init_capacity
+        q_store.__key_dict = self.__key_dict.copy()
+        q_store.__state_key_list = self.__state_key_list[:]
+        q_store.__action_key_list = self.__action_key_list[:]
+        q_store.__q_arr = np.zeros(max(self.__init_capacity, self.__size), dtype=np.float64)
+        q_store.__q_arr[:self.__size] = self.__q_arr[:self.__size]
+        q_store.__size = self.__size
+        q_store.__q_df = None
+        q_store.__read_only_flag = False
+        q_store.__saved_dir_path = None
+        q_store.__saved_size = 0
+        return q_store
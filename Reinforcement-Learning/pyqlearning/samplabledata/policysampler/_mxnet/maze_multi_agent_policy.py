@@ -1,10 +1,10 @@
 # -*- coding: utf-8 -*-
 from accelbrainbase.samplabledata.policy_sampler import PolicySampler
+from pyqlearning.samplabledata.policysampler.maze_reachability import MazeReachability
 
 import mxnet.ndarray as nd
 import mxnet as mx
 import numpy as np
-import random
 
 
 class MazeMultiAgentPolicy(PolicySampler):
@@ -60,6 +60,19 @@ class MazeMultiAgentPolicy(PolicySampler):
         '''
         self.__batch_size = batch_size
         self.__map_arr = self.__create_map(map_size)
+        self.__space_x_arr, self.__space_y_arr = np.where(self.__map_arr == self.SPACE)
+        self.__maze_reachability = MazeReachability(
+            self.__map_arr,
+            moving_max_dist,
+            wall=self.WALL,
+            goal=self.GOAL
+        )
+        self.__enemy_maze_reachability = MazeReachability(
+            self.__map_arr,
+            enemy_moving_max_dist,
+            wall=self.WALL,
+            goal=self.GOAL
+        )
         self.__agent_pos_arr = np.array(
             [
                 self.START_POS
@@ -162,70 +175,38 @@ class MazeMultiAgentPolicy(PolicySampler):
 
     def __create_enemy(self, maze_arr):
         '''
-        
+        Create enemies.
+
+        Args:
+            maze_arr:   `np.ndarray` of map.
+        '''
+        enemy_pos_arr = self.__draw_enemy_pos(maze_arr, 1)[0]
+        self.__enemy_pos_list = [(x, y) for x, y in enemy_pos_arr]
+
+    def __draw_enemy_pos(self, maze_arr, batch_size):
+        '''
+        Draw the initial positions of enemies for each batch.
+
+        Args:
+            maze_arr:       `np.ndarray` of map.
+            batch_size:     `int` of batch size.
+
+        Returns:
+            `np.ndarray` of positions. The shape is: (batch, enemy_num, 2)
         '''
         x_arr, y_arr = np.where(maze_arr == self.SPACE)
-        key_arr = np.arange(x_arr.shape[0])
-        np.random.shuffle(key_arr)
-        dup_list = []
-        for i in range(self.__enemy_num):
-            for j in range(key_arr.shape[0]):
-                key = key_arr[j]
-                dist = np.sqrt(((x_arr[key] - self.START_POS[0]) ** 2) + ((y_arr[key] - self.START_POS[1])) ** 2)
-                if dist >= self.__enemy_init_dist and (x_arr[key], y_arr[key]) not in dup_list:
-                    self.__enemy_pos_list[i] = (x_arr[key], y_arr[key])
-                    dup_list.append((x_arr[key], y_arr[key]))
-                    break
+        dist_arr = np.sqrt(((x_arr - self.START_POS[0]) ** 2) + ((y_arr - self.START_POS[1]) ** 2))
+        x_arr, y_arr = x_arr[dist_arr >= self.__enemy_init_dist], y_arr[dist_arr >= self.__enemy_init_dist]
+        if x_arr.shape[0] < self.__enemy_num:
+            raise ValueError("There are not enough cells for enemies. Please lower the `enemy_init_dist`.")
 
-    def __move_enemy(self, state_arr):
-        opt_list = []
-        for dist in range(1, self.__enemy_moving_max_dist):
-            for x in [-1, 0, 1]:
-                for y in [-1, 0, 1]:
-                    if x == 0 and y == 0:
-                        continue
-                    opt_list.append((x * dist, y * dist))
+        key_arr = np.argsort(np.random.random((batch_size, x_arr.shape[0])), axis=1)[:, :self.__enemy_num]
+        return np.stack([x_arr[key_arr], y_arr[key_arr]], axis=2)
 
-        for e in range(self.__enemy_num):
-            random.shuffle(opt_list)
-            for e_x, e_y in opt_list:
-                next_e_x = self.__enemy_pos_list[e][0] + e_x
-                if next_e_x < 0 or next_e_x >= self.__map_arr.shape[1]:
-                    continue
-                next_e_y = self.__enemy_pos_list[e][1] + e_y
-                if next_e_y < 0 or next_e_y >= self.__map_arr.shape[0]:
-                    continue
-
-                wall_flag = False
-                if e_x > 0:
-                    for add_x in range(1, e_x):
-                        if self.__map_arr[self.__enemy_pos_list[e][0] + add_x, next_e_y] == self.WALL:
-                            wall_flag = True
-                elif e_x < 0:
-                    for add_x in range(e_x, 0):
-                        if self.__map_arr[self.__enemy_pos_list[e][0] + add_x, next_e_y] == self.WALL:
-                            wall_flag = True
-
-                if wall_flag is True:
-                    continue
-
-                if e_y > 0:
-                    for add_y in range(1, e_y):
-                        if self.__map_arr[next_e_x, self.__enemy_pos_list[e][1] + add_y] == self.WALL:
-                            wall_flag = True
-                elif e_y < 0:
-                    for add_y in range(e_y, 0):
-                        if self.__map_arr[next_e_x, self.__enemy_pos_list[e][1] + add_y] == self.WALL:
-                            wall_flag = True
-
-                if wall_flag is True:
-                    continue
-
-                if self.__map_arr[next_e_x, next_e_y] == self.WALL:
-                    continue
-                
-                self.__enemy_pos_list[e] = (next_e_x, next_e_y)
-                break
+    def __move_enemy(self, state_arr):
+        enemy_pos_arr = np.array(self.__enemy_pos_list).reshape((-1, 2))
+        x_arr, y_arr = self.__enemy_maze_reachability.move(enemy_pos_arr[:, 0], enemy_pos_arr[:, 1])
+        self.__enemy_pos_list = [(x, y) for x, y in zip(x_arr, y_arr)]
 
     def draw(self):
         '''
@@ -255,230 +236,54 @@ class MazeMultiAgentPolicy(PolicySampler):
         if self.inferencing_mode is True:
             self.__move_enemy(self.__state_arr)
 
-        for batch in range(self.__batch_size):
-            state_arr = self.__state_arr[batch, 0].asnumpy()
-            agent_x, agent_y = np.where(state_arr == 1)
-            agent_x, agent_y = agent_x[0], agent_y[0]
-
-            if self.inferencing_mode is False:
-                agent_x_arr, agent_y_arr = np.where(self.__map_arr == self.SPACE)
-                key = np.random.randint(low=0, high=agent_x_arr.shape[0])
-                random_agent_x = agent_x_arr[key]
-                random_agent_y = agent_y_arr[key]
-
-                state_arr[agent_x, agent_y] = 0
-                state_arr[random_agent_x, random_agent_y] = 1
-
-                self.__state_arr[batch, 0] = nd.ndarray.array(
-                    state_arr,
-                    ctx=self.__ctx
-                )
-                self.__create_enemy(self.__map_arr)
-
-            x_y_list = []
-            for dist in range(1, self.__moving_max_dist):
-                for x in [-1, 0, 1]:
-                    for y in [-1, 0, 1]:
-                        if x == 0 and y == 0:
-                            continue
-                        x_y_list.append((x * dist, y * dist))
-
-            x_y_arr = np.array(x_y_list)
-
-            _possible_action_arr = None
-            for i in range(x_y_arr.shape[0]):
-                x = x_y_arr[i][0]
-                y = x_y_arr[i][1]
-
-                next_x = agent_x + x
-                if next_x < 0 or next_x >= state_arr.shape[1]:
-                    continue
-                next_y = agent_y + y
-                if next_y < 0 or next_y >= state_arr.shape[0]:
-                    continue
-
-                if self.inferencing_mode is True:
-                    if (next_x, next_y) in self.__route_memory_list[batch]:
-                        continue
-
-                wall_flag = False
-                if x > 0:
-                    for add_x in range(1, x):
-                        if self.__map_arr[agent_x + add_x, next_y] == self.WALL:
-                            wall_flag = True
-                elif x < 0:
-                    for add_x in range(x, 0):
-                        if self.__map_arr[agent_x + add_x, next_y] == self.WALL:
-                            wall_flag = True
-                        
-                if wall_flag is True:
-                    continue
-
-                if y > 0:
-                    for add_y in range(1, y):
-                        if self.__map_arr[next_x, agent_y + add_y] == self.WALL:
-                            wall_flag = True
-                elif y < 0:
-                    for add_y in range(y, 0):
-                        if self.__map_arr[next_x, agent_y + add_y] == self.WALL:
-                            wall_flag = True
-
-                if wall_flag is True:
-                    continue
-
-                if self.__map_arr[next_x, next_y] == self.WALL:
-                    continue
-
-                    goal_flag = False
-                    if x > 0:
-                        for add_x in range(1, x):
-                            if self.__map_arr[agent_x + add_x, next_y] == self.GOAL:
-                                goal_flag = True
-                    elif x < 0:
-                        for add_x in range(x, 0):
-                            if self.__map_arr[agent_x + add_x, next_y] == self.GOAL:
-                                goal_flag = True
-
-                    if goal_flag is False:
-                        if y > 0:
-                            for add_y in range(1, y):
-                                if self.__map_arr[next_x, agent_y + add_y] == self.GOAL:
-                                    goal_flag = True
-                        elif y < 0:
-                            for add_y in range(y, 0):
-                                if self.__map_arr[next_x, agent_y + add_y] == self.GOAL:
-                                    goal_flag = True
-
-                    if goal_flag is True:
-                        next_x = self.__goal_pos[0]
-                        next_y = self.__goal_pos[1]
-
-                next_action_arr = np.zeros((state_arr.shape[0], state_arr.shape[1]))
-                next_action_arr[next_x, next_y] = 1
-                next_action_arr = np.expand_dims(next_action_arr, axis=0)
-                if _possible_action_arr is None:
-                    _possible_action_arr = next_action_arr
-                else:
-                    _possible_action_arr = np.concatenate(
-                        [
-                            _possible_action_arr, 
-                            next_action_arr
-                        ],
-                        axis=0
-                    )
-
-            if _possible_action_arr is None:
-                for i in range(x_y_arr.shape[0]):
-                    x = x_y_arr[i][0]
-                    y = x_y_arr[i][1]
-
-                    next_x = agent_x + x
-                    if next_x < 0 or next_x >= state_arr.shape[1]:
-                        continue
-                    next_y = agent_y + y
-                    if next_y < 0 or next_y >= state_arr.shape[0]:
-                        continue
-
-                    wall_flag = False
-                    if x > 0:
-                        for add_x in range(1, x):
-                            if self.__map_arr[agent_x + add_x, next_y] == self.WALL:
-                                wall_flag = True
-                    elif x < 0:
-                        for add_x in range(x, 0):
-                            if self.__map_arr[agent_x + add_x, next_y] == self.WALL:
-                                wall_flag = True
-
-                    if wall_flag is True:
-                        continue
-
-                    if y > 0:
-                        for add_y in range(1, y):
-                            if self.__map_arr[next_x, agent_y + add_y] == self.WALL:
-                                wall_flag = True
-                    elif y < 0:
-                        for add_y in range(y, 0):
-                            if self.__map_arr[next_x, agent_y + add_y] == self.WALL:
-                                wall_flag = True
-
-                    if wall_flag is True:
-                        continue
-
-                    if self.__map_arr[next_x, next_y] == self.WALL:
-                        continue
-
-
-                    goal_flag = False
-                    if x > 0:
-                        for add_x in range(1, x):
-                            if self.__map_arr[agent_x + add_x, next_y] == self.GOAL:
-                                goal_flag = True
-                    elif x < 0:
-                        for add_x in range(x, 0):
-                            if self.__map_arr[agent_x + add_x, next_y] == self.GOAL:
-                                goal_flag = True
-
-                    if goal_flag is False:
-                        if y > 0:
-                            for add_y in range(1, y):
-                                if self.__map_arr[next_x, agent_y + add_y] == self.GOAL:
-                                    goal_flag = True
-                        elif y < 0:
-                            for add_y in range(y, 0):
-                                if self.__map_arr[next_x, agent_y + add_y] == self.GOAL:
-                                    goal_flag = True
-
-                    if goal_flag is True:
-                        next_x = self.__goal_pos[0]
-                        next_y = self.__goal_pos[1]
-
-                    next_action_arr = np.zeros((state_arr.shape[0], state_arr.shape[1]))
-                    next_action_arr[next_x, next_y] = 1
-                    next_action_arr = np.expand_dims(next_action_arr, axis=0)
-                    if _possible_action_arr is None:
-                        _possible_action_arr = next_action_arr
-                    else:
-                        _possible_action_arr = np.concatenate(
-                            [
-                                _possible_action_arr, 
-                                next_action_arr
-                            ],
-                            axis=0
-                        )
-
-            if _possible_action_arr is None:
-                raise ValueError("No action option found. Please lower the `memory_num`.")
-
-            if _possible_action_arr.shape[0] < self.__possible_n:
-                row_diff = self.__possible_n - _possible_action_arr.shape[0]
-                while _possible_action_arr.shape[0] < self.__possible_n:
-                    _possible_action_arr = np.concatenate(
-                        [
-                            _possible_action_arr,
-                            _possible_action_arr[:row_diff]
-                        ],
-                        axis=0
-                    )
-
-            if _possible_action_arr.shape[0] > self.__possible_n:
-                key_arr = np.arange(_possible_action_arr.shape[0])
-                np.random.shuffle(key_arr)
-                _possible_action_arr = _possible_action_arr[key_arr[:self.__possible_n]]
-
-            # Forget oldest memory and do recuresive executing.
-            while len(self.__route_memory_list[batch]) > self.__memory_num:
-                self.__route_memory_list[batch] = self.__route_memory_list[batch][1:]
-
-            possible_action_arr[batch, :, 0] = _possible_action_arr
-            possible_action_arr[batch, :, 1] = self.__map_arr
-
-            for e in range(self.__enemy_num):
-                enemy_state_arr = np.zeros(state_arr.shape)
-                enemy_state_arr[
-                    self.__enemy_pos_list[e][0], 
-                    self.__enemy_pos_list[e][1]
-                ] = 1
-                possible_action_arr[batch, :, 2 + e] = enemy_state_arr
+        state_arr = self.__state_arr.asnumpy()
+        batch_size = state_arr.shape[0]
+        agent_x_arr, agent_y_arr = self.__extract_pos(state_arr[:, 0])
+
+        if self.inferencing_mode is False:
+            key_arr = np.random.randint(low=0, high=self.__space_x_arr.shape[0], size=batch_size)
+            agent_x_arr = self.__space_x_arr[key_arr]
+            agent_y_arr = self.__space_y_arr[key_arr]
+
+            agent_arr = np.zeros(state_arr[:, 0].shape)
+            agent_arr[np.arange(batch_size), agent_x_arr, agent_y_arr] = 1
+            self.__state_arr[:, 0] = nd.ndarray.array(agent_arr, ctx=self.__ctx)
+
+            # Enemies are created for each batch, and the last ones are kept.
+            enemy_pos_arr = self.__draw_enemy_pos(self.__map_arr, batch_size)
+            self.__enemy_pos_list = [(x, y) for x, y in enemy_pos_arr[-1]]
+            route_memory_list = None
+        else:
+            enemy_pos_arr = np.array([self.__enemy_pos_list] * batch_size).reshape((batch_size, -1, 2))
+            route_memory_list = self.__route_memory_list
+
+        next_x_arr, next_y_arr = self.__maze_reachability.draw(
+            agent_x_arr,
+            agent_y_arr,
+            self.__possible_n,
+            route_memory_list=route_memory_list,
+            goal_pos=self.__goal_pos
+        )
+
+        # Forget oldest memory and do recuresive executing.
+        for batch in range(len(self.__route_memory_list)):
+            if len(self.__route_memory_list[batch]) > self.__memory_num:
+                self.__route_memory_list[batch] = self.__route_memory_list[batch][
+                    len(self.__route_memory_list[batch]) - self.__memory_num:
+                ]
+
+        batch_arr = np.arange(batch_size)[:, None]
+        possible_arr = np.arange(self.__possible_n)[None, :]
+        possible_action_arr[batch_arr, possible_arr, 0, next_x_arr, next_y_arr] = 1
+        possible_action_arr[:, :, 1] = self.__map_arr
+        for e in range(self.__enemy_num):
+            possible_action_arr[
+                batch_arr,
+                possible_arr,
+                2 + e,
+                enemy_pos_arr[:, e, 0][:, None],
+                enemy_pos_arr[:, e, 1][:, None]
+            ] = 1
 
         possible_action_arr = nd.ndarray.array(possible_action_arr, ctx=self.__ctx)
         return possible_action_arr, None
@@ -511,48 +316,32 @@ class MazeMultiAgentPolicy(PolicySampler):
         Returns:
             Reward value.
         '''
-        reward_arr = self.__check_goal_flag(action_arr)
-        for i in range(action_arr.shape[0]):
-            _action_arr = action_arr[i, 0].asnumpy()
-            x, y = np.where(_action_arr == 1)
-            x, y = x[0], y[0]
-
-            e_dist_sum = 0.0
-            for e in range(self.__enemy_num):
-                e_dist = np.sqrt(
-                    ((x - self.__enemy_pos_list[e][0]) ** 2) + ((y - self.__enemy_pos_list[e][1]) ** 2)
-                )
-                e_dist_sum += e_dist
-
-            e_dist_penalty = e_dist_sum / self.__enemy_num
-
-            goal_x, goal_y = self.__goal_pos
-            
-            if x == goal_x and y == goal_y:
-                distance = 0.0
-            else:
-                distance = np.sqrt(((x - goal_x) ** 2) + (y - goal_y) ** 2)
-
-            if self.inferencing_mode is False:
-                state_arr = self.__state_arr
-
-            if state_arr is not None:
-                _state_arr = state_arr[i, 0].asnumpy()
-                pre_x, pre_y = np.where(_state_arr == 1)
-
-                if pre_x == goal_x and pre_y == goal_y:
-                    pre_distance = 0.0
-                else:
-                    pre_distance = np.sqrt(((pre_x - goal_x) ** 2) + (pre_y - goal_y) ** 2)
-
-                distance_penalty = distance - pre_distance
-                if distance_penalty == 0:
-                    distance_penalty = 1
-            else:
-                distance_penalty = 0
-
-            max_distance = (goal_x ** 2) + (goal_y ** 2)
-            reward_arr[i] = reward_arr[i] + (max_distance - distance) - distance_penalty + e_dist_penalty
+        x_arr, y_arr = self.__extract_pos(action_arr[:, 0].asnumpy())
+        goal_x, goal_y = self.__goal_pos
+
+        enemy_pos_arr = np.array(self.__enemy_pos_list).reshape((-1, 2))
+        e_dist_arr = np.sqrt(
+            ((x_arr[:, None] - enemy_pos_arr[None, :, 0]) ** 2) + ((y_arr[:, None] - enemy_pos_arr[None, :, 1]) ** 2)
+        )
+        e_dist_penalty_arr = e_dist_arr.sum(axis=1) / self.__enemy_num
+
+        reward_arr = np.logical_and(x_arr == goal_x, y_arr == goal_y).astype(float)
+        distance_arr = np.sqrt(((x_arr - goal_x) ** 2) + (y_arr - goal_y) ** 2)
+
+        if self.inferencing_mode is False:
+            state_arr = self.__state_arr
+
+        if state_arr is not None:
+            pre_x_arr, pre_y_arr = self.__extract_pos(state_arr[:, 0].asnumpy())
+            pre_distance_arr = np.sqrt(((pre_x_arr - goal_x) ** 2) + (pre_y_arr - goal_y) ** 2)
+
+            distance_penalty_arr = distance_arr - pre_distance_arr
+            distance_penalty_arr[distance_penalty_arr == 0] = 1
+        else:
+            distance_penalty_arr = 0
+
+        max_distance = (goal_x ** 2) + (goal_y ** 2)
+        reward_arr = reward_arr + (max_distance - distance_arr) - distance_penalty_arr + e_dist_penalty_arr
 
         reward_arr = nd.ndarray.array(reward_arr, ctx=self.__ctx)
         reward_arr = nd.sigmoid(reward_arr / max_distance)
@@ -574,20 +363,11 @@ class MazeMultiAgentPolicy(PolicySampler):
                 self.__map_arr.shape[1],
             )
         )
-        for i in range(state_arr.shape[0]):
-            x_y_arr = self.__agent_pos_arr[i]
-            x = x_y_arr[0]
-            y = x_y_arr[1]
-            state_arr[i, 0, x, y] = 1
-            state_arr[i, 1] = self.__map_arr
-
-            for e in range(self.__enemy_num):
-                enemy_state_arr = np.zeros(self.__map_arr.shape)
-                enemy_state_arr[
-                    self.__enemy_pos_list[e][0], 
-                    self.__enemy_pos_list[e][1]
-                ] = 1
-                state_arr[i, 2 + e] = enemy_state_arr
+        batch_arr = np.arange(state_arr.shape[0])
+        state_arr[batch_arr, 0, self.__agent_pos_arr[:, 0], self.__agent_pos_arr[:, 1]] = 1
+        state_arr[:, 1] = self.__map_arr
+        for e in range(self.__enemy_num):
+            state_arr[batch_arr, 2 + e, self.__enemy_pos_list[e][0], self.__enemy_pos_list[e][1]] = 1
 
         return nd.ndarray.array(state_arr, ctx=self.__ctx)
 
@@ -610,54 +390,45 @@ class MazeMultiAgentPolicy(PolicySampler):
             - state in `self.t+1`.
             - meta data of the state.
         '''
-        action_arr = action_arr.asnumpy()
-        for i in range(action_arr.shape[0]):
-            x, y = np.where(action_arr[0, 0] == 1)
-            self.__agent_pos_arr[i] = np.array([x[0], y[0]])
+        x_arr, y_arr = self.__extract_pos(action_arr[:, 0].asnumpy())
+        self.__agent_pos_arr = np.c_[x_arr, y_arr]
 
-            if self.inferencing_mode is True:
-                self.__route_memory_list[i].append((x[0], y[0]))
+        if self.inferencing_mode is True:
+            for i in range(x_arr.shape[0]):
+                self.__route_memory_list[i].append((x_arr[i], y_arr[i]))
 
         return self.extract_now_state(), meta_data_arr
 
-    def __check_goal_flag(self, state_arr):
-        goal_arr = np.zeros((state_arr.shape[0]))
-        state_arr = state_arr.asnumpy()
-
-        self.END_STATE_list = []
-        for i in range(state_arr.shape[0]):
-            x, y = np.where(state_arr[i, 0] == 1)
-            goal_x, goal_y = self.__goal_pos
-            if x[0] == goal_x and y[0] == goal_y:
-                goal_arr[i] = 1
-                self.END_STATE_list.append("Goal")
-            else:
-                goal_arr[i] = 0
-                self.END_STATE_list.append("Not goal")
+    def __extract_pos(self, agent_arr):
+        '''
+        Extract the positions of agents.
+
+        Args:
+            agent_arr:  `np.ndarray` of one-hot maps of agents. The shape is: (batch, height, width)
+
+        Returns:
+            Tuple data.
+            - `np.ndarray` of the x-coordinates of agents.
+            - `np.ndarray` of the y-coordinates of agents.
+        '''
+        key_arr = agent_arr.reshape((agent_arr.shape[0], -1)).argmax(axis=1)
+        return key_arr // agent_arr.shape[2], key_arr % agent_arr.shape[2]
 
+    def __check_goal_flag(self, state_arr):
+        x_arr, y_arr = self.__extract_pos(state_arr[:, 0].asnumpy())
+        goal_x, goal_y = self.__goal_pos
+        goal_arr = np.logical_and(x_arr == goal_x, y_arr == goal_y).astype(float)
+        self.END_STATE_list = ["Goal" if goal == 1 else "Not goal" for goal in goal_arr]
         return goal_arr
 
     def __check_crash_flag(self, state_arr):
-        crash_arr = np.zeros((state_arr.shape[0]))
-        state_arr = state_arr.asnumpy()
-
-        self.END_STATE_list = []
-        for i in range(state_arr.shape[0]):
-            x, y = np.where(state_arr[i, 0] == 1)
-            x, y = x[0], y[0]
-
-            flag = False
-            for e in range(self.__enemy_num):
-                if x == self.__enemy_pos_list[e][0] and y == self.__enemy_pos_list[e][1]:
-                    flag = True
-                    break
-
-            crash_arr[i] = int(flag)
-            if flag is True:
-                self.END_STATE_list.append("Crash")
-            else:
-                self.END_STATE_list.append("Not crash")
-
+        x_arr, y_arr = self.__extract_pos(state_arr[:, 0].asnumpy())
+        enemy_pos_arr = np.array(self.__enemy_pos_list).reshape((-1, 2))
+        crash_arr = np.logical_and(
+            x_arr[:, None] == enemy_pos_arr[None, :, 0],
+            y_arr[:, None] == enemy_pos_arr[None, :, 1]
+        ).any(axis=1).astype(float)
+        self.END_STATE_list = ["Crash" if crash == 1 else "Not crash" for crash in crash_arr]
         return crash_arr
 
     def check_the_end_flag(self, state_arr, meta_data_arr=None):
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from accelbrainbase.samplabledata.policy_sampler import PolicySampler
+from pyqlearning.samplabledata.policysampler.maze_reachability import MazeReachability
 
 import mxnet.ndarray as nd
 import mxnet as mx
@@ -54,6 +55,13 @@ class MazePolicy(PolicySampler):
         '''
         self.__batch_size = batch_size
         self.__map_arr = self.__create_map(map_size)
+        self.__space_x_arr, self.__space_y_arr = np.where(self.__map_arr == self.SPACE)
+        self.__maze_reachability = MazeReachability(
+            self.__map_arr,
+            moving_max_dist,
+            wall=self.WALL,
+            goal=self.GOAL
+        )
         self.__agent_pos_arr = np.array(
             [
                 self.START_POS
@@ -148,228 +156,52 @@ class MazePolicy(PolicySampler):
         Returns:
             `Tuple` of `mx.nd.array`s.
         '''
+        state_arr = self.__state_arr.asnumpy()
+        batch_size = state_arr.shape[0]
+        agent_x_arr, agent_y_arr = self.__extract_pos(state_arr[:, 0])
+
+        if self.inferencing_mode is False:
+            key_arr = np.random.randint(low=0, high=self.__space_x_arr.shape[0], size=batch_size)
+            agent_x_arr = self.__space_x_arr[key_arr]
+            agent_y_arr = self.__space_y_arr[key_arr]
+
+            agent_arr = np.zeros(state_arr[:, 0].shape)
+            agent_arr[np.arange(batch_size), agent_x_arr, agent_y_arr] = 1
+            self.__state_arr[:, 0] = nd.ndarray.array(agent_arr, ctx=self.__ctx)
+            route_memory_list = None
+        else:
+            route_memory_list = self.__route_memory_list
+
+        next_x_arr, next_y_arr = self.__maze_reachability.draw(
+            agent_x_arr,
+            agent_y_arr,
+            self.__possible_n,
+            route_memory_list=route_memory_list,
+            goal_pos=self.__goal_pos
+        )
+
+        # Forget oldest memory and do recuresive executing.
+        for batch in range(len(self.__route_memory_list)):
+            if len(self.__route_memory_list[batch]) > self.__memory_num:
+                self.__route_memory_list[batch] = self.__route_memory_list[batch][
+                    len(self.__route_memory_list[batch]) - self.__memory_num:
+                ]
+
         possible_action_arr = np.zeros((
-            self.__state_arr.shape[0],
+            batch_size,
             self.__possible_n,
-            self.__state_arr.shape[1],
-            self.__state_arr.shape[2],
-            self.__state_arr.shape[3],
+            state_arr.shape[1],
+            state_arr.shape[2],
+            state_arr.shape[3],
         ))
-        for batch in range(self.__batch_size):
-            state_arr = self.__state_arr[batch, 0].asnumpy()
-            agent_x, agent_y = np.where(state_arr == 1)
-            agent_x, agent_y = agent_x[0], agent_y[0]
-
-            if self.inferencing_mode is False:
-                agent_x_arr, agent_y_arr = np.where(self.__map_arr == self.SPACE)
-                key = np.random.randint(low=0, high=agent_x_arr.shape[0])
-                random_agent_x = agent_x_arr[key]
-                random_agent_y = agent_y_arr[key]
-
-                state_arr[agent_x, agent_y] = 0
-                state_arr[random_agent_x, random_agent_y] = 1
-
-                self.__state_arr[batch, 0] = nd.ndarray.array(
-                    state_arr,
-                    ctx=self.__ctx
-                )
-
-            x_y_list = []
-            for dist in range(1, self.__moving_max_dist):
-                for x in [-1, 0, 1]:
-                    for y in [-1, 0, 1]:
-                        if x == 0 and y == 0:
-                            continue
-                        x_y_list.append((x * dist, y * dist))
-
-            x_y_arr = np.array(x_y_list)
-
-            _possible_action_arr = None
-            for i in range(x_y_arr.shape[0]):
-                x = x_y_arr[i][0]
-                y = x_y_arr[i][1]
-
-                next_x = agent_x + x
-                if next_x < 0 or next_x >= state_arr.shape[1]:
-                    continue
-                next_y = agent_y + y
-                if next_y < 0 or next_y >= state_arr.shape[0]:
-                    continue
-
-                if self.inferencing_mode is True:
-                    if (next_x, next_y) in self.__route_memory_list[batch]:
-                        continue
-
-                wall_flag = False
-                if x > 0:
-                    for add_x in range(1, x):
-                        if self.__map_arr[agent_x + add_x, next_y] == self.WALL:
-                            wall_flag = True
-                elif x < 0:
-                    for add_x in range(x, 0):
-                        if self.__map_arr[agent_x + add_x, next_y] == self.WALL:
-                            wall_flag = True
-                        
-                if wall_flag is True:
-                    continue
-
-                if y > 0:
-                    for add_y in range(1, y):
-                        if self.__map_arr[next_x, agent_y + add_y] == self.WALL:
-                            wall_flag = True
-                elif y < 0:
-                    for add_y in range(y, 0):
-                        if self.__map_arr[next_x, agent_y + add_y] == self.WALL:
-                            wall_flag = True
-
-                if wall_flag is True:
-                    continue
-
-                if self.__map_arr[next_x, next_y] == self.WALL:
-                    continue
-
-                    goal_flag = False
-                    if x > 0:
-                        for add_x in range(1, x):
-                            if self.__map_arr[agent_x + add_x, next_y] == self.GOAL:
-                                goal_flag = True
-                    elif x < 0:
-                        for add_x in range(x, 0):
-                            if self.__map_arr[agent_x + add_x, next_y] == self.GOAL:
-                                goal_flag = True
-
-                    if goal_flag is False:
-                        if y > 0:
-                            for add_y in range(1, y):
-                                if self.__map_arr[next_x, agent_y + add_y] == self.GOAL:
-                                    goal_flag = True
-                        elif y < 0:
-                            for add_y in range(y, 0):
-                                if self.__map_arr[next_x, agent_y + add_y] == self.GOAL:
-                                    goal_flag = True
-
-                    if goal_flag is True:
-                        next_x = self.__goal_pos[0]
-                        next_y = self.__goal_pos[1]
-
-                next_action_arr = np.zeros((state_arr.shape[0], state_arr.shape[1]))
-                next_action_arr[next_x, next_y] = 1
-                next_action_arr = np.expand_dims(next_action_arr, axis=0)
-                if _possible_action_arr is None:
-                    _possible_action_arr = next_action_arr
-                else:
-                    _possible_action_arr = np.concatenate(
-                        [
-                            _possible_action_arr, 
-                            next_action_arr
-                        ],
-                        axis=0
-                    )
-
-            if _possible_action_arr is None:
-                for i in range(x_y_arr.shape[0]):
-                    x = x_y_arr[i][0]
-                    y = x_y_arr[i][1]
-
-                    next_x = agent_x + x
-                    if next_x < 0 or next_x >= state_arr.shape[1]:
-                        continue
-                    next_y = agent_y + y
-                    if next_y < 0 or next_y >= state_arr.shape[0]:
-                        continue
-
-                    wall_flag = False
-                    if x > 0:
-                        for add_x in range(1, x):
-                            if self.__map_arr[agent_x + add_x, next_y] == self.WALL:
-                                wall_flag = True
-                    elif x < 0:
-                        for add_x in range(x, 0):
-                            if self.__map_arr[agent_x + add_x, next_y] == self.WALL:
-                                wall_flag = True
-
-                    if wall_flag is True:
-                        continue
-
-                    if y > 0:
-                        for add_y in range(1, y):
-                            if self.__map_arr[next_x, agent_y + add_y] == self.WALL:
-                                wall_flag = True
-                    elif y < 0:
-                        for add_y in range(y, 0):
-                            if self.__map_arr[next_x, agent_y + add_y] == self.WALL:
-                                wall_flag = True
-
-                    if wall_flag is True:
-                        continue
-
-                    if self.__map_arr[next_x, next_y] == self.WALL:
-                        continue
-
-
-                    goal_flag = False
-                    if x > 0:
-                        for add_x in range(1, x):
-                            if self.__map_arr[agent_x + add_x, next_y] == self.GOAL:
-                                goal_flag = True
-                    elif x < 0:
-                        for add_x in range(x, 0):
-                            if self.__map_arr[agent_x + add_x, next_y] == self.GOAL:
-                                goal_flag = True
-
-                    if goal_flag is False:
-                        if y > 0:
-                            for add_y in range(1, y):
-                                if self.__map_arr[next_x, agent_y + add_y] == self.GOAL:
-                                    goal_flag = True
-                        elif y < 0:
-                            for add_y in range(y, 0):
-                                if self.__map_arr[next_x, agent_y + add_y] == self.GOAL:
-                                    goal_flag = True
-
-                    if goal_flag is True:
-                        next_x = self.__goal_pos[0]
-                        next_y = self.__goal_pos[1]
-
-                    next_action_arr = np.zeros((state_arr.shape[0], state_arr.shape[1]))
-                    next_action_arr[next_x, next_y] = 1
-                    next_action_arr = np.expand_dims(next_action_arr, axis=0)
-                    if _possible_action_arr is None:
-                        _possible_action_arr = next_action_arr
-                    else:
-                        _possible_action_arr = np.concatenate(
-                            [
-                                _possible_action_arr, 
-                                next_action_arr
-                            ],
-                            axis=0
-                        )
-
-            if _possible_action_arr is None:
-                raise ValueError("No action option found. Please lower the `memory_num`.")
-
-            if _possible_action_arr.shape[0] < self.__possible_n:
-                row_diff = self.__possible_n - _possible_action_arr.shape[0]
-                while _possible_action_arr.shape[0] < self.__possible_n:
-                    _possible_action_arr = np.concatenate(
-                        [
-                            _possible_action_arr,
-                            _possible_action_arr[:row_diff]
-                        ],
-                        axis=0
-                    )
-
-            if _possible_action_arr.shape[0] > self.__possible_n:
-                key_arr = np.arange(_possible_action_arr.shape[0])
-                np.random.shuffle(key_arr)
-                _possible_action_arr = _possible_action_arr[key_arr[:self.__possible_n]]
-
-            # Forget oldest memory and do recuresive executing.
-            while len(self.__route_memory_list[batch]) > self.__memory_num:
-                self.__route_memory_list[batch] = self.__route_memory_list[batch][1:]
-
-            possible_action_arr[batch, :, 0] = _possible_action_arr
-            possible_action_arr[batch, :, 1] = self.__map_arr
+        possible_action_arr[
+            np.arange(batch_size)[:, None],
+            np.arange(self.__possible_n)[None, :],
+            0,
+            next_x_arr,
+            next_y_arr
+        ] = 1
+        possible_action_arr[:, :, 1] = self.__map_arr
 
         possible_action_arr = nd.ndarray.array(possible_action_arr, ctx=self.__ctx)
         return possible_action_arr, None
@@ -402,39 +234,26 @@ class MazePolicy(PolicySampler):
         Returns:
             Reward value.
         '''
-        reward_arr = self.__check_goal_flag(action_arr)
-        for i in range(action_arr.shape[0]):
-            _action_arr = action_arr[i, 0].asnumpy()
-            x, y = np.where(_action_arr == 1)
-            x, y = x[0], y[0]
-
-            goal_x, goal_y = self.__goal_pos
-            
-            if x == goal_x and y == goal_y:
-                distance = 0.0
-            else:
-                distance = np.sqrt(((x - goal_x) ** 2) + (y - goal_y) ** 2)
-
-            if self.inferencing_mode is False:
-                state_arr = self.__state_arr
-
-            if state_arr is not None:
-                _state_arr = state_arr[i, 0].asnumpy()
-                pre_x, pre_y = np.where(_state_arr == 1)
-
-                if pre_x == goal_x and pre_y == goal_y:
-                    pre_distance = 0.0
-                else:
-                    pre_distance = np.sqrt(((pre_x - goal_x) ** 2) + (pre_y - goal_y) ** 2)
-
-                distance_penalty = distance - pre_distance
-                if distance_penalty == 0:
-                    distance_penalty = 1
-            else:
-                distance_penalty = 0
-
-            max_distance = (goal_x ** 2) + (goal_y ** 2)
-            reward_arr[i] = reward_arr[i] + (max_distance - distance) - distance_penalty
+        x_arr, y_arr = self.__extract_pos(action_arr[:, 0].asnumpy())
+        goal_x, goal_y = self.__goal_pos
+
+        reward_arr = np.logical_and(x_arr == goal_x, y_arr == goal_y).astype(float)
+        distance_arr = np.sqrt(((x_arr - goal_x) ** 2) + (y_arr - goal_y) ** 2)
+
+        if self.inferencing_mode is False:
+            state_arr = self.__state_arr
+
+        if state_arr is not None:
+            pre_x_arr, pre_y_arr = self.__extract_pos(state_arr[:, 0].asnumpy())
+            pre_distance_arr = np.sqrt(((pre_x_arr - goal_x) ** 2) + (pre_y_arr - goal_y) ** 2)
+
+            distance_penalty_arr = distance_arr - pre_distance_arr
+            distance_penalty_arr[distance_penalty_arr == 0] = 1
+        else:
+            distance_penalty_arr = 0
+
+        max_distance = (goal_x ** 2) + (goal_y ** 2)
+        reward_arr = reward_arr + (max_distance - distance_arr) - distance_penalty_arr
 
         reward_arr = nd.ndarray.array(reward_arr, ctx=self.__ctx)
         reward_arr = nd.sigmoid(reward_arr / max_distance)
@@ -456,12 +275,13 @@ class MazePolicy(PolicySampler):
                 self.__map_arr.shape[1],
             )
         )
-        for i in range(state_arr.shape[0]):
-            x_y_arr = self.__agent_pos_arr[i]
-            x = x_y_arr[0]
-            y = x_y_arr[1]
-            state_arr[i, 0, x, y] = 1
-            state_arr[i, 1] = self.__map_arr
+        state_arr[
+            np.arange(state_arr.shape[0]),
+            0,
+            self.__agent_pos_arr[:, 0],
+            self.__agent_pos_arr[:, 1]
+        ] = 1
+        state_arr[:, 1] = self.__map_arr
         return nd.ndarray.array(state_arr, ctx=self.__ctx)
 
     def update_state(
@@ -483,29 +303,34 @@ class MazePolicy(PolicySampler):
             - state in `self.t+1`.
             - meta data of the state.
         '''
-        action_arr = action_arr.asnumpy()
-        for i in range(action_arr.shape[0]):
-            x, y = np.where(action_arr[0, 0] == 1)
-            self.__agent_pos_arr[i] = np.array([x[0], y[0]])
+        x_arr, y_arr = self.__extract_pos(action_arr[:, 0].asnumpy())
+        self.__agent_pos_arr = np.c_[x_arr, y_arr]
 
-            if self.inferencing_mode is True:
-                self.__route_memory_list[i].append((x[0], y[0]))
+        if self.inferencing_mode is True:
+            for i in range(x_arr.shape[0]):
+                self.__route_memory_list[i].append((x_arr[i], y_arr[i]))
 
         return self.extract_now_state(), meta_data_arr
 
+    def __extract_pos(self, agent_arr):
+        '''
+        Extract the positions of agents.
+
+        Args:
+            agent_arr:  `np.ndarray` of one-hot maps of agents. The shape is: (batch, height, width)
+
+        Returns:
+            Tuple data.
+            - `np.ndarray` of the x-coordinates of agents.
+            - `np.ndarray` of the y-coordinates of agents.
+        '''
+        key_arr = agent_arr.reshape((agent_arr.shape[0], -1)).argmax(axis=1)
+        return key_arr // agent_arr.shape[2], key_arr % agent_arr.shape[2]
+
     def __check_goal_flag(self, state_arr):
-        goal_arr = np.zeros((state_arr.shape[0]))
-        state_arr = state_arr.asnumpy()
-
-        for i in range(state_arr.shape[0]):
-            x, y = np.where(state_arr[i, 0] == 1)
-            goal_x, goal_y = self.__goal_pos
-            if x[0] == goal_x and y[0] == goal_y:
-                goal_arr[i] = 1
-            else:
-                goal_arr[i] = 0
-
-        return goal_arr
+        x_arr, y_arr = self.__extract_pos(state_arr[:, 0].asnumpy())
+        goal_x, goal_y = self.__goal_pos
+        return np.logical_and(x_arr == goal_x, y_arr == goal_y).astype(float)
 
     def check_the_end_flag(self, state_arr, meta_data_arr=None):
         '''
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+
+class MazeReachability(object):
+    '''
+    The lookup table of the cells which the agents can reach in the maze.
+
+    The agents move from `(x, y)` to `(x + dx * dist, y + dy * dist)`, where `dx` and `dy`
+    are `-1`, `0`, or `1` and `dist` is less than `moving_max_dist`. The move is legal
+    if the destination and the cells on its path are not walls. This class checks
+    the walls of every pair of cells and offsets once when the map is created,
+    so that the legal moves of all agents in the batch can be drawn by array indexing.
+    '''
+
+    def __init__(self, map_arr, moving_max_dist, wall=-1, goal=3):
+        '''
+        Init.
+
+        Args:
+            map_arr:            `np.ndarray` of map. The shape is: (height, width)
+            moving_max_dist:    `int` of the maximum distance of moving (exclusive).
+            wall:               The value of walls in `map_arr`.
+            goal:               The value of goal in `map_arr`.
+        '''
+        if isinstance(map_arr, np.ndarray) is False:
+            raise TypeError("The type of `map_arr` must be `np.ndarray`.")
+        if map_arr.ndim != 2:
+            raise ValueError("The rank of `map_arr` must be `2`.")
+
+        offset_list = []
+        for dist in range(1, moving_max_dist):
+            for x in [-1, 0, 1]:
+                for y in [-1, 0, 1]:
+                    if x == 0 and y == 0:
+                        continue
+                    offset_list.append((x * dist, y * dist))
+
+        offset_arr = np.array(offset_list, dtype=int).reshape(-1, 2)
+
+        # The outside of map is regarded as walls.
+        pad = max(moving_max_dist, 1)
+        padded_map_arr = np.full(
+            (map_arr.shape[0] + pad * 2, map_arr.shape[1] + pad * 2),
+            wall,
+            dtype=map_arr.dtype
+        )
+        padded_map_arr[pad:pad+map_arr.shape[0], pad:pad+map_arr.shape[1]] = map_arr
+
+        def shift(x, y):
+            return padded_map_arr[
+                pad+x:pad+x+map_arr.shape[0],
+                pad+y:pad+y+map_arr.shape[1]
+            ]
+
+        reachable_arr = np.zeros(map_arr.shape + (offset_arr.shape[0], ), dtype=bool)
+        goal_flag_arr = np.zeros(map_arr.shape + (offset_arr.shape[0], ), dtype=bool)
+        for k in range(offset_arr.shape[0]):
+            x, y = offset_arr[k]
+
+            # The cells on the path from `(x, y)` to the destination.
+            path_list = []
+            if x > 0:
+                path_list.extend([(add_x, y) for add_x in range(1, x)])
+            elif x < 0:
+                path_list.extend([(add_x, y) for add_x in range(x, 0)])
+            if y > 0:
+                path_list.extend([(x, add_y) for add_y in range(1, y)])
+            elif y < 0:
+                path_list.extend([(x, add_y) for add_y in range(y, 0)])
+
+            reachable = shift(x, y) != wall
+            goal_flag = np.zeros(map_arr.shape, dtype=bool)
+            for path_x, path_y in path_list:
+                reachable = np.logical_and(reachable, shift(path_x, path_y) != wall)
+                goal_flag = np.logical_or(goal_flag, shift(path_x, path_y) == goal)
+
+            reachable_arr[:, :, k] = reachable
+            goal_flag_arr[:, :, k] = goal_flag
+
+        self.__offset_arr = offset_arr
+        self.__reachable_arr = reachable_arr
+        self.__goal_flag_arr = goal_flag_arr
+
+    def draw(
+        self,
+        x_arr,
+        y_arr,
+        possible_n,
+        route_memory_list=None,
+        goal_pos=None
+    ):
+        '''
+        Draw the legal moves of agents.
+
+        If there are more legal moves than `possible_n`, the moves are drawn at random.
+        If there are less, the legal moves are repeated.
+
+        Args:
+            x_arr:              `np.ndarray` of the x-coordinates of agents. The shape is: (batch, )
+            y_arr:              `np.ndarray` of the y-coordinates of agents. The shape is: (batch, )
+            possible_n:         `int` of the number of moves to be drawn per agent.
+            route_memory_list:  `list` of `list`s of `tuple`s of the cells which agents visited.
+                                These cells are excluded unless no legal move remains.
+                                In that case, the moves through the goal reach the goal.
+            goal_pos:           `tuple` of the position of goal.
+
+        Returns:
+            Tuple data.
+            - `np.ndarray` of the x-coordinates of destinations. The shape is: (batch, possible_n)
+            - `np.ndarray` of the y-coordinates of destinations. The shape is: (batch, possible_n)
+        '''
+        next_x_arr = x_arr[:, None] + self.__offset_arr[None, :, 0]
+        next_y_arr = y_arr[:, None] + self.__offset_arr[None, :, 1]
+        reachable_arr = self.__reachable_arr[x_arr, y_arr]
+
+        if route_memory_list is not None:
+            visited_arr = np.zeros(reachable_arr.shape, dtype=bool)
+            for batch, route_memory in enumerate(route_memory_list):
+                for memory_x, memory_y in route_memory:
+                    visited_arr[batch] = np.logical_or(
+                        visited_arr[batch],
+                        np.logical_and(next_x_arr[batch] == memory_x, next_y_arr[batch] == memory_y)
+                    )
+
+            unvisited_arr = np.logical_and(reachable_arr, np.logical_not(visited_arr))
+            fallback_arr = unvisited_arr.sum(axis=1) == 0
+            reachable_arr = np.where(fallback_arr[:, None], reachable_arr, unvisited_arr)
+
+            if goal_pos is not None:
+                goal_flag_arr = np.logical_and(
+                    self.__goal_flag_arr[x_arr, y_arr],
+                    fallback_arr[:, None]
+                )
+                next_x_arr = np.where(goal_flag_arr, goal_pos[0], next_x_arr)
+                next_y_arr = np.where(goal_flag_arr, goal_pos[1], next_y_arr)
+
+        possible_n_arr = reachable_arr.sum(axis=1)
+        if (possible_n_arr == 0).any():
+            raise ValueError("No action option found. Please lower the `memory_num`.")
+
+        # Shuffle the legal moves, and repeat them if they are less than `possible_n`.
+        rank_arr = np.argsort(
+            np.where(reachable_arr, np.random.random(reachable_arr.shape), -1.0) * -1,
+            axis=1
+        )
+        key_arr = rank_arr[
+            np.arange(rank_arr.shape[0])[:, None],
+            np.arange(possible_n)[None, :] % possible_n_arr[:, None]
+        ]
+        batch_arr = np.arange(key_arr.shape[0])[:, None]
+        return next_x_arr[batch_arr, key_arr], next_y_arr[batch_arr, key_arr]
+
+    def move(self, x_arr, y_arr):
+        '''
+        Move agents to one of the legal moves at random.
+        The agents which have no legal move stay.
+
+        Args:
+            x_arr:      `np.ndarray` of the x-coordinates of agents. The shape is: (batch, )
+            y_arr:      `np.ndarray` of the y-coordinates of agents. The shape is: (batch, )
+
+        Returns:
+            Tuple data.
+            - `np.ndarray` of the x-coordinates of destinations. The shape is: (batch, )
+            - `np.ndarray` of the y-coordinates of destinations. The shape is: (batch, )
+        '''
+        x_arr = np.array(x_arr, dtype=int)
+        y_arr = np.array(y_arr, dtype=int)
+        if self.__offset_arr.shape[0] == 0:
+            return x_arr, y_arr
+
+        movable_arr = self.__reachable_arr[x_arr, y_arr].any(axis=1)
+        if movable_arr.any():
+            next_x_arr, next_y_arr = self.draw(x_arr[movable_arr], y_arr[movable_arr], 1)
+            x_arr[movable_arr] = next_x_arr[:, 0]
+            y_arr[movable_arr] = next_y_arr[:, 0]
+        return x_arr, y_arr
+
+    def get_offset_arr(self):
+        ''' getter '''
+        return self.__offset_arr
+
+    def set_readonly(self, value):
+        ''' setter '''
+        raise TypeError("This property must be read-only.")
+
+    offset_arr = property(get_offset_arr, set_readonly)
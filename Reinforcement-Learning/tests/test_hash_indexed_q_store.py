@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+import shutil
+import tempfile
+import unittest
+
+from pyqlearning.qvaluestorable.hash_indexed_q_store import HashIndexedQStore
+
+
+class TestHashIndexedQStore(unittest.TestCase):
+    '''
+    Test `HashIndexedQStore`.
+    '''
+
+    def setUp(self):
+        self.dir_path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir_path, ignore_errors=True)
+
+    def test_save_after_set_q_df(self):
+        q_store = HashIndexedQStore()
+        q_store.save_q("a", 0, 1.0)
+        q_store.save_q("b", 0, 2.0)
+        q_store.save(self.dir_path)
+
+        # The keys are interned again in the reversed order.
+        q_store.q_df = q_store.q_df.iloc[::-1]
+        q_store.save_q("c", 0, 3.0)
+        q_store.save(self.dir_path)
+
+        loaded_q_store = HashIndexedQStore()
+        loaded_q_store.load(self.dir_path)
+        self.assertEqual(len(loaded_q_store), 3)
+        self.assertEqual(loaded_q_store.extract_q("a", 0), 1.0)
+        self.assertEqual(loaded_q_store.extract_q("b", 0), 2.0)
+        self.assertEqual(loaded_q_store.extract_q("c", 0), 3.0)
+
+    def test_append_save(self):
+        q_store = HashIndexedQStore()
+        q_store.save_q("a", 0, 1.0)
+        q_store.save(self.dir_path)
+        q_store.save_q("b", 1, 2.0)
+        q_store.save_q("a", 0, 4.0)
+        q_store.save(self.dir_path)
+
+        loaded_q_store = HashIndexedQStore()
+        loaded_q_store.load(self.dir_path, read_only_flag=True)
+        self.assertEqual(loaded_q_store.extract_q("a", 0), 4.0)
+        self.assertEqual(loaded_q_store.extract_q("b", 1), 2.0)
+        with self.assertRaises(TypeError):
+            loaded_q_store.save_q("a", 0, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+import shutil
+import tempfile
+import unittest
+
+from pyqlearning.qlearning.greedy_q_learning import GreedyQLearning
+from pyqlearning.qvaluestorable.hash_indexed_q_store import HashIndexedQStore
+from pyqlearning.misc.multiagentqlearning.alternated_multi_agent import AlternatedMultiAgent
+
+
+class CountingQLearning(GreedyQLearning):
+    '''
+    The agent which records the time of each step.
+    '''
+
+    def __init__(self):
+        super().__init__()
+        self.q_store = HashIndexedQStore()
+        self.t_list = []
+
+    def extract_possible_actions(self, state_key):
+        return [0, 1]
+
+    def observe_reward_value(self, state_key, action_key):
+        self.t_list.append(self.t)
+        return float(action_key)
+
+    def update_state(self, state_key, action_key):
+        return state_key
+
+    def check_the_end_flag(self, state_key):
+        return False
+
+
+class TestMultiAgentQLearning(unittest.TestCase):
+    '''
+    Test `MultiAgentQLearning`.
+    '''
+
+    def setUp(self):
+        self.dir_path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir_path, ignore_errors=True)
+
+    def test_resume_keeps_t(self):
+        multi_agent = AlternatedMultiAgent([CountingQLearning(), CountingQLearning()])
+        multi_agent.learn(0, limit=4)
+        self.assertEqual(multi_agent.t, 5)
+        multi_agent.save(self.dir_path)
+
+        resumed_multi_agent = AlternatedMultiAgent([CountingQLearning(), CountingQLearning()])
+        resumed_multi_agent.resume(self.dir_path, 0, limit=8, game_n=2)
+
+        # The first game continues from `t = 5`, and the second game starts from `t = 1`.
+        t_list = resumed_multi_agent.q_learning_list[0].t_list
+        self.assertEqual(t_list[0], 5)
+        self.assertIn(1, t_list)
+        self.assertEqual(t_list.index(1), 2)
+
+        # `learn` after `resume` starts from `t = 1`.
+        resumed_multi_agent.q_learning_list[0].t_list = []
+        resumed_multi_agent.learn(0, limit=2)
+        self.assertEqual(resumed_multi_agent.q_learning_list[0].t_list[0], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
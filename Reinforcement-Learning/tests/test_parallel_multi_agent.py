@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+import os
+import random
+import time
+import unittest
+
+import numpy as np
+
+from pyqlearning.qlearning.greedy_q_learning import GreedyQLearning
+from pyqlearning.qvaluestorable.hash_indexed_q_store import HashIndexedQStore
+from pyqlearning.misc.multiagentqlearning.parallel_multi_agent import ParallelMultiAgent
+
+
+class WalkingQLearning(GreedyQLearning):
+    '''
+    The agent which walks on the line.
+    If `crash_t` is not `None`, the process is killed in the time.
+    '''
+
+    def __init__(self, crash_t=None):
+        super().__init__()
+        self.q_store = HashIndexedQStore()
+        self.crash_t = crash_t
+
+    def extract_possible_actions(self, state_key):
+        return [-1, 1]
+
+    def observe_reward_value(self, state_key, action_key):
+        return float(action_key)
+
+    def update_state(self, state_key, action_key):
+        if self.crash_t is not None and self.t >= self.crash_t:
+            os._exit(1)
+        agent_i, joint_state_key = state_key
+        return (joint_state_key[agent_i][0] + action_key, )
+
+    def check_the_end_flag(self, state_key):
+        return False
+
+
+class TestParallelMultiAgent(unittest.TestCase):
+    '''
+    Test `ParallelMultiAgent`.
+    '''
+
+    def test_learn(self):
+        multi_agent = ParallelMultiAgent([WalkingQLearning(), WalkingQLearning()], worker_n=2, seed=1)
+        multi_agent.learn([[0.0], [0.0]], limit=5)
+        self.assertEqual(multi_agent.t, 6)
+        self.assertEqual(multi_agent.throughput_df.step_n.tolist(), [5, 5])
+
+    def test_seed_keeps_global_random_state(self):
+        # With `worker_n=1`, the agents are stepped in this process.
+        np_random_state = np.random.get_state()
+        random_state = random.getstate()
+        expected_list = [np.random.random(), random.random()]
+        np.random.set_state(np_random_state)
+        random.setstate(random_state)
+
+        multi_agent = ParallelMultiAgent([WalkingQLearning(), WalkingQLearning()], worker_n=1, seed=1)
+        multi_agent.learn([[0.0], [0.0]], limit=5)
+        self.assertEqual([np.random.random(), random.random()], expected_list)
+
+    def test_killed_worker(self):
+        multi_agent = ParallelMultiAgent(
+            [WalkingQLearning(), WalkingQLearning(crash_t=3)],
+            worker_n=2,
+            timeout=2.0
+        )
+        start = time.perf_counter()
+        with self.assertRaises(RuntimeError) as context:
+            multi_agent.learn([[0.0], [0.0]], limit=10)
+        self.assertIn("terminated", str(context.exception))
+        self.assertLess(time.perf_counter() - start, 30.0)
+
+
+if __name__ == "__main__":
+    unittest.main()